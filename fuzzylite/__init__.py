@@ -22,6 +22,7 @@ from math import inf, isinf, isnan, nan
 from fuzzylite.activation import *
 from fuzzylite.defuzzifier import *
 from fuzzylite.engine import *
+from fuzzylite.executor import *
 from fuzzylite.exporter import *
 from fuzzylite.factory import *
 from fuzzylite.hedge import *
@@ -29,8 +30,11 @@ from fuzzylite.importer import *
 from fuzzylite.library import *
 from fuzzylite.norm import *
 from fuzzylite.operation import *
+from fuzzylite.pool import *
 from fuzzylite.rule import *
+from fuzzylite.state import *
 from fuzzylite.term import *
+from fuzzylite.tracer import *
 from fuzzylite.variable import *
 
 lib: Library = Library()
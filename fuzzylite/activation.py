@@ -21,11 +21,15 @@ __all__ = ["Activation", "General", "First", "Last", "Highest", "Lowest", "Propo
 import enum
 import heapq
 import operator
+import typing
 from typing import Callable, List, Tuple, Union
 
 from .operation import Op
 from .rule import Rule, RuleBlock
 
+if typing.TYPE_CHECKING:
+    import numpy as np  # type: ignore # noqa: F401
+
 
 class Activation:
 
@@ -36,6 +40,13 @@ class Activation:
     def activate(self, rule_block: RuleBlock) -> None:
         raise NotImplementedError()
 
+    def activate_array(self, rule_block: RuleBlock) -> None:
+        """
+        Activates the rule block for a batch of values (see Engine::process_batch), leaving in
+        each rule the arrays of activation degrees and of the values where it was triggered.
+        """
+        raise NotImplementedError()
+
     def parameters(self) -> str:
         return ""
 
@@ -57,11 +68,21 @@ class General(Activation):
         disjunction = rule_block.disjunction
         implication = rule_block.implication
 
+        # the rules not activated are left deactivated (see RuleBlock::candidates)
+        for rule in rule_block.candidates():
+            rule.activate_with(conjunction, disjunction)
+            rule.trigger(implication)
+
+    def activate_array(self, rule_block: RuleBlock) -> None:
+        conjunction = rule_block.conjunction
+        disjunction = rule_block.disjunction
+        implication = rule_block.implication
+
         for rule in rule_block.rules:
             rule.deactivate()
             if rule.is_loaded():
-                rule.activate_with(conjunction, disjunction)
-                rule.trigger(implication)
+                rule.activate_with_array(conjunction, disjunction)
+                rule.trigger_array(implication)
 
 
 def _activate_positional(activation: Union['First', 'Last'], rule_block: RuleBlock) -> None:
@@ -89,6 +110,32 @@ def _activate_positional(activation: Union['First', 'Last'], rule_block: RuleBlo
                 activated += 1
 
 
+def _activate_positional_array(activation: Union['First', 'Last'], rule_block: RuleBlock) -> None:
+    conjunction = rule_block.conjunction
+    disjunction = rule_block.disjunction
+    implication = rule_block.implication
+
+    # number of rules activated so far for each value in the batch
+    activated: 'np.ndarray' = 0
+    if isinstance(activation, First):
+        rules = iter(rule_block.rules)
+    elif isinstance(activation, Last):
+        rules = reversed(rule_block.rules)
+    else:
+        raise ValueError()
+
+    for rule in rules:
+        rule.deactivate()
+
+        if rule.is_loaded():
+            activation_degree = rule.activate_with_array(conjunction, disjunction)
+            selected = ((activated < activation.rules)
+                        & Op.gt_array(activation_degree, 0.0)
+                        & (activation_degree >= activation.threshold))
+            rule.trigger_array(implication, selected)
+            activated = activated + selected
+
+
 class First(Activation):
 
     def __init__(self, rules: int = 1, threshold: float = 0.0) -> None:
@@ -108,6 +155,9 @@ class First(Activation):
     def activate(self, rule_block: RuleBlock) -> None:
         _activate_positional(self, rule_block)
 
+    def activate_array(self, rule_block: RuleBlock) -> None:
+        _activate_positional_array(self, rule_block)
+
 
 class Last(Activation):
 
@@ -128,6 +178,9 @@ class Last(Activation):
     def activate(self, rule_block: RuleBlock) -> None:
         _activate_positional(self, rule_block)
 
+    def activate_array(self, rule_block: RuleBlock) -> None:
+        _activate_positional_array(self, rule_block)
+
 
 def _activate_ranking(activation: Union['Highest', 'Lowest'], rule_block: RuleBlock) -> None:
     conjunction = rule_block.conjunction
@@ -157,6 +210,45 @@ def _activate_ranking(activation: Union['Highest', 'Lowest'], rule_block: RuleBl
         activated += 1
 
 
+def _activate_ranking_array(activation: Union['Highest', 'Lowest'], rule_block: RuleBlock) -> None:
+    import numpy as np  # type: ignore
+    conjunction = rule_block.conjunction
+    disjunction = rule_block.disjunction
+    implication = rule_block.implication
+
+    if isinstance(activation, Highest):
+        sign = -1
+    elif isinstance(activation, Lowest):
+        sign = 1
+    else:
+        raise ValueError()
+
+    rules: List[Rule] = []
+    activation_degrees: List['np.ndarray'] = []
+    for rule in rule_block.rules:
+        rule.deactivate()
+        if rule.is_loaded():
+            rules.append(rule)
+            activation_degrees.append(rule.activate_with_array(conjunction, disjunction))
+
+    if not rules:
+        return
+
+    # ranks the rules for each value in the batch like the heap does, that is, by their signed
+    # activation degrees and then by their index, leaving last the rules not activated.
+    degrees = np.array(np.broadcast_arrays(*activation_degrees), dtype=float)
+    positive = Op.gt_array(degrees, 0.0)
+    keys = np.where(positive, sign * degrees, np.inf)
+    order = np.argsort(keys, axis=0, kind='stable')
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(len(rules)).reshape(
+        (len(rules),) + (1,) * (order.ndim - 1)), axis=0)
+    selected = positive & (ranks < activation.rules)
+
+    for index, rule in enumerate(rules):
+        rule.trigger_array(implication, selected[index])
+
+
 class Highest(Activation):
 
     def __init__(self, rules: int = 1) -> None:
@@ -172,6 +264,9 @@ class Highest(Activation):
     def activate(self, rule_block: RuleBlock) -> None:
         _activate_ranking(self, rule_block)
 
+    def activate_array(self, rule_block: RuleBlock) -> None:
+        _activate_ranking_array(self, rule_block)
+
 
 class Lowest(Activation):
 
@@ -188,6 +283,9 @@ class Lowest(Activation):
     def activate(self, rule_block: RuleBlock) -> None:
         _activate_ranking(self, rule_block)
 
+    def activate_array(self, rule_block: RuleBlock) -> None:
+        _activate_ranking_array(self, rule_block)
+
 
 class Proportional(Activation):
 
@@ -198,18 +296,40 @@ class Proportional(Activation):
 
         activate: List[Rule] = []
         sum_degrees = 0.0
+        # the rules not activated are left deactivated (see RuleBlock::candidates)
+        for rule in rule_block.candidates():
+            activation_degree = rule.activate_with(conjunction, disjunction)
+            if Op.gt(activation_degree, 0.0):
+                activate.append(rule)
+                sum_degrees += activation_degree
+
+        for rule in activate:
+            rule.activation_degree /= sum_degrees
+            rule.trigger(implication)
+
+    def activate_array(self, rule_block: RuleBlock) -> None:
+        import numpy as np  # type: ignore
+        conjunction = rule_block.conjunction
+        disjunction = rule_block.disjunction
+        implication = rule_block.implication
+
+        activate: List[Tuple[Rule, 'np.ndarray']] = []
+        sum_degrees: 'np.ndarray' = 0.0
         for rule in rule_block.rules:
             rule.deactivate()
 
             if rule.is_loaded():
-                activation_degree = rule.activate_with(conjunction, disjunction)
-                if Op.gt(activation_degree, 0.0):
-                    activate.append(rule)
-                    sum_degrees += activation_degree
+                activation_degree = rule.activate_with_array(conjunction, disjunction)
+                selected = Op.gt_array(activation_degree, 0.0)
+                activate.append((rule, selected))
+                sum_degrees = sum_degrees + np.where(selected, activation_degree, 0.0)
 
-        for rule in activate:
-            rule.activation_degree /= sum_degrees
-            rule.trigger(implication)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for rule, selected in activate:
+                rule.activation_degree = np.where(selected,  # type: ignore
+                                                  rule.activation_degree / sum_degrees,
+                                                  rule.activation_degree)
+                rule.trigger_array(implication, selected)
 
 
 class Threshold(Activation):
@@ -256,9 +376,21 @@ class Threshold(Activation):
         disjunction = rule_block.disjunction
         implication = rule_block.implication
 
+        # the rules not activated are left deactivated (see RuleBlock::candidates), as the rules
+        # are triggered only if their activation degrees are greater than zero
+        for rule in rule_block.candidates():
+            activation_degree = rule.activate_with(conjunction, disjunction)
+            if self.comparator.operator(activation_degree, self.threshold):
+                rule.trigger(implication)
+
+    def activate_array(self, rule_block: RuleBlock) -> None:
+        conjunction = rule_block.conjunction
+        disjunction = rule_block.disjunction
+        implication = rule_block.implication
+
         for rule in rule_block.rules:
             rule.deactivate()
             if rule.is_loaded():
-                activation_degree = rule.activate_with(conjunction, disjunction)
-                if self.comparator.operator(activation_degree, self.threshold):
-                    rule.trigger(implication)
+                activation_degree = rule.activate_with_array(conjunction, disjunction)
+                rule.trigger_array(implication,
+                                   self.comparator.operator(activation_degree, self.threshold))
@@ -0,0 +1,334 @@
+"""
+ pyfuzzylite (TM), a fuzzy logic control library in Python.
+ Copyright (C) 2010-2017 FuzzyLite Limited. All rights reserved.
+ Author: Juan Rada-Vilela, Ph.D. <jcrada@fuzzylite.com>
+
+ This file is part of pyfuzzylite.
+
+ pyfuzzylite is free software: you can redistribute it and/or modify it under
+ the terms of the FuzzyLite License included with the software.
+
+ You should have received a copy of the FuzzyLite License along with
+ pyfuzzylite. If not, see <http://www.fuzzylite.com/license/>.
+
+ pyfuzzylite is a trademark of FuzzyLite Limited
+ fuzzylite is a registered trademark of FuzzyLite Limited.
+"""
+
+__all__ = ["Benchmark"]
+
+import argparse
+import enum
+import itertools
+import json
+import math
+import os
+import platform
+import time
+from math import isnan, nan
+from typing import Dict, IO, List, Optional, Sequence, Union
+
+from ..engine import Engine
+from ..importer import FllImporter
+
+
+class Benchmark:
+    """
+      The Benchmark class measures the performance of an engine processing rows of input
+      values, which are read from a file in the FuzzyLite Dataset format (FLD) or generated as
+      a grid over the ranges of the input variables. The engine is processed either one row
+      at a time (see Engine::process) or in batches of rows (see Engine::process_batch), and
+      the results include the throughput, the latency of each call, and the errors of the
+      output values against the expected output values in the dataset (if any).
+
+      @see Engine::process
+      @see Engine::process_batch
+
+      Attributes:
+          name is the name of the benchmark
+          engine is the engine to benchmark
+          inputs is the list of rows of input values, with a value per input variable
+          expected is the list of rows of expected output values, with a value per output
+          variable, or empty if the output values are not known
+          mode is whether the rows are processed one at a time or in batches
+          batch_size is the number of rows per batch (or None for all the rows)
+          tolerance is the absolute difference above which an output value is an error
+          outputs is the list of rows of output values obtained in the last run
+          runs is the number of times the rows were processed in the last run
+          times is the list of seconds spent in each call to process the engine
+    """
+
+    @enum.unique
+    class Mode(enum.Enum):
+        Scalar, Batch = range(2)
+
+    def __init__(self, name: str = "", engine: Optional[Engine] = None,
+                 mode: Union[str, 'Benchmark.Mode'] = "Scalar",
+                 batch_size: Optional[int] = None, tolerance: float = 1e-6) -> None:
+        if isinstance(mode, str):
+            mode = Benchmark.Mode[mode]
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f"expected a batch size greater than zero, but found {batch_size}")
+        self.name = name
+        self.engine = engine if engine else Engine()
+        self.mode = mode
+        self.batch_size = batch_size
+        self.tolerance = tolerance
+        self.inputs: List[List[float]] = []
+        self.expected: List[List[float]] = []
+        self.outputs: List[List[float]] = []
+        self.runs = 0
+        self.times: List[float] = []
+
+    @staticmethod
+    def from_file(path: str, mode: Union[str, 'Benchmark.Mode'] = "Scalar",
+                  batch_size: Optional[int] = None, tolerance: float = 1e-6) -> 'Benchmark':
+        """
+        Creates a benchmark of the engine in the FuzzyLite Language (FLL) file, without data
+        :param path: is the path to the engine in the FuzzyLite Language
+        :param mode: is whether the rows are processed one at a time or in batches
+        :param batch_size: is the number of rows per batch (or None for all the rows)
+        :param tolerance: is the absolute difference above which an output value is an error
+        :return: the benchmark named after the file
+        """
+        name = os.path.splitext(os.path.basename(path))[0]
+        return Benchmark(name, FllImporter().from_file(path), mode, batch_size, tolerance)
+
+    def prepare(self, reader: IO[str], rows: Optional[int] = None) -> None:
+        """
+        Prepares the benchmark with the rows of a dataset in the FuzzyLite Dataset format,
+        whose header names the input variables (and, optionally, the output variables) of the
+        engine. The rows are evenly spaced throughout the dataset when limited.
+        :param reader: is the reader of the dataset
+        :param rows: is the maximum number of rows to read, or None to read all of them
+        """
+        lines = (line.split() for line in reader)
+        header = next((line for line in lines if line and not line[0].startswith('#')), None)
+        if not header:
+            raise ValueError("expected a header in the dataset, but found none")
+        columns = {name: index for index, name in enumerate(header)}
+        missing = [variable.name for variable in self.engine.input_variables
+                   if variable.name not in columns]
+        if missing:
+            raise ValueError(f"expected the input variables {missing} in the header of the "
+                             f"dataset, but found {header}")
+        inputs = [columns[variable.name] for variable in self.engine.input_variables]
+        outputs = [columns[variable.name] for variable in self.engine.output_variables
+                   if variable.name in columns]
+        if len(outputs) != len(self.engine.output_variables):
+            outputs = []
+
+        data = [[float(value) for value in line] for line in lines
+                if line and not line[0].startswith('#')]
+        if rows is not None and len(data) > rows:
+            data = [data[int(i * len(data) / rows)] for i in range(rows)]
+        self.inputs = [[row[i] for i in inputs] for row in data]
+        self.expected = [[row[i] for i in outputs] for row in data] if outputs else []
+
+    def prepare_grid(self, values: int) -> None:
+        """
+        Prepares the benchmark with a grid of input values evenly spaced throughout the ranges
+        of the input variables, like FldExporter does for all the variables
+        :param values: is the approximate number of rows in the grid
+        """
+        resolution = max(1, int(pow(values, 1.0 / max(1, len(self.engine.input_variables)))))
+        samples = [[variable.minimum + i * variable.drange / resolution
+                    for i in range(resolution + 1)]
+                   for variable in self.engine.input_variables]
+        self.inputs = [list(row) for row in itertools.product(*samples)]
+        self.expected = []
+
+    def run(self, runs: int = 1) -> None:
+        """
+        Runs the benchmark, restarting the engine before each run, and keeping the outputs of
+        the last run and the times of all the runs
+        :param runs: is the number of times to process all the rows
+        """
+        self.runs = runs
+        self.times = []
+        for _ in range(runs):
+            self.engine.restart()
+            if self.mode == Benchmark.Mode.Batch:
+                self.outputs = self._run_batch()
+            else:
+                self.outputs = self._run_scalar()
+        self.engine.restart()
+
+    def _run_scalar(self) -> List[List[float]]:
+        input_variables = self.engine.input_variables
+        output_variables = self.engine.output_variables
+        process = self.engine.process
+        clock = time.perf_counter
+        outputs: List[List[float]] = []
+        for row in self.inputs:
+            start = clock()
+            for variable, value in zip(input_variables, row):
+                variable.value = value
+            process()
+            self.times.append(clock() - start)
+            outputs.append([variable.value for variable in output_variables])
+        return outputs
+
+    def _run_batch(self) -> List[List[float]]:
+        import numpy as np  # type: ignore
+        inputs = np.array(self.inputs, dtype=float).reshape(-1, len(self.engine.input_variables))
+        batch_size = self.batch_size if self.batch_size else max(1, len(inputs))
+        outputs: List[List[float]] = []
+        for start in range(0, len(inputs), batch_size):
+            batch = inputs[start:start + batch_size]
+            started = time.perf_counter()
+            result = self.engine.process_batch(batch)
+            self.times.append(time.perf_counter() - started)
+            outputs.extend(result.tolist())
+        return outputs
+
+    def can_compute_errors(self) -> bool:
+        """
+        Indicates whether the errors can be computed, that is, whether the expected output
+        values are known for the rows processed
+        """
+        return bool(self.expected) and len(self.expected) == len(self.outputs)
+
+    def errors(self) -> Dict[str, float]:
+        """
+        Computes the errors of the outputs of the last run against the expected outputs
+        :return: the number of output values whose absolute difference to the expected value
+        is greater than the tolerance (or only one of them is nan), and the maximum absolute
+        difference between the finite values
+        """
+        if not self.can_compute_errors():
+            raise ValueError("expected the output values of the dataset, but found none")
+        errors = 0
+        max_error = 0.0
+        for expected, obtained in zip(self.expected, self.outputs):
+            for a, b in zip(expected, obtained):
+                if isnan(a) or isnan(b):
+                    errors += isnan(a) != isnan(b)
+                elif a != b:
+                    difference = abs(a - b)
+                    errors += difference > self.tolerance
+                    if math.isfinite(difference):
+                        max_error = max(max_error, difference)
+        return {"errors": errors, "max_error": max_error}
+
+    def results(self) -> Dict[str, object]:
+        """
+        Gets the results of the last run
+        :return: the results of the benchmark, with the latencies in microseconds
+        """
+        times = sorted(self.times)
+        evaluations = len(self.inputs) * self.runs
+        seconds = sum(times)
+
+        def percentile(p: float) -> float:
+            if not times:
+                return nan
+            return 1e6 * times[min(len(times) - 1, int(math.ceil(p * len(times))) - 1)]
+
+        result: Dict[str, object] = {
+            "name": self.name,
+            "mode": self.mode.name,
+            "inputs": len(self.engine.input_variables),
+            "outputs": len(self.engine.output_variables),
+            "rules": sum(len(block.rules) for block in self.engine.rule_blocks),
+            "rows": len(self.inputs),
+            "batch_size": (self.batch_size or len(self.inputs)
+                           if self.mode == Benchmark.Mode.Batch else 1),
+            "runs": self.runs,
+            "calls": len(times),
+            "evaluations": evaluations,
+            "seconds": seconds,
+            "throughput": evaluations / seconds if seconds else nan,
+            "latency": {
+                "mean": 1e6 * seconds / len(times) if times else nan,
+                "p50": percentile(0.50),
+                "p99": percentile(0.99),
+            },
+            "tolerance": self.tolerance,
+        }
+        result.update(self.errors() if self.can_compute_errors()
+                      else {"errors": None, "max_error": None})
+        return result
+
+
+def main(arguments: Optional[Sequence[str]] = None) -> int:
+    """
+    Benchmarks the engines given in the command line, writing the results in JSON
+    :param arguments: is the list of arguments, or None to use those of the command line
+    :return: the exit code
+    """
+    from .. import lib
+
+    parser = argparse.ArgumentParser(
+        prog="python -m fuzzylite.benchmark",
+        description="Benchmarks the processing of engines in the FuzzyLite Language, using "
+                    "the datasets in the FuzzyLite Dataset format next to them (if any) or "
+                    "grids of input values, and writes the results in JSON. The examples of "
+                    "the source distribution are benchmarked with: python -m "
+                    "fuzzylite.benchmark examples/terms/*.fll")
+    parser.add_argument("engines", nargs="+",
+                        help="paths to the engines in the FuzzyLite Language")
+    parser.add_argument("--mode", choices=["Scalar", "Batch", "All"], default="All",
+                        help="whether to process the rows one at a time, in batches, or both")
+    parser.add_argument("--rows", type=int, default=1000,
+                        help="maximum number of rows of each dataset (default: 1000)")
+    parser.add_argument("--grid", type=int, default=None,
+                        help="approximate number of rows of the grids of input values, which "
+                             "are used instead of the datasets")
+    parser.add_argument("--runs", type=int, default=1,
+                        help="number of times to process the rows (default: 1)")
+    parser.add_argument("--batch-size", type=int, default=None,
+                        help="number of rows per batch (default: all the rows)")
+    parser.add_argument("--tolerance", type=float, default=1e-6,
+                        help="absolute difference above which an output value is an error "
+                             "(default: 1e-6)")
+    parser.add_argument("--output", default="-",
+                        help="path to the file to write the results (default: standard output)")
+    options = parser.parse_args(arguments)
+
+    paths = options.engines
+    modes = ["Scalar", "Batch"] if options.mode == "All" else [options.mode]
+
+    benchmarks: List[Dict[str, object]] = []
+    for path in paths:
+        for mode in modes:
+            benchmark = Benchmark.from_file(path, mode, options.batch_size, options.tolerance)
+            dataset = os.path.splitext(path)[0] + ".fld"
+            if options.grid is None and os.path.isfile(dataset):
+                with open(dataset) as reader:
+                    benchmark.prepare(reader, options.rows)
+            else:
+                benchmark.prepare_grid(options.grid if options.grid else options.rows)
+            benchmark.run(options.runs)
+            benchmarks.append(benchmark.results())
+
+    try:
+        import numpy  # type: ignore
+        numpy_version: Optional[str] = numpy.__version__
+    except ImportError:
+        numpy_version = None
+    results = {
+        "library": f"{lib.name} {lib.version}",
+        "python": platform.python_version(),
+        "numpy": numpy_version,
+        "platform": platform.platform(),
+        "benchmarks": benchmarks,
+    }
+    # nan and infinity are not valid in JSON, so they are written as null
+    text = json.dumps(_finite(results), indent=2)
+    if options.output == "-":
+        print(text)
+    else:
+        with open(options.output, "w") as writer:
+            writer.write(text + "\n")
+    return 0
+
+
+def _finite(value: object) -> object:
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    if isinstance(value, dict):
+        return {key: _finite(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_finite(item) for item in value]
+    return value
@@ -19,13 +19,21 @@ __all__ = ["Defuzzifier", "IntegralDefuzzifier", "Bisector", "Centroid", "Larges
            "MeanOfMaximum", "SmallestOfMaximum", "WeightedDefuzzifier", "WeightedAverage",
            "WeightedSum"]
 
+import bisect
 import enum
 import math
-from math import nan
-from typing import Optional, Union
+import typing
+from math import inf, nan
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
 
+from .norm import AlgebraicProduct, Maximum, Minimum, TNorm
 from .operation import Op
-from .term import Aggregated, Constant, Function, Linear, Term
+from .term import (Aggregated, Constant, Discrete, Function, Linear, Rectangle, Term, Trapezoid,
+                   Triangle)
+from .tracer import Tracer
+
+if typing.TYPE_CHECKING:
+    import numpy as np  # type: ignore # noqa: F401
 
 
 class Defuzzifier:
@@ -43,9 +51,38 @@ class Defuzzifier:
     def defuzzify(self, term: Term, minimum: float, maximum: float) -> float:
         raise NotImplementedError()
 
+    def defuzzify_array(self, term: Term, minimum: float, maximum: float) -> 'np.ndarray':
+        """
+        Defuzzifies the term for a batch of values, where the term is an Aggregated term whose
+        activated terms have arrays of activation degrees (see Engine::process_batch).
+        """
+        raise NotImplementedError()
+
 
 class IntegralDefuzzifier(Defuzzifier):
+    """
+      The IntegralDefuzzifier class is the base class for defuzzifiers which integrate over the
+      fuzzy set. When vectorized, the fuzzy set is sampled at once using numpy
+      (see Term::membership_array) instead of computing the membership function one value at a
+      time, which is faster for high resolutions. The vectorized membership functions may
+      differ from the scalar ones in the last digit (see Term::membership_array).
+
+      When exact, the Centroid and Bisector defuzzifiers integrate piecewise linear fuzzy sets
+      exactly from their breakpoints instead of sampling them, with a cost proportional to the
+      number of breakpoints rather than to the resolution. A fuzzy set is piecewise linear when
+      it is a Triangle, Trapezoid, Rectangle or Discrete term, or an Aggregated term whose
+      aggregation is Maximum and whose activated terms are any of the former with Minimum or
+      AlgebraicProduct as implication. Other fuzzy sets are sampled regardless. The exact
+      results differ from the sampled ones by the error of sampling the fuzzy set.
+
+      Attributes:
+          resolution is the number of samples to take from the fuzzy set
+          vectorized is whether to sample the fuzzy set at once using numpy
+          exact is whether to integrate piecewise linear fuzzy sets exactly
+    """
     default_resolution = 100
+    vectorized = False
+    exact = False
 
     def __init__(self, resolution: Optional[int] = None) -> None:
         self.resolution = resolution if resolution else IntegralDefuzzifier.default_resolution
@@ -63,6 +100,253 @@ class IntegralDefuzzifier(Defuzzifier):
     def defuzzify(self, term: Term, minimum: float, maximum: float) -> float:
         raise NotImplementedError()
 
+    def defuzzify_array(self, term: Term, minimum: float, maximum: float) -> 'np.ndarray':
+        raise NotImplementedError()
+
+    def samples(self, minimum: float, maximum: float) -> 'np.ndarray':
+        """
+        Returns the column of values at which the integral defuzzifiers evaluate the term, that
+        is, the midpoints of the resolution-many intervals in which the range is divided. The
+        values are in a column to be broadcast against the arrays of activation degrees.
+        """
+        import numpy as np  # type: ignore
+        dx = (maximum - minimum) / self.resolution
+        return minimum + (np.arange(self.resolution)[:, np.newaxis] + 0.5) * dx  # type: ignore
+
+    def sample_points(self, minimum: float, maximum: float) -> List[float]:
+        """
+        Returns the values at which the defuzzifier evaluates the term one value at a time,
+        computed exactly like the defuzzifier does, such that the membership function values
+        at these values can be computed beforehand (see OutputVariable::tabulated)
+        """
+        dx = (maximum - minimum) / self.resolution
+        return [minimum + (i + 0.5) * dx for i in range(0, self.resolution)]
+
+    def memberships(self, term: Term, minimum: float,
+                    maximum: float) -> Iterable[Tuple[float, float]]:
+        """
+        Returns the pairs of values and membership function values of the term at the
+        midpoints of the resolution-many intervals in which the range is divided, which are
+        computed at once when the defuzzifier is vectorized
+        """
+        if self.vectorized:
+            x = self.samples(minimum, maximum)
+            return zip(x.ravel().tolist(), self.membership_array(term, x).ravel().tolist())
+        dx = (maximum - minimum) / self.resolution
+        start, end = self.support(term)
+        return ((x, term.membership(x) if start <= x <= end else 0.0)
+                for x in (minimum + (i + 0.5) * dx for i in range(0, self.resolution)))
+
+    def support(self, term: Term) -> Tuple[float, float]:
+        """
+        Returns the support of the term (see Term::support), outside of which the samples are
+        zero without evaluating the membership function. The results are the same as
+        evaluating every sample, but the samples of the narrow fuzzy sets of wide ranges are
+        mostly skipped. While tracing (see Tracer), the support is the real line to trace
+        every sample.
+        """
+        if Tracer.active:
+            return -inf, inf
+        return term.support()
+
+    def membership_array(self, term: Term, x: 'np.ndarray') -> 'np.ndarray':
+        """
+        Computes the membership function of the term for the column of samples, evaluating
+        only the samples within the support of the term (see IntegralDefuzzifier::support)
+        """
+        import numpy as np  # type: ignore
+        start, end = self.support(term)
+        inside = ((start <= x) & (x <= end)).ravel()
+        if inside.all():
+            return term.membership_array(x)
+        y = term.membership_array(x[inside])
+        result = np.zeros((len(x),) + np.shape(y)[1:])
+        result[inside] = y
+        return result
+
+    @staticmethod
+    def polyline(term: Term) -> Optional[Tuple[Sequence[float], Sequence[float], float]]:
+        """
+        Returns the vertices of the membership function of the term when it is piecewise
+        linear, that is, the values of x in ascending order (repeated where the function is
+        discontinuous), the values of y to be scaled by the height of the term, and the height.
+        The membership function is constant before the first vertex and after the last one.
+        :return: the values of x, the values of y and the height of the term, or None if the
+        term is not piecewise linear with finite and non-negative vertices
+        """
+        if isinstance(term, Discrete):
+            # the points of Discrete terms are sorted
+            xs, ys = term._x, term._y
+            if not (xs and math.isfinite(xs[0]) and math.isfinite(xs[-1]) and min(ys) >= 0.0):
+                return None
+            return xs, ys, term.height
+
+        if isinstance(term, Triangle):
+            vertices = [(term.vertex_a, 0.0), (term.vertex_b, 1.0), (term.vertex_c, 0.0)]
+        elif isinstance(term, Trapezoid):
+            vertices = [(term.vertex_a, 0.0), (term.vertex_b, 1.0),
+                        (term.vertex_c, 1.0), (term.vertex_d, 0.0)]
+        elif isinstance(term, Rectangle):
+            vertices = [(term.start, 0.0), (term.start, 1.0), (term.end, 1.0), (term.end, 0.0)]
+        else:
+            return None
+        # infinite vertices extend the membership function as a constant
+        xs = [x for x, _ in vertices if not math.isinf(x)]
+        ys = [y for x, y in vertices if not math.isinf(x)]
+        if not (xs and all(xs[i] <= xs[i + 1] for i in range(len(xs) - 1))
+                and term.height >= 0.0):
+            return None
+        return xs, ys, term.height
+
+    def linear_segments(self, term: Term, minimum: float, maximum: float) -> Optional[
+            List[Tuple[float, float, List[Tuple[float, float, float, Optional[TNorm]]]]]]:
+        """
+        Divides the range into the segments in which the terms of a piecewise linear fuzzy set
+        are linear (see IntegralDefuzzifier::polyline)
+        :return: the list of segments (u, v, lines), where lines contains the values of the
+        membership function of each term that is not zero in the segment at u and v (as limits
+        from inside the segment), and its activation degree and implication operator (or 1.0
+        and None if the term is not activated), or None if the fuzzy set is not piecewise linear
+        """
+        components: List[Tuple[Tuple[Sequence[float], Sequence[float], float],
+                               float, Optional[TNorm]]] = []
+        if isinstance(term, Aggregated):
+            if term.terms and not isinstance(term.aggregation, Maximum):
+                return None
+            for activated in term.terms:
+                if not isinstance(activated.implication, (Minimum, AlgebraicProduct)):
+                    return None
+                polyline = IntegralDefuzzifier.polyline(activated.term)
+                if polyline is None:
+                    return None
+                components.append((polyline, activated.degree, activated.implication))
+        else:
+            polyline = IntegralDefuzzifier.polyline(term)
+            if polyline is None:
+                return None
+            components.append((polyline, 1.0, None))
+
+        breakpoints = {minimum, maximum}
+        for (xs, _, _), _, _ in components:
+            breakpoints.update(x for x in xs if minimum < x < maximum)
+        bounds = sorted(breakpoints)
+
+        result = []
+        for u, v in zip(bounds, bounds[1:]):
+            lines = []
+            for (xs, ys, height), degree, implication in components:
+                # the vertices before and after the segment, which contains no vertices
+                i = bisect.bisect_right(xs, u)
+                if i == 0:
+                    y_u = y_v = height * ys[0]
+                elif i == len(xs):
+                    y_u = y_v = height * ys[-1]
+                else:
+                    x0, y0, x1, y1 = xs[i - 1], ys[i - 1], xs[i], ys[i]
+                    y_u = height * (y0 + (y1 - y0) * (u - x0) / (x1 - x0))
+                    y_v = height * (y0 + (y1 - y0) * (v - x0) / (x1 - x0))
+                if y_u or y_v:
+                    lines.append((y_u, y_v, degree, implication))
+            result.append((u, v, lines))
+        return result
+
+    @staticmethod
+    def _breakpoints(lines: List[Tuple[float, float, float, Optional[TNorm]]]) -> List[float]:
+        """
+        Returns the relative positions in [0, 1] within a segment at which the membership
+        function of the fuzzy set changes slope, which are the crossings between the linear
+        functions and activation degrees that the implication and aggregation choose from.
+        """
+        functions = [(0.0, 0.0)]
+        for y_u, y_v, degree, implication in lines:
+            if isinstance(implication, Minimum):
+                functions.extend([(y_u, y_v), (degree, degree)])
+            elif isinstance(implication, AlgebraicProduct):
+                functions.append((degree * y_u, degree * y_v))
+            else:
+                functions.append((y_u, y_v))
+        result = [0.0, 1.0]
+        for i, (a_u, a_v) in enumerate(functions):
+            for b_u, b_v in functions[i + 1:]:
+                d_u, d_v = a_u - b_u, a_v - b_v
+                if (d_u < 0.0 < d_v) or (d_v < 0.0 < d_u):
+                    result.append(d_u / (d_u - d_v))
+        result.sort()
+        return result
+
+    def exact_polyline(self, term: Term, minimum: float, maximum: float) -> Optional[
+            Tuple[List[float], List[float]]]:
+        """
+        Computes the vertices of the membership function of a piecewise linear fuzzy set
+        within the range, such that the function is linear between consecutive vertices
+        :return: the values of x and y of the vertices, or None if the fuzzy set is not
+        piecewise linear (see IntegralDefuzzifier::linear_segments)
+        """
+        segments = self.linear_segments(term, minimum, maximum)
+        if segments is None:
+            return None
+        xs: List[float] = []
+        ys: List[float] = []
+        for u, v, lines in segments:
+            for t in IntegralDefuzzifier._breakpoints(lines):
+                y = 0.0
+                for y_u, y_v, degree, implication in lines:
+                    line = (1.0 - t) * y_u + t * y_v
+                    if isinstance(implication, Minimum):
+                        line = min(line, degree)
+                    elif isinstance(implication, AlgebraicProduct):
+                        line = line * degree
+                    y = max(y, line)
+                xs.append((1.0 - t) * u + t * v)
+                ys.append(y)
+        return xs, ys
+
+    def exact_polyline_array(self, term: Term, minimum: float, maximum: float) -> Optional[
+            Tuple['np.ndarray', 'np.ndarray']]:
+        """
+        Computes the vertices of the membership function of a piecewise linear fuzzy set
+        within the range for a batch of activation degrees (see
+        IntegralDefuzzifier::exact_polyline), where the vertices are in the rows and the
+        batch in the columns. Vertices repeat where fewer are needed for part of the batch.
+        :return: the values of x and y of the vertices, or None if the fuzzy set is not
+        piecewise linear (see IntegralDefuzzifier::linear_segments)
+        """
+        import numpy as np  # type: ignore
+        segments = self.linear_segments(term, minimum, maximum)
+        if segments is None:
+            return None
+        shape = np.broadcast_shapes((1,), *[np.shape(degree) for _, _, lines in segments
+                                            for _, _, degree, _ in lines])
+        xs: List['np.ndarray'] = []
+        ys: List['np.ndarray'] = []
+        for u, v, lines in segments:
+            functions = [(0.0, 0.0)]
+            for y_u, y_v, degree, implication in lines:
+                if isinstance(implication, Minimum):
+                    functions.extend([(y_u, y_v), (degree, degree)])
+                elif isinstance(implication, AlgebraicProduct):
+                    functions.append((degree * y_u, degree * y_v))
+                else:
+                    functions.append((y_u, y_v))
+            ts = [np.zeros(shape), np.ones(shape)]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                for i, (a_u, a_v) in enumerate(functions):
+                    for b_u, b_v in functions[i + 1:]:
+                        d_u, d_v = np.subtract(a_u, b_u), np.subtract(a_v, b_v)
+                        ts.append(np.where(d_u * d_v < 0.0, d_u / (d_u - d_v), 0.0))
+            t = np.sort(np.stack(np.broadcast_arrays(*ts)), axis=0)
+            y = np.zeros(t.shape)
+            for y_u, y_v, degree, implication in lines:
+                line = (1.0 - t) * y_u + t * y_v
+                if isinstance(implication, Minimum):
+                    line = np.minimum(line, degree)
+                elif isinstance(implication, AlgebraicProduct):
+                    line = line * degree
+                y = np.maximum(y, line)
+            xs.append((1.0 - t) * u + t * v)
+            ys.append(y)
+        return np.concatenate(xs), np.concatenate(ys)
+
 
 class Bisector(IntegralDefuzzifier):
 
@@ -72,28 +356,115 @@ class Bisector(IntegralDefuzzifier):
     def defuzzify(self, term: Term, minimum: float, maximum: float) -> float:
         if not math.isfinite(minimum + maximum):
             return nan
+        if self.exact:
+            polyline = self.exact_polyline(term, minimum, maximum)
+            if polyline is not None:
+                return self._exact_bisector(*polyline)
+        if self.vectorized:
+            return float(self.defuzzify_array(term, minimum, maximum)[0])
         resolution = self.resolution
         dx = (maximum - minimum) / resolution
         counter = resolution
         left = right = 0
         x_left, x_right = (minimum, maximum)
         left_area = right_area = 0.0
+        start, end = self.support(term)
 
         # TODO: Improve?
         while counter > 0:
             counter = counter - 1
             if left_area <= right_area:
                 x_left = minimum + (left + 0.5) * dx
-                left_area += term.membership(x_left)
+                if start <= x_left <= end:
+                    left_area += term.membership(x_left)
                 left += 1
             else:
                 x_right = maximum - (right + 0.5) * dx
-                right_area += term.membership(x_right)
+                if start <= x_right <= end:
+                    right_area += term.membership(x_right)
                 right += 1
 
         # Inverse weighted average to compensate
         return (left_area * x_right + right_area * x_left) / (left_area + right_area)
 
+    def sample_points(self, minimum: float, maximum: float) -> List[float]:
+        """
+        Returns the values at which the defuzzifier evaluates the term one value at a time,
+        which are taken from the left and from the right of the range
+        """
+        dx = (maximum - minimum) / self.resolution
+        return super().sample_points(minimum, maximum) + [
+            maximum - (i + 0.5) * dx for i in range(0, self.resolution)]
+
+    @staticmethod
+    def _exact_bisector(xs: List[float], ys: List[float]) -> float:
+        """
+        Computes the value of x that divides the area under the piecewise linear function in
+        two halves, or nan if the area is zero
+        """
+        areas = [0.0]
+        for i in range(len(xs) - 1):
+            areas.append(areas[-1] + 0.5 * (xs[i + 1] - xs[i]) * (ys[i] + ys[i + 1]))
+        half = 0.5 * areas[-1]
+        if not half > 0.0:
+            return nan
+        i = 0
+        while areas[i + 1] < half:
+            i += 1
+        # solves y0 * t + slope * t^2 / 2 = remaining area for the distance t from x0
+        remaining = half - areas[i]
+        if remaining <= 0.0:
+            return xs[i]
+        dx = xs[i + 1] - xs[i]
+        slope = (ys[i + 1] - ys[i]) / dx
+        t = 2.0 * remaining / (ys[i] + math.sqrt(max(0.0, ys[i] ** 2 + 2.0 * slope * remaining)))
+        return xs[i] + min(t, dx)
+
+    def defuzzify_array(self, term: Term, minimum: float, maximum: float) -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        if not math.isfinite(minimum + maximum):
+            return np.asarray(nan)
+        if self.exact:
+            polyline = self.exact_polyline_array(term, minimum, maximum)
+            if polyline is not None:
+                x, y = polyline
+                areas = np.concatenate((np.zeros((1,) + x.shape[1:]), np.cumsum(
+                    0.5 * np.diff(x, axis=0) * (y[:-1] + y[1:]), axis=0)))
+                half = 0.5 * areas[-1]
+                # the first segment whose cumulative area reaches half of the total area
+                i = np.minimum(np.argmax(areas[1:] >= half, axis=0), len(x) - 2)[np.newaxis]
+                x0, x1 = np.take_along_axis(x, i, 0)[0], np.take_along_axis(x, i + 1, 0)[0]
+                y0, y1 = np.take_along_axis(y, i, 0)[0], np.take_along_axis(y, i + 1, 0)[0]
+                remaining = np.maximum(half - np.take_along_axis(areas, i, 0)[0], 0.0)
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    slope = np.where(x1 > x0, (y1 - y0) / (x1 - x0), 0.0)
+                    t = np.where(remaining > 0.0, 2.0 * remaining / (y0 + np.sqrt(np.maximum(
+                        0.0, y0 ** 2 + 2.0 * slope * remaining))), 0.0)
+                return np.where(half > 0.0, x0 + np.minimum(t, x1 - x0), nan)  # type: ignore
+        resolution = self.resolution
+        dx = (maximum - minimum) / resolution
+        # the left and right areas accumulate the samples from each end exactly like the loop
+        # in Bisector::defuzzify, which takes the next sample from the left while the left area
+        # is not greater than the right area. Thus, the number of samples taken from the left
+        # is the first number whose area is greater than the area of the remaining samples.
+        samples = np.arange(resolution)[:, np.newaxis] + 0.5
+        y_left = self.membership_array(term, minimum + samples * dx)
+        y_right = self.membership_array(term, maximum - samples * dx)
+        zeros = np.zeros((1,) + y_left.shape[1:])
+        left_areas = np.concatenate((zeros, np.cumsum(y_left, axis=0)))
+        right_areas = np.concatenate((zeros, np.cumsum(y_right, axis=0)))
+        exceeds = left_areas[:resolution] > right_areas[resolution - 1::-1]
+        left = np.where(exceeds.any(axis=0), exceeds.argmax(axis=0), resolution)
+        right = resolution - left
+
+        left_area = np.take_along_axis(left_areas, left[np.newaxis], axis=0)[0]
+        right_area = np.take_along_axis(right_areas, right[np.newaxis], axis=0)[0]
+        x_left = np.where(left > 0, minimum + (left - 1 + 0.5) * dx, minimum)
+        x_right = np.where(right > 0, maximum - (right - 1 + 0.5) * dx, maximum)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return (left_area * x_right + right_area * x_left) / (left_area + right_area)
+
 
 class Centroid(IntegralDefuzzifier):
 
@@ -103,16 +474,53 @@ class Centroid(IntegralDefuzzifier):
     def defuzzify(self, term: Term, minimum: float, maximum: float) -> float:
         if not math.isfinite(minimum + maximum):
             return nan
+        if self.exact:
+            polyline = self.exact_polyline(term, minimum, maximum)
+            if polyline is not None:
+                xs, ys = polyline
+                area = x_centroid = 0.0
+                for i in range(len(xs) - 1):
+                    x0, x1, y0, y1 = xs[i], xs[i + 1], ys[i], ys[i + 1]
+                    # integrals of y and x*y over the segment where y is linear
+                    area += 0.5 * (x1 - x0) * (y0 + y1)
+                    x_centroid += (x1 - x0) * (x0 * (2.0 * y0 + y1) + x1 * (y0 + 2.0 * y1)) / 6.0
+                return x_centroid / area
+        if self.vectorized:
+            return float(self.defuzzify_array(term, minimum, maximum)[0])
         resolution = self.resolution
         dx = (maximum - minimum) / resolution
         area = x_centroid = 0.0
+        start, end = self.support(term)
         for i in range(0, resolution):
             x = minimum + (i + 0.5) * dx
-            y = term.membership(x)
-            x_centroid += y * x
-            area += y
+            if start <= x <= end:
+                y = term.membership(x)
+                x_centroid += y * x
+                area += y
         return x_centroid / area
 
+    def defuzzify_array(self, term: Term, minimum: float, maximum: float) -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        if not math.isfinite(minimum + maximum):
+            return np.asarray(nan)
+        if self.exact:
+            polyline = self.exact_polyline_array(term, minimum, maximum)
+            if polyline is not None:
+                x, y = polyline
+                x0, x1, y0, y1 = x[:-1], x[1:], y[:-1], y[1:]
+                area = np.sum(0.5 * (x1 - x0) * (y0 + y1), axis=0)
+                x_centroid = np.sum((x1 - x0) * (x0 * (2.0 * y0 + y1) + x1 * (y0 + 2.0 * y1))
+                                    / 6.0, axis=0)
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    return x_centroid / area  # type: ignore
+        x = self.samples(minimum, maximum)
+        y = self.membership_array(term, x)
+        # cumulative sums preserve the order of the summations in Centroid::defuzzify
+        x_centroid = np.cumsum(y * x, axis=0)[-1]
+        area = np.cumsum(y, axis=0)[-1]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return x_centroid / area  # type: ignore
+
 
 class LargestOfMaximum(IntegralDefuzzifier):
 
@@ -122,18 +530,28 @@ class LargestOfMaximum(IntegralDefuzzifier):
     def defuzzify(self, term: Term, minimum: float, maximum: float) -> float:
         if not math.isfinite(minimum + maximum):
             return nan
-        resolution = self.resolution
-        dx = (maximum - minimum) / resolution
         y_max = -math.inf
         x_largest = maximum
-        for i in range(0, resolution):
-            x = minimum + (i + 0.5) * dx
-            y = term.membership(x)
+        for x, y in self.memberships(term, minimum, maximum):
             if Op.ge(y, y_max):
                 y_max = y
                 x_largest = x
         return x_largest
 
+    def defuzzify_array(self, term: Term, minimum: float, maximum: float) -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        if not math.isfinite(minimum + maximum):
+            return np.asarray(nan)
+        x = self.samples(minimum, maximum)
+        y = self.membership_array(term, x)
+        y_max = np.full(y.shape[1:], -math.inf)
+        x_largest = np.full(y.shape[1:], maximum)
+        for i in range(0, self.resolution):
+            update = Op.ge_array(y[i], y_max)
+            y_max = np.where(update, y[i], y_max)
+            x_largest = np.where(update, x[i, 0], x_largest)
+        return x_largest  # type: ignore
+
 
 class MeanOfMaximum(IntegralDefuzzifier):
 
@@ -143,15 +561,11 @@ class MeanOfMaximum(IntegralDefuzzifier):
     def defuzzify(self, term: Term, minimum: float, maximum: float) -> float:
         if not math.isfinite(minimum + maximum):
             return nan
-        resolution = self.resolution
-        dx = (maximum - minimum) / resolution
         y_max = -math.inf
         x_smallest = minimum
         x_largest = maximum
         find_x_largest = False
-        for i in range(0, resolution):
-            x = minimum + (i + 0.5) * dx
-            y = term.membership(x)
+        for x, y in self.memberships(term, minimum, maximum):
             if Op.gt(y, y_max):
                 y_max = y
                 x_smallest = x
@@ -163,6 +577,26 @@ class MeanOfMaximum(IntegralDefuzzifier):
                 find_x_largest = False
         return (x_largest + x_smallest) / 2.0
 
+    def defuzzify_array(self, term: Term, minimum: float, maximum: float) -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        if not math.isfinite(minimum + maximum):
+            return np.asarray(nan)
+        x = self.samples(minimum, maximum)
+        y = self.membership_array(term, x)
+        y_max = np.full(y.shape[1:], -math.inf)
+        x_smallest = np.full(y.shape[1:], minimum)
+        x_largest = np.full(y.shape[1:], maximum)
+        find_x_largest = np.full(y.shape[1:], False)
+        for i in range(0, self.resolution):
+            greater = Op.gt_array(y[i], y_max)
+            equal = ~greater & find_x_largest & Op.eq_array(y[i], y_max)
+            lower = ~greater & ~equal & Op.lt_array(y[i], y_max)
+            y_max = np.where(greater, y[i], y_max)
+            x_smallest = np.where(greater, x[i, 0], x_smallest)
+            x_largest = np.where(greater | equal, x[i, 0], x_largest)
+            find_x_largest = (find_x_largest | greater) & ~lower
+        return (x_largest + x_smallest) / 2.0  # type: ignore
+
 
 class SmallestOfMaximum(IntegralDefuzzifier):
 
@@ -172,18 +606,28 @@ class SmallestOfMaximum(IntegralDefuzzifier):
     def defuzzify(self, term: Term, minimum: float, maximum: float) -> float:
         if not math.isfinite(minimum + maximum):
             return nan
-        resolution = self.resolution
-        dx = (maximum - minimum) / resolution
         y_max = -math.inf
         x_smallest = minimum
-        for i in range(0, resolution):
-            x = minimum + (i + 0.5) * dx
-            y = term.membership(x)
+        for x, y in self.memberships(term, minimum, maximum):
             if Op.gt(y, y_max):
                 y_max = y
                 x_smallest = x
         return x_smallest
 
+    def defuzzify_array(self, term: Term, minimum: float, maximum: float) -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        if not math.isfinite(minimum + maximum):
+            return np.asarray(nan)
+        x = self.samples(minimum, maximum)
+        y = self.membership_array(term, x)
+        y_max = np.full(y.shape[1:], -math.inf)
+        x_smallest = np.full(y.shape[1:], minimum)
+        for i in range(0, self.resolution):
+            update = Op.gt_array(y[i], y_max)
+            y_max = np.where(update, y[i], y_max)
+            x_smallest = np.where(update, x[i, 0], x_smallest)
+        return x_smallest  # type: ignore
+
 
 class WeightedDefuzzifier(Defuzzifier):
     @enum.unique
@@ -210,6 +654,26 @@ class WeightedDefuzzifier(Defuzzifier):
     def defuzzify(self, term: Term, minimum: float, maximum: float) -> float:
         raise NotImplementedError()
 
+    def defuzzify_array(self, term: Term, minimum: float, maximum: float) -> 'np.ndarray':
+        raise NotImplementedError()
+
+    def _weighted_values(self, fuzzy_output: Aggregated, this_type: 'WeightedDefuzzifier.Type',
+                         activation_degree: 'np.ndarray', term: Term) -> 'np.ndarray':
+        """
+        Computes the values of the activated term weighted by the array of activation degrees,
+        where the values of the term are discarded for activation degrees that are zero. The
+        term is evaluated for every activation degree because the values of its membership
+        function may depend on the arrays of values of the variables in the engine.
+        """
+        import numpy as np  # type: ignore
+        w = np.atleast_1d(activation_degree)
+        with np.errstate(all='ignore'):
+            if this_type == WeightedDefuzzifier.Type.TakagiSugeno:
+                z = term.membership_array(w)
+            else:
+                z = term.tsukamoto_array(w, fuzzy_output.minimum, fuzzy_output.maximum)
+            return np.where(w != 0.0, w * z, 0.0)  # type: ignore
+
     def infer_type(self, term: Term) -> 'WeightedDefuzzifier.Type':
         if isinstance(term, (Constant, Linear, Function)):
             return WeightedDefuzzifier.Type.TakagiSugeno
@@ -253,6 +717,31 @@ class WeightedAverage(WeightedDefuzzifier):
 
         return weighted_sum / weights
 
+    def defuzzify_array(self, fuzzy_output: Term,
+                        unused_minimum: float = nan, unused_maximum: float = nan) -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        if not isinstance(fuzzy_output, Aggregated):
+            raise ValueError(f"expected an Aggregated term, but found {type(fuzzy_output)}")
+
+        if not self.type:
+            raise ValueError("expected a type of defuzzifier, but found none")
+
+        if not fuzzy_output.terms:
+            return np.asarray(nan)
+
+        this_type = self.type
+        if self.type == WeightedDefuzzifier.Type.Automatic:
+            this_type = self.infer_type(fuzzy_output.terms[0])
+
+        weighted_sum = weights = np.asarray(0.0)
+        for activated in fuzzy_output.terms:
+            weighted_sum = weighted_sum + self._weighted_values(
+                fuzzy_output, this_type, activated.degree, activated.term)
+            weights = weights + activated.degree
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return weighted_sum / weights
+
 
 class WeightedSum(WeightedDefuzzifier):
 
@@ -288,3 +777,26 @@ class WeightedSum(WeightedDefuzzifier):
                 weighted_sum += w * z
 
         return weighted_sum
+
+    def defuzzify_array(self, fuzzy_output: Term,
+                        unused_minimum: float = nan, unused_maximum: float = nan) -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        if not isinstance(fuzzy_output, Aggregated):
+            raise ValueError(f"expected an Aggregated term, but found {type(fuzzy_output)}")
+
+        if not self.type:
+            raise ValueError("expected a type of defuzzifier, but found none")
+
+        if not fuzzy_output.terms:
+            return np.asarray(nan)
+
+        this_type = self.type
+        if self.type == WeightedDefuzzifier.Type.Automatic:
+            this_type = self.infer_type(fuzzy_output.terms[0])
+
+        weighted_sum = np.asarray(0.0)
+        for activated in fuzzy_output.terms:
+            weighted_sum = weighted_sum + self._weighted_values(
+                fuzzy_output, this_type, activated.degree, activated.term)
+
+        return weighted_sum  # type: ignore
@@ -17,17 +17,23 @@
 
 __all__ = ["Engine"]
 
+import copy
 import enum
+import typing
 from math import nan
-from typing import Iterable, List, Optional, Tuple, Union
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 from .activation import Activation
 from .defuzzifier import Defuzzifier
 from .exporter import FllExporter
 from .norm import SNorm, TNorm
 from .rule import RuleBlock
+from .state import State
 from .variable import InputVariable, OutputVariable, Variable
 
+if typing.TYPE_CHECKING:
+    import numpy as np  # type: ignore # noqa: F401
+
 
 class Engine:
     @enum.unique
@@ -86,6 +92,79 @@ class Engine:
             variable.aggregation = aggregation
             variable.defuzzifier = defuzzifier
 
+    def approximate(self, error: Optional[float]) -> None:
+        """
+        Approximates the membership functions of the terms of the input variables within the
+        maximum absolute error (see InputVariable::approximate). The terms of the output
+        variables are not approximated, as the integral defuzzifiers compute their membership
+        functions only once (see OutputVariable::table).
+        :param error: is the maximum absolute error, or None to remove the approximations
+        """
+        for variable in self.input_variables:
+            variable.approximate(error)
+
+    def clone(self) -> 'Engine':
+        """
+        Creates a copy of the engine to be processed independently of this engine. The copy is
+        created faster than copying the engine (e.g., with copy.deepcopy or exporting and
+        importing it), because it shares with this engine the components that are not modified
+        when processing the engine (e.g., the terms, hedges, operators, defuzzifiers, and
+        activation methods), and the rules are copied without parsing them again (see
+        Rule::clone). Only the terms that refer to the engine (e.g., Linear and Function terms)
+        are copied, sharing their parsed formulas. The values of the variables and the
+        activation degrees of the rules are copied too. As the components are shared, changing
+        the configuration of a component (e.g., the parameters of a term) affects both engines.
+        :return: the copy of the engine
+        """
+        from .term import Activated, Term
+
+        result = Engine(self.name, self.description)
+        references: Dict[object, object] = {}
+
+        def terms(variable: Variable) -> List[Term]:
+            result_terms = []
+            for term in variable.terms:
+                if type(term).update_reference is not Term.update_reference:
+                    reference = copy.copy(term)
+                    reference.update_reference(result)
+                    references[term] = reference
+                    term = reference
+                result_terms.append(term)
+            return result_terms
+
+        for input_variable in self.input_variables:
+            input_clone = InputVariable(input_variable.name, input_variable.description,
+                                        input_variable.enabled, input_variable.minimum,
+                                        input_variable.maximum, input_variable.lock_range,
+                                        terms(input_variable))
+            input_clone.value = input_variable.value
+            # the approximated terms are shared, as they do not refer to the engine
+            input_clone.lookup = input_variable.lookup
+            references[input_variable] = input_clone
+            result.input_variables.append(input_clone)
+
+        for output_variable in self.output_variables:
+            output_clone = OutputVariable(output_variable.name, output_variable.description,
+                                          output_variable.enabled, output_variable.minimum,
+                                          output_variable.maximum, output_variable.lock_range,
+                                          output_variable.lock_previous,
+                                          output_variable.default_value,
+                                          output_variable.aggregation,
+                                          output_variable.defuzzifier, terms(output_variable))
+            output_clone.value = output_variable.value
+            output_clone.previous_value = output_variable.previous_value
+            references[output_variable] = output_clone
+            result.output_variables.append(output_clone)
+
+        for output_variable, output_clone in zip(self.output_variables, result.output_variables):
+            output_clone.fuzzy.terms.extend(
+                Activated(typing.cast(Term, references.get(activated.term, activated.term)),
+                          activated.degree, activated.implication)
+                for activated in output_variable.fuzzy.terms)
+
+        result.rule_blocks.extend(block.clone(references) for block in self.rule_blocks)
+        return result
+
     @property
     def variables(self) -> List[Variable]:
         return [*self.input_variables, *self.output_variables]
@@ -133,10 +212,17 @@ class Engine:
         if lib.debugging:
             pass
 
-        # Activate rule blocks
-        for block in self.rule_blocks:
-            if block.enabled:
-                block.activate()
+        # Activate rule blocks, computing the membership function values of the input terms
+        # once for all the rules
+        for variable in self.input_variables:
+            variable.fuzzification = variable.fuzzification_table()
+        try:
+            for block in self.rule_blocks:
+                if block.enabled:
+                    block.activate()
+        finally:
+            for variable in self.input_variables:
+                variable.fuzzification = None
 
         if lib.debugging:
             pass
@@ -148,6 +234,84 @@ class Engine:
         if lib.debugging:
             pass
 
+    def evaluate(self, inputs: Sequence[float], state: Optional[State] = None) -> List[float]:
+        """
+        Processes the engine for the input values in the given state instead of in the state
+        of the engine, which is left unchanged. Thus, a loaded engine can be evaluated by many
+        threads (or asyncio tasks) at once, each with its own state, as long as the engine is
+        not modified meanwhile. The state keeps the values of the evaluation, such that the
+        previous values of the output variables (see OutputVariable::lock_previous) are kept
+        between the evaluations in the same state.
+        :param inputs: is the value of each input variable
+        :param state: is the state of the evaluation, or None to evaluate in a new state
+        :return: the value of each output variable
+        """
+        if len(inputs) != len(self.input_variables):
+            raise ValueError(f"expected {len(self.input_variables)} input values, "
+                             f"but found {len(inputs)}: {inputs}")
+        if state is None:
+            state = State()
+        with state.bind():
+            for variable, value in zip(self.input_variables, inputs):
+                variable.value = value
+            self.process()
+            return [variable.value for variable in self.output_variables]
+
+    def process_batch(self, inputs: 'np.ndarray') -> 'np.ndarray':
+        """
+        Processes a batch of inputs at once, operating on arrays of values instead of
+        processing the inputs one row at a time. The state of the engine (e.g., the values of
+        the variables and the activation degrees of the rules) is left unchanged, as the batch
+        is processed in a new state (see State), and the outputs are computed as if the rows
+        were processed one after the other, except that the terms referring to the values of
+        the output variables (e.g., Function terms) see the values of the output variables
+        before processing the batch.
+        :param inputs: is the 2-D array of inputs, with one row per evaluation and one column
+        per input variable
+        :return: the 2-D array of outputs, with one row per evaluation and one column per output
+        variable
+        """
+        import numpy as np  # type: ignore
+
+        inputs = np.asarray(inputs, dtype=float)
+        if inputs.ndim != 2 or inputs.shape[1] != len(self.input_variables):
+            raise ValueError(f"expected a 2-D array of inputs with {len(self.input_variables)} "
+                             f"columns, but found an array of shape {inputs.shape}")
+
+        rows = inputs.shape[0]
+        # the batch is processed in a new state, leaving the state of the engine unchanged
+        state = State()
+        for output_variable in self.output_variables:
+            state.values[output_variable] = output_variable.value
+            state.previous_values[output_variable] = output_variable.previous_value
+        for i, input_variable in enumerate(self.input_variables):
+            values = inputs[:, i]
+            if input_variable.lock_range:
+                values = np.clip(values, input_variable.minimum, input_variable.maximum)
+            state.values[input_variable] = values
+            state.fuzzifications[input_variable] = {}
+
+        with state.bind():
+            valid: Dict[Variable, 'np.ndarray'] = {}
+            for output_variable in self.output_variables:
+                valid[output_variable] = np.full(rows, False)
+
+            # Activate rule blocks
+            for block in self.rule_blocks:
+                if block.enabled:
+                    block.activate_array()
+                    for rule in block.rules:
+                        if np.any(rule.triggered):
+                            for proposition in rule.consequent.conclusions:
+                                valid[proposition.variable] |= rule.triggered  # type: ignore
+
+            # Defuzzify output variables
+            result = np.empty((rows, len(self.output_variables)))
+            for i, output_variable in enumerate(self.output_variables):
+                result[:, i] = output_variable.defuzzify_array(valid[output_variable])
+
+        return result
+
     def is_ready(self) -> Tuple[bool, str]:
         raise NotImplementedError()
 
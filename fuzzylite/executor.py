@@ -0,0 +1,198 @@
+"""
+ pyfuzzylite (TM), a fuzzy logic control library in Python.
+ Copyright (C) 2010-2017 FuzzyLite Limited. All rights reserved.
+ Author: Juan Rada-Vilela, Ph.D. <jcrada@fuzzylite.com>
+
+ This file is part of pyfuzzylite.
+
+ pyfuzzylite is free software: you can redistribute it and/or modify it under
+ the terms of the FuzzyLite License included with the software.
+
+ You should have received a copy of the FuzzyLite License along with
+ pyfuzzylite. If not, see <http://www.fuzzylite.com/license/>.
+
+ pyfuzzylite is a trademark of FuzzyLite Limited
+ fuzzylite is a registered trademark of FuzzyLite Limited.
+"""
+
+__all__ = ["EngineExecutor"]
+
+import enum
+import itertools
+import os
+import pickle
+import typing
+from collections import deque
+from typing import Deque, Iterable, Iterator, List, Optional, Sequence, Union
+
+from .engine import Engine
+from .exporter import FllExporter
+from .importer import FllImporter
+
+if typing.TYPE_CHECKING:
+    import concurrent.futures  # noqa: F401
+    from types import TracebackType  # noqa: F401
+
+# the engine of the worker process, shipped once by EngineExecutor when the worker starts
+_engine: Optional[Engine] = None
+_batch = False
+
+
+def _initialize(format: 'EngineExecutor.Format', definition: Union[str, bytes],
+                batch: bool, decimals: int, abs_tolerance: float) -> None:
+    global _engine, _batch
+    from . import lib
+    lib.decimals = decimals
+    lib.abs_tolerance = abs_tolerance
+    if format == EngineExecutor.Format.FLL:
+        _engine = FllImporter().from_string(typing.cast(str, definition))
+    else:
+        _engine = pickle.loads(typing.cast(bytes, definition))
+    _batch = batch
+
+
+def _process(rows: List[Sequence[float]]) -> List[List[float]]:
+    if not _engine:
+        raise RuntimeError("expected an engine in the worker, but found none")
+    return EngineExecutor.evaluate(_engine, rows, _batch)
+
+
+class EngineExecutor:
+    """
+      The EngineExecutor class evaluates rows of inputs on an engine in parallel using a pool
+      of worker processes. The engine is shipped once to each worker, either pickled or in the
+      FuzzyLite Language (only pickling preserves the values of the engine exactly, as the
+      FuzzyLite Language writes the values with the decimals of the library). The rows are
+      sent to the workers in chunks, and the outputs are collected in the same order as the
+      rows. Each chunk is evaluated on an engine restarted to its initial state, so the
+      outputs do not depend on which worker evaluates each chunk, but the previous values of
+      the output variables (see OutputVariable::lock_previous) are only kept within a chunk.
+
+      @see Engine::process
+      @see Engine::process_batch
+
+      Attributes:
+          engine is the engine to evaluate
+          workers is the number of worker processes (defaults to the number of processors)
+          chunk_size is the number of rows sent to a worker at a time
+          format is the format in which the engine is shipped to the workers
+          batch is whether the workers process each chunk as a batch (see Engine::process_batch)
+    """
+
+    @enum.unique
+    class Format(enum.Enum):
+        FLL, Pickle = range(2)
+
+    def __init__(self, engine: Engine, workers: Optional[int] = None, chunk_size: int = 1000,
+                 format: Optional[Union[str, 'EngineExecutor.Format']] = None,
+                 batch: bool = False) -> None:
+        if format is None:
+            format = EngineExecutor.Format.Pickle
+        elif isinstance(format, str):
+            format = EngineExecutor.Format[format]
+        if chunk_size < 1:
+            raise ValueError(f"expected a chunk size greater than zero, but found {chunk_size}")
+        self.engine = engine
+        self.workers = workers if workers else (os.cpu_count() or 1)
+        self.chunk_size = chunk_size
+        self.format = format
+        self.batch = batch
+        self._pool: Optional['concurrent.futures.ProcessPoolExecutor'] = None
+
+    def __enter__(self) -> 'EngineExecutor':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type: Optional[type], exc_value: Optional[BaseException],
+                 traceback: Optional['TracebackType']) -> None:
+        self.shutdown()
+
+    def definition(self) -> Union[str, bytes]:
+        """
+        Returns the definition of the engine shipped to the workers
+        :return: the engine in the FuzzyLite Language, or the engine pickled
+        """
+        if self.format == EngineExecutor.Format.FLL:
+            return FllExporter().to_string(self.engine)
+        return pickle.dumps(self.engine)
+
+    def start(self) -> None:
+        """
+        Starts the pool of workers (if not started), shipping the engine to each of them
+        """
+        if self._pool:
+            return
+        import concurrent.futures
+
+        from . import lib
+        self._pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.workers, initializer=_initialize,
+            initargs=(self.format, self.definition(), self.batch,
+                      lib.decimals, lib.abs_tolerance))
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shuts down the pool of workers (if started)
+        :param wait: whether to wait for the pending chunks to finish
+        """
+        if self._pool:
+            self._pool.shutdown(wait=wait)
+            self._pool = None
+
+    def map(self, inputs: Iterable[Sequence[float]]) -> Iterator[List[float]]:
+        """
+        Evaluates the rows of inputs in parallel, reading the rows as the workers need them
+        and keeping at most two chunks per worker in progress
+        :param inputs: is the iterable of rows, each with a value per input variable
+        :return: an iterator of the rows of outputs, each with a value per output variable, in
+        the same order as the rows of inputs
+        """
+        self.start()
+        if not self._pool:
+            raise RuntimeError("expected a pool of workers, but found none")
+        rows = iter(inputs)
+        pending: Deque['concurrent.futures.Future'] = deque()  # type: ignore
+        while True:
+            while len(pending) < 2 * self.workers:
+                chunk = list(itertools.islice(rows, self.chunk_size))
+                if not chunk:
+                    break
+                pending.append(self._pool.submit(_process, chunk))
+            if not pending:
+                return
+            yield from pending.popleft().result()
+
+    def process(self, inputs: Iterable[Sequence[float]]) -> List[List[float]]:
+        """
+        Evaluates the rows of inputs in parallel (see EngineExecutor::map)
+        :param inputs: is the iterable of rows, each with a value per input variable
+        :return: the rows of outputs, each with a value per output variable
+        """
+        return list(self.map(inputs))
+
+    @staticmethod
+    def evaluate(engine: Engine, rows: Iterable[Sequence[float]],
+                 batch: bool = False) -> List[List[float]]:
+        """
+        Evaluates the rows of inputs on the engine after restarting it, which is what each
+        worker does with each chunk of rows
+        :param engine: is the engine to evaluate
+        :param rows: is the iterable of rows, each with a value per input variable
+        :param batch: is whether to process the rows as a batch (see Engine::process_batch)
+        :return: the rows of outputs, each with a value per output variable
+        """
+        engine.restart()
+        if batch:
+            import numpy as np  # type: ignore
+            return engine.process_batch(np.array(list(rows), dtype=float)  # type: ignore
+                                        .reshape(-1, len(engine.input_variables))).tolist()
+        result: List[List[float]] = []
+        for row in rows:
+            if len(row) != len(engine.input_variables):
+                raise ValueError(f"expected {len(engine.input_variables)} input values, "
+                                 f"but found {len(row)}: {row}")
+            for variable, value in zip(engine.input_variables, row):
+                variable.value = value
+            engine.process()
+            result.append([variable.value for variable in engine.output_variables])
+        return result
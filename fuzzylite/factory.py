@@ -20,8 +20,11 @@ __all__ = ["ConstructionFactory", "CloningFactory", "ActivationFactory", "Defuzz
            "FactoryManager"]
 
 import copy
+import functools
 import math
-from typing import Callable, Dict, Generic, Iterator, Optional, TypeVar
+import re
+import typing
+from typing import Callable, Dict, Generic, Iterator, Optional, Pattern, TypeVar
 
 from .activation import Activation, First, General, Highest, Last, Lowest, Proportional, Threshold
 from .defuzzifier import (Bisector, Centroid, Defuzzifier, LargestOfMaximum, MeanOfMaximum,
@@ -37,6 +40,9 @@ from .term import (Bell, Binary, Concave, Constant, Cosine, Discrete, Function,
                    GaussianProduct, Linear, PiShape, Ramp, Rectangle, SShape, Sigmoid,
                    SigmoidDifference, SigmoidProduct, Spike, Term, Trapezoid, Triangle, ZShape)
 
+if typing.TYPE_CHECKING:
+    import numpy as np  # type: ignore # noqa: F401
+
 T = TypeVar('T')
 
 
@@ -151,12 +157,70 @@ class TermFactory(ConstructionFactory[Term]):
 
 
 class FunctionFactory(CloningFactory[Function.Element]):
+    """
+      The FunctionFactory class is a CloningFactory of the elements of Function terms. The elements
+      are shared by the trees of the formulas (see Function::parse), so they must not be modified
+      once registered. The tokenizer of the formulas (see FunctionFactory::tokenizer) and the
+      postfix notations of the most recent formulas (see FunctionFactory::postfix) are kept until
+      the elements change, either registered (see FunctionFactory::register) or otherwise set in
+      the objects of the factory.
+    """
+
+    # the maximum number of formulas whose postfix notation is kept
+    cache_size = 1024
 
     def __init__(self) -> None:
         super().__init__()
+        self._tokenizer: Optional[Pattern[str]] = None
+        self._postfix: Callable[[str], str] = functools.lru_cache(maxsize=self.cache_size)(
+            functools.partial(Function.convert_to_postfix, factory=self))
+        # the elements from which the tokenizer and the postfix notations are computed
+        self._elements: Dict[str, Function.Element] = {}
         self._register_operators()
         self._register_functions()
 
+    def register(self, element: Function.Element) -> None:
+        """
+        Registers the element under its name, which clears the tokenizer and the postfix
+        notations when next used (as does setting the element in the objects)
+        :param element: is the element to register
+        """
+        self.objects[element.name] = element
+
+    def _validate(self) -> None:
+        """
+        Clears the tokenizer and the postfix notations if the elements changed since computed
+        """
+        if self._elements != self.objects:
+            self._tokenizer = None
+            self._postfix.cache_clear()  # type: ignore
+            self._elements = dict(self.objects)
+
+    def tokenizer(self) -> Pattern[str]:
+        """
+        Gets the regular expression matching the operators, parentheses, and commas in formulas
+        (see Function::format_infix), which is compiled once until the elements change
+        :return: the regular expression matching the operators, parentheses, and commas
+        """
+        self._validate()
+        if not self._tokenizer:
+            operators = set(self.operators().keys()).union({'(', ')', ','})
+            operators -= {Rule.AND, Rule.OR}
+            # sorted to have multi-char operators separated first (eg., ** and *)
+            regex = "|".join(re.escape(o) for o in sorted(operators, reverse=True))
+            self._tokenizer = re.compile(fr"({regex})")
+        return self._tokenizer
+
+    def postfix(self, formula: str) -> str:
+        """
+        Gets the postfix notation of the formula (see Function::convert_to_postfix), which is kept
+        for the most recent formulas until the elements change
+        :param formula: is the formula in infix notation
+        :return: the formula in postfix notation
+        """
+        self._validate()
+        return self._postfix(formula)
+
     def _precedence(self, importance: int) -> int:
         maximum = 100
         step = 10
@@ -205,8 +269,16 @@ class FunctionFactory(CloningFactory[Function.Element]):
             Function.Element(Rule.OR, "Logical OR", operator_type, Op.logical_or,
                              arity=2, precedence=p(5))
         ]
+        # the methods computing the operators on arrays
+        n = functools.partial(functools.partial, FunctionFactory._numpy)
+        methods_array: Dict[str, Callable[..., 'np.ndarray']] = {
+            "!": n("logical_not"), "~": n("negative"), "^": n("power"), "**": n("power"),
+            ".-": n("negative"), ".+": n("positive"), "*": n("multiply"), "/": n("true_divide"),
+            "%": n("remainder"), "+": n("add"), "-": n("subtract"),
+            Rule.AND: Op.logical_and_array, Rule.OR: Op.logical_or_array}
         for op in operators:
-            self.objects[op.name] = op
+            op.method_array = methods_array[op.name]
+            self.register(op)
 
     def _register_functions(self) -> None:
         function_type = Function.Element.Type.Function
@@ -250,9 +322,61 @@ class FunctionFactory(CloningFactory[Function.Element]):
             Function.Element("pi", "Pi constant", function_type, Op.pi, arity=0)
         ]
 
+        # the methods computing the functions on arrays
+        n = functools.partial(functools.partial, FunctionFactory._numpy)
+        i = functools.partial(functools.partial, FunctionFactory._numpy_integral)
+        methods_array: Dict[str, Callable[..., 'np.ndarray']] = {
+            "gt": Op.gt_array, "ge": Op.ge_array, "eq": Op.eq_array, "neq": Op.neq_array,
+            "le": Op.le_array, "lt": Op.lt_array,
+            "min": FunctionFactory._min_array, "max": FunctionFactory._max_array,
+            "acos": n("arccos"), "asin": n("arcsin"), "atan": n("arctan"), "ceil": i("ceil"),
+            "cos": n("cos"), "cosh": n("cosh"), "exp": n("exp"), "abs": n("fabs"),
+            "fabs": n("fabs"), "floor": i("floor"), "log": n("log"), "log10": n("log10"),
+            "round": i("rint"), "sin": n("sin"), "sinh": n("sinh"), "sqrt": n("sqrt"),
+            "tan": n("tan"), "tanh": n("tanh"), "log1p": n("log1p"), "acosh": n("arccosh"),
+            "asinh": n("arcsinh"), "atanh": n("arctanh"), "pow": n("power"),
+            "atan2": n("arctan2"), "fmod": n("fmod"), "pi": Op.pi}
         for f in functions:
             f.precedence = self._precedence(0)
-            self.objects[f.name] = f
+            f.method_array = methods_array[f.name]
+            self.register(f)
+
+    @staticmethod
+    def _numpy(name: str, *arrays: 'np.ndarray') -> 'np.ndarray':
+        """
+        Computes the numpy function with the given name on the arrays, which is partially applied
+        to the name as the method of the elements on arrays so numpy is imported only when needed
+        :param name: is the name of the numpy function
+        :param arrays: are the arrays on which to compute the numpy function
+        :return: the result of the numpy function
+        """
+        import numpy as np  # type: ignore
+        return getattr(np, name)(*arrays)  # type: ignore
+
+    @staticmethod
+    def _numpy_integral(name: str, array: 'np.ndarray') -> 'np.ndarray':
+        """
+        Computes the numpy function with the given name on the array as in FunctionFactory::_numpy,
+        replacing the negative zeros by zeros as the integers computed by the function in math
+        (e.g., math.ceil(-0.5) is 0, whereas numpy.ceil(-0.5) is -0.0)
+        :param name: is the name of the numpy function
+        :param array: is the array on which to compute the numpy function
+        :return: the result of the numpy function without negative zeros
+        """
+        import numpy as np  # type: ignore
+        return getattr(np, name)(array) + 0.0  # type: ignore
+
+    @staticmethod
+    def _min_array(a: 'np.ndarray', b: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        # same as min(a, b), which is a unless b < a, including when a or b are nan
+        return np.where(b < a, b, a)  # type: ignore
+
+    @staticmethod
+    def _max_array(a: 'np.ndarray', b: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        # same as max(a, b), which is a unless b > a, including when a or b are nan
+        return np.where(b > a, b, a)  # type: ignore
 
     def operators(self) -> Dict[str, Function.Element]:
         result = {key: prototype for key, prototype in self.objects.items()
@@ -23,10 +23,13 @@ import typing
 from typing import Callable
 
 if typing.TYPE_CHECKING:
+    import numpy as np  # type: ignore # noqa: F401
+
     from .term import Function
 
 
 class Hedge:
+    __slots__ = ()
 
     @property
     def name(self) -> str:
@@ -35,44 +38,84 @@ class Hedge:
     def hedge(self, x: float) -> float:
         raise NotImplementedError()
 
+    def hedge_array(self, x: 'np.ndarray') -> 'np.ndarray':
+        """
+        Computes the hedge element-wise on the array x. By default, it applies Hedge::hedge to
+        each value, and subclasses override it to vectorize the hedge.
+        """
+        import numpy as np  # type: ignore
+        return np.vectorize(self.hedge, otypes=[float])(x)  # type: ignore
+
 
 class Any(Hedge):
+    __slots__ = ()
 
     def hedge(self, x: float) -> float:
         return 1.0
 
+    def hedge_array(self, x: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        return np.ones(np.shape(x))  # type: ignore
+
 
 class Extremely(Hedge):
+    __slots__ = ()
 
     def hedge(self, x: float) -> float:
         return 2.0 * x * x if x <= 0.5 else (1.0 - 2.0 * (1.0 - x) * (1.0 - x))
 
+    def hedge_array(self, x: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        return np.where(x <= 0.5, 2.0 * x * x, 1.0 - 2.0 * (1.0 - x) * (1.0 - x))  # type: ignore
+
 
 class Not(Hedge):
+    __slots__ = ()
 
     def hedge(self, x: float) -> float:
         return 1.0 - x
 
+    def hedge_array(self, x: 'np.ndarray') -> 'np.ndarray':
+        return 1.0 - x
+
 
 class Seldom(Hedge):
+    __slots__ = ()
 
     def hedge(self, x: float) -> float:
         return math.sqrt(0.5 * x) if x <= 0.5 else (1.0 - math.sqrt(0.5 * (1.0 - x)))
 
+    def hedge_array(self, x: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        with np.errstate(invalid='ignore'):
+            return np.where(x <= 0.5, np.sqrt(0.5 * x),  # type: ignore
+                            1.0 - np.sqrt(0.5 * (1.0 - x)))
+
 
 class Somewhat(Hedge):
+    __slots__ = ()
 
     def hedge(self, x: float) -> float:
         return math.sqrt(x)
 
+    def hedge_array(self, x: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        with np.errstate(invalid='ignore'):
+            return np.sqrt(x)  # type: ignore
+
 
 class Very(Hedge):
+    __slots__ = ()
 
     def hedge(self, x: float) -> float:
         return x * x
 
+    def hedge_array(self, x: 'np.ndarray') -> 'np.ndarray':
+        return x * x
+
 
 class HedgeLambda(Hedge):
+    __slots__ = ("_name", "function")
 
     def __init__(self, name: str, function: Callable[[float], float]) -> None:
         self._name = name
@@ -87,6 +130,7 @@ class HedgeLambda(Hedge):
 
 
 class HedgeFunction(Hedge):
+    __slots__ = ("function",)
 
     def __init__(self, function: 'Function') -> None:
         self.function = function
@@ -97,3 +141,6 @@ class HedgeFunction(Hedge):
 
     def hedge(self, x: float) -> float:
         return self.function.membership(x)
+
+    def hedge_array(self, x: 'np.ndarray') -> 'np.ndarray':
+        return self.function.membership_array(x)
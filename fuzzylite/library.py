@@ -19,6 +19,7 @@ import logging
 from typing import Optional, SupportsFloat, Type, Union
 
 from .factory import FactoryManager
+from .tracer import Tracer
 
 __all__ = ["Library"]
 
@@ -51,6 +52,24 @@ class Library:
     def debugging(self) -> bool:
         return self.logger.level == logging.DEBUG
 
+    @property
+    def tracer(self) -> Optional[Tracer]:
+        """
+        Gets the tracer of the hot paths of the library, if any (see Tracer)
+        """
+        return Tracer.active
+
+    @tracer.setter
+    def tracer(self, tracer: Optional[Tracer]) -> None:
+        """
+        Sets the tracer of the hot paths of the library, or None to disable tracing
+        """
+        Tracer.active = tracer
+
+    @property
+    def tracing(self) -> bool:
+        return Tracer.active is not None
+
     @property
     def name(self) -> str:
         return "pyfuzzylite"
@@ -24,6 +24,8 @@ import typing
 from typing import Callable
 
 if typing.TYPE_CHECKING:
+    import numpy as np  # type: ignore # noqa: F401
+
     from .term import Function
 
 
@@ -40,6 +42,14 @@ class Norm:
     def compute(self, a: float, b: float) -> float:
         raise NotImplementedError()
 
+    def compute_array(self, a: 'np.ndarray', b: 'np.ndarray') -> 'np.ndarray':
+        """
+        Computes the norm element-wise on the (broadcast) arrays a and b. By default, it applies
+        Norm::compute to each pair of values, and subclasses override it to vectorize the norm.
+        """
+        import numpy as np  # type: ignore
+        return np.vectorize(self.compute, otypes=[float])(a, b)  # type: ignore
+
 
 class TNorm(Norm):
 
@@ -52,42 +62,73 @@ class AlgebraicProduct(TNorm):
     def compute(self, a: float, b: float) -> float:
         return a * b
 
+    def compute_array(self, a: 'np.ndarray', b: 'np.ndarray') -> 'np.ndarray':
+        return a * b
+
 
 class BoundedDifference(TNorm):
 
     def compute(self, a: float, b: float) -> float:
         return max(0.0, a + b - 1.0)
 
+    def compute_array(self, a: 'np.ndarray', b: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        c = a + b - 1.0
+        return np.where(c > 0.0, c, 0.0)  # type: ignore
+
 
 class DrasticProduct(TNorm):
 
     def compute(self, a: float, b: float) -> float:
         return min(a, b) if max(a, b) == 1.0 else 0.0
 
+    def compute_array(self, a: 'np.ndarray', b: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        maximum = np.where(b > a, b, a)
+        return np.where(maximum == 1.0, np.where(b < a, b, a), 0.0)  # type: ignore
+
 
 class EinsteinProduct(TNorm):
 
     def compute(self, a: float, b: float) -> float:
         return (a * b) / (2.0 - (a + b - a * b))
 
+    def compute_array(self, a: 'np.ndarray', b: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return (a * b) / (2.0 - (a + b - a * b))
+
 
 class HamacherProduct(TNorm):
 
     def compute(self, a: float, b: float) -> float:
         return (a * b) / (a + b - a * b) if a + b != 0.0 else 0.0
 
+    def compute_array(self, a: 'np.ndarray', b: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(a + b != 0.0, (a * b) / (a + b - a * b), 0.0)  # type: ignore
+
 
 class Minimum(TNorm):
 
     def compute(self, a: float, b: float) -> float:
         return min(a, b)
 
+    def compute_array(self, a: 'np.ndarray', b: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        return np.where(b < a, b, a)  # type: ignore
+
 
 class NilpotentMinimum(TNorm):
 
     def compute(self, a: float, b: float) -> float:
         return min(a, b) if a + b > 1.0 else 0.0
 
+    def compute_array(self, a: 'np.ndarray', b: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        return np.where(a + b > 1.0, np.where(b < a, b, a), 0.0)  # type: ignore
+
 
 class SNorm(Norm):
 
@@ -100,54 +141,95 @@ class AlgebraicSum(SNorm):
     def compute(self, a: float, b: float) -> float:
         return a + b - (a * b)
 
+    def compute_array(self, a: 'np.ndarray', b: 'np.ndarray') -> 'np.ndarray':
+        return a + b - (a * b)
+
 
 class BoundedSum(SNorm):
 
     def compute(self, a: float, b: float) -> float:
         return min(1.0, a + b)
 
+    def compute_array(self, a: 'np.ndarray', b: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        c = a + b
+        return np.where(c < 1.0, c, 1.0)  # type: ignore
+
 
 class DrasticSum(SNorm):
 
     def compute(self, a: float, b: float) -> float:
         return max(a, b) if min(a, b) == 0.0 else 1.0
 
+    def compute_array(self, a: 'np.ndarray', b: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        minimum = np.where(b < a, b, a)
+        return np.where(minimum == 0.0, np.where(b > a, b, a), 1.0)  # type: ignore
+
 
 class EinsteinSum(SNorm):
 
     def compute(self, a: float, b: float) -> float:
         return (a + b) / (1.0 + a * b)
 
+    def compute_array(self, a: 'np.ndarray', b: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return (a + b) / (1.0 + a * b)
+
 
 class HamacherSum(SNorm):
 
     def compute(self, a: float, b: float) -> float:
         return (a + b - 2.0 * a * b) / (1.0 - a * b) if a * b != 1.0 else 1.0
 
+    def compute_array(self, a: 'np.ndarray', b: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(a * b != 1.0, (a + b - 2.0 * a * b) / (1.0 - a * b),  # type: ignore
+                            1.0)
+
 
 class Maximum(SNorm):
 
     def compute(self, a: float, b: float) -> float:
         return max(a, b)
 
+    def compute_array(self, a: 'np.ndarray', b: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        return np.where(b > a, b, a)  # type: ignore
+
 
 class NilpotentMaximum(SNorm):
 
     def compute(self, a: float, b: float) -> float:
         return max(a, b) if a + b < 1.0 else 1.0
 
+    def compute_array(self, a: 'np.ndarray', b: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        return np.where(a + b < 1.0, np.where(b > a, b, a), 1.0)  # type: ignore
+
 
 class NormalizedSum(SNorm):
 
     def compute(self, a: float, b: float) -> float:
         return (a + b) / max(1.0, a + b)
 
+    def compute_array(self, a: 'np.ndarray', b: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        c = a + b
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return c / np.where(c > 1.0, c, 1.0)
+
 
 class UnboundedSum(SNorm):
 
     def compute(self, a: float, b: float) -> float:
         return a + b
 
+    def compute_array(self, a: 'np.ndarray', b: 'np.ndarray') -> 'np.ndarray':
+        return a + b
+
 
 class NormLambda(TNorm, SNorm):
 
@@ -165,3 +247,9 @@ class NormFunction(TNorm, SNorm):
 
     def compute(self, a: float, b: float) -> float:
         return self.function.evaluate({'a': a, 'b': b})
+
+    def compute_array(self, a: 'np.ndarray', b: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        a, b = np.broadcast_arrays(a, b)
+        result = self.function.evaluate_array({'a': a, 'b': b})
+        return np.array(np.broadcast_to(result, a.shape), dtype=float)
@@ -19,8 +19,12 @@ __all__ = ["Operation", "Op"]
 
 import inspect
 import math
+import typing
 from typing import Callable, List, Optional, SupportsFloat, Text, Union
 
+if typing.TYPE_CHECKING:
+    import numpy as np  # type: ignore # noqa: F401
+
 
 class Operation:
     """
@@ -85,6 +89,43 @@ class Operation:
                     or (a != a and b != b)
                     ) and a < b
 
+    @staticmethod
+    def eq_array(a: 'np.ndarray', b: 'np.ndarray',
+                 abs_tolerance: Optional[float] = None) -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        if abs_tolerance is None:
+            from . import lib
+            abs_tolerance = lib.abs_tolerance
+        with np.errstate(invalid='ignore'):
+            return ((a == b)  # type: ignore
+                    | (np.abs(a - b) < abs_tolerance)
+                    | (np.isnan(a) & np.isnan(b)))
+
+    @staticmethod
+    def neq_array(a: 'np.ndarray', b: 'np.ndarray',
+                  abs_tolerance: Optional[float] = None) -> 'np.ndarray':
+        return ~Operation.eq_array(a, b, abs_tolerance)  # type: ignore
+
+    @staticmethod
+    def gt_array(a: 'np.ndarray', b: 'np.ndarray',
+                 abs_tolerance: Optional[float] = None) -> 'np.ndarray':
+        return ~Operation.eq_array(a, b, abs_tolerance) & (a > b)  # type: ignore
+
+    @staticmethod
+    def ge_array(a: 'np.ndarray', b: 'np.ndarray',
+                 abs_tolerance: Optional[float] = None) -> 'np.ndarray':
+        return Operation.eq_array(a, b, abs_tolerance) | (a > b)  # type: ignore
+
+    @staticmethod
+    def le_array(a: 'np.ndarray', b: 'np.ndarray',
+                 abs_tolerance: Optional[float] = None) -> 'np.ndarray':
+        return Operation.eq_array(a, b, abs_tolerance) | (a < b)  # type: ignore
+
+    @staticmethod
+    def lt_array(a: 'np.ndarray', b: 'np.ndarray',
+                 abs_tolerance: Optional[float] = None) -> 'np.ndarray':
+        return ~Operation.eq_array(a, b, abs_tolerance) & (a < b)  # type: ignore
+
     @staticmethod
     def logical_and(a: float, b: float) -> bool:
         return Operation.eq(a, 1.0) and Operation.eq(b, 1.0)
@@ -93,6 +134,14 @@ class Operation:
     def logical_or(a: float, b: float) -> bool:
         return Operation.eq(a, 1.0) or Operation.eq(b, 1.0)
 
+    @staticmethod
+    def logical_and_array(a: 'np.ndarray', b: 'np.ndarray') -> 'np.ndarray':
+        return Operation.eq_array(a, 1.0) & Operation.eq_array(b, 1.0)  # type: ignore
+
+    @staticmethod
+    def logical_or_array(a: 'np.ndarray', b: 'np.ndarray') -> 'np.ndarray':
+        return Operation.eq_array(a, 1.0) | Operation.eq_array(b, 1.0)  # type: ignore
+
     @staticmethod
     def as_identifier(name: str) -> str:
         result = ''.join([x for x in name if x in ("_", ".") or x.isalnum()])
@@ -130,9 +179,12 @@ class Operation:
             return str(None)
         key_values = {}
         if instance:
-            if slots and hasattr(instance, "__slots__") and instance.__slots__:
-                for slot in instance.__slots__:
-                    key_values[slot] = str(getattr(instance, slot))
+            if slots:
+                # the slots are declared across the class hierarchy, skipping those unassigned
+                for cls in reversed(inspect.getmro(instance.__class__)):
+                    for slot in getattr(cls, "__slots__", ()):
+                        if hasattr(instance, slot):
+                            key_values[slot] = str(getattr(instance, slot))
 
             if variables and hasattr(instance, "__dict__") and instance.__dict__:
                 for variable in instance.__dict__:
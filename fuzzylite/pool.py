@@ -0,0 +1,133 @@
+"""
+ pyfuzzylite (TM), a fuzzy logic control library in Python.
+ Copyright (C) 2010-2017 FuzzyLite Limited. All rights reserved.
+ Author: Juan Rada-Vilela, Ph.D. <jcrada@fuzzylite.com>
+
+ This file is part of pyfuzzylite.
+
+ pyfuzzylite is free software: you can redistribute it and/or modify it under
+ the terms of the FuzzyLite License included with the software.
+
+ You should have received a copy of the FuzzyLite License along with
+ pyfuzzylite. If not, see <http://www.fuzzylite.com/license/>.
+
+ pyfuzzylite is a trademark of FuzzyLite Limited
+ fuzzylite is a registered trademark of FuzzyLite Limited.
+"""
+
+__all__ = ["EnginePool"]
+
+import contextlib
+import threading
+from typing import Iterator, List, Optional, Set
+
+from .engine import Engine
+
+
+class EnginePool:
+    """
+      The EnginePool class keeps clones of an engine (see Engine::clone) that threads check
+      out to process them and check in once finished, such that each engine is processed by
+      one thread at a time. The clones are created as they are needed, up to the maximum
+      number of engines in the pool, after which checking out an engine waits until another
+      thread checks in an engine. The engines are restarted when checked in.
+
+      @see Engine::clone
+      @see Engine::evaluate
+
+      Attributes:
+          engine is the engine to clone
+          maximum is the maximum number of engines in the pool, or None for no maximum
+    """
+
+    def __init__(self, engine: Engine, size: int = 0, maximum: Optional[int] = None) -> None:
+        """
+        Creates the pool of engines
+        :param engine: is the engine to clone
+        :param size: is the number of engines to clone upfront
+        :param maximum: is the maximum number of engines in the pool, or None for no maximum
+        """
+        if maximum is not None and maximum < 1:
+            raise ValueError(f"expected a maximum number of engines greater than zero, "
+                             f"but found {maximum}")
+        self.engine = engine
+        self.maximum = maximum
+        self._condition = threading.Condition()
+        self._available: List[Engine] = []
+        self._checked_out: Set[Engine] = set()
+        if maximum is not None:
+            size = min(size, maximum)
+        self._available.extend(engine.clone() for _ in range(size))
+        self._size = size
+
+    def __len__(self) -> int:
+        """
+        Gets the number of engines in the pool, including those checked out
+        """
+        with self._condition:
+            return self._size
+
+    @property
+    def available(self) -> int:
+        """
+        Gets the number of engines available to check out without cloning the engine
+        """
+        with self._condition:
+            return len(self._available)
+
+    def checkout(self, timeout: Optional[float] = None) -> Engine:
+        """
+        Checks out an engine from the pool, cloning the engine if none is available and the
+        pool is not full, or otherwise waiting until an engine is checked in
+        :param timeout: is the maximum number of seconds to wait, or None to wait indefinitely
+        :return: the engine checked out, which needs to be checked in afterwards
+        """
+        with self._condition:
+            if not self._condition.wait_for(
+                    lambda: self._available or self.maximum is None or self._size < self.maximum,
+                    timeout):
+                raise TimeoutError(f"expected an engine available within {timeout} seconds, "
+                                   f"but all {self._size} engines are checked out")
+            if self._available:
+                engine = self._available.pop()
+                self._checked_out.add(engine)
+                return engine
+            # the engine is cloned outside the lock, so other threads can check engines in and out
+            self._size += 1
+        try:
+            engine = self.engine.clone()
+        except Exception:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self._checked_out.add(engine)
+        return engine
+
+    def checkin(self, engine: Engine) -> None:
+        """
+        Checks in an engine checked out from the pool, restarting the engine
+        :param engine: is the engine checked out from the pool
+        """
+        with self._condition:
+            if engine not in self._checked_out:
+                raise ValueError(f"expected an engine checked out from the pool, "
+                                 f"but found engine '{engine.name}'")
+            engine.restart()
+            self._checked_out.remove(engine)
+            self._available.append(engine)
+            self._condition.notify()
+
+    @contextlib.contextmanager
+    def borrow(self, timeout: Optional[float] = None) -> Iterator[Engine]:
+        """
+        Checks out an engine from the pool within the context, checking it in afterwards
+        :param timeout: is the maximum number of seconds to wait, or None to wait indefinitely
+        :return: the engine checked out
+        """
+        engine = self.checkout(timeout)
+        try:
+            yield engine
+        finally:
+            self.checkin(engine)
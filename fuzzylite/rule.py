@@ -18,28 +18,32 @@
 __all__ = ["Expression", "Proposition", "Operator", "Antecedent", "Consequent", "Rule", "RuleBlock"]
 
 import typing
-from math import nan
-from typing import Deque, Iterable, List, Optional
+from math import copysign, inf, nan
+from typing import Callable, Deque, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 
 from .exporter import FllExporter
 from .hedge import Any
-from .norm import SNorm, TNorm
+from .norm import AlgebraicProduct, Minimum, Norm, SNorm, TNorm
 from .operation import Op
+from .state import State
 from .variable import InputVariable, OutputVariable
 
 if typing.TYPE_CHECKING:
+    import numpy as np  # type: ignore # noqa: F401
+
     from .activation import Activation  # noqa: F401
     from .engine import Engine
     from .hedge import Hedge
-    from .term import Term  # noqa: F401
+    from .term import Activated, Term  # noqa: F401
     from .variable import Variable  # noqa: F401
 
 
 class Expression:
-    pass
+    __slots__ = ()
 
 
 class Proposition(Expression):
+    __slots__ = ("variable", "hedges", "term")
 
     def __init__(self, variable: Optional['Variable'] = None,
                  hedges: Optional[Iterable['Hedge']] = None,
@@ -69,6 +73,7 @@ class Proposition(Expression):
 
 
 class Operator(Expression):
+    __slots__ = ("name", "right", "left")
 
     def __init__(self, name: str = "",
                  right: Optional[Expression] = None,
@@ -82,25 +87,190 @@ class Operator(Expression):
 
 
 class Antecedent(object):
+    __slots__ = ("text", "expression", "_compiled")
 
     def __init__(self, text: str = "") -> None:
         self.text: str = text
         self.expression: Optional[Expression] = None
+        self._compiled: Optional[Tuple[Optional[TNorm], Optional[SNorm],
+                                       Callable[[], float]]] = None
 
     def __str__(self) -> str:
         return self.text
 
+    def __getstate__(self) -> Dict[str, object]:
+        # the compiled function cannot be pickled, so it is left out
+        return {'text': self.text, 'expression': self.expression, '_compiled': None}
+
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        for attribute, value in state.items():
+            setattr(self, attribute, value)
+
     def is_loaded(self) -> bool:
         return bool(self.expression)
 
     def unload(self) -> None:
         self.expression = None
+        self._compiled = None
+        RuleBlock.revision += 1
+
+    def is_compiled(self, conjunction: Optional[TNorm] = None,
+                    disjunction: Optional[SNorm] = None) -> bool:
+        """
+        Indicates whether the antecedent is compiled for the conjunction and disjunction
+        operators
+        """
+        return bool(self._compiled
+                    and self._compiled[0] is conjunction and self._compiled[1] is disjunction)
+
+    def compile(self, conjunction: Optional[TNorm] = None,
+                disjunction: Optional[SNorm] = None) -> None:
+        """
+        Compiles the expression into a function that computes the activation degree without
+        walking the expression tree. The function performs the same operations as
+        Antecedent::activation_degree, and it is used instead of walking the tree when the
+        activation degree is computed using the same conjunction and disjunction operators
+        (until the antecedent is loaded again).
+        :param conjunction: is the conjunction operator
+        :param disjunction: is the disjunction operator
+        """
+        if not self.expression:
+            raise RuntimeError(f"antecedent '{self.text}' is not loaded")
+        self._compiled = (conjunction, disjunction,
+                          self._compile(conjunction, disjunction, self.expression))
+
+    def _compile(self,  # noqa C901 'Antecedent._compile' is too complex (19)
+                 conjunction: Optional[TNorm], disjunction: Optional[SNorm],
+                 node: Expression) -> Callable[[], float]:
+        # PROPOSITION
+        if isinstance(node, Proposition):
+            variable = node.variable
+            if not variable:
+                raise ValueError(f"expected a variable in proposition '{node}', "
+                                 f"but found none in antecedent: '{self.text}'")
+            hedges = tuple(reversed(node.hedges))
+            term = node.term
+
+            if node.hedges and isinstance(node.hedges[-1], Any):
+                def any_proposition() -> float:
+                    if not variable.enabled:  # type: ignore
+                        return 0.0
+                    result = nan
+                    for hedge in hedges:
+                        result = hedge.hedge(result)
+                    return result
+
+                return any_proposition
+
+            if not term:
+                def invalid_proposition() -> float:
+                    if not variable.enabled:  # type: ignore
+                        return 0.0
+                    raise ValueError(f"expected a term in proposition '{node}', "
+                                     f"but found none for antecedent: '{self.text}'")
+
+                return invalid_proposition
+
+            if isinstance(variable, InputVariable) and not hedges:
+                current_state = State.current.get
+
+                def input_proposition() -> float:
+                    if not variable.enabled:  # type: ignore
+                        return 0.0
+                    # inlines InputVariable::membership for the values already computed
+                    state = current_state() if State.bound else None
+                    if state is None:
+                        fuzzification = variable._fuzzification  # type: ignore
+                    else:
+                        fuzzification = state.fuzzifications.get(variable)
+                    result = None if fuzzification is None else fuzzification.get(term)
+                    if result is None:
+                        # computes the value as usual (e.g., using the lookup table)
+                        result = variable.membership(term)  # type: ignore
+                    return result  # type: ignore
+
+                return input_proposition
+
+            def proposition() -> float:
+                if not variable.enabled:  # type: ignore
+                    return 0.0
+                result = nan
+                if isinstance(variable, InputVariable):
+                    result = variable.membership(term)  # type: ignore
+                elif isinstance(variable, OutputVariable):
+                    result = variable.fuzzy.activation_degree(term)  # type: ignore
+                for hedge in hedges:
+                    result = hedge.hedge(result)
+                return result
+
+            return proposition
+
+        # OPERATOR
+        if isinstance(node, Operator):
+            if not (node.left and node.right):
+                raise ValueError(f"expected left and right operands for operator '{node}' "
+                                 f"in antecedent: '{self.text}'")
+
+            norm: Optional[Norm] = None
+            if node.name == Rule.AND:
+                if not conjunction:
+                    raise ValueError(f"expected a conjunction operator, "
+                                     f"but found none for antecedent: '{self.text}'")
+                norm = conjunction
+            elif node.name == Rule.OR:
+                if not disjunction:
+                    raise ValueError(f"expected a disjunction operator, "
+                                     f"but found none for antecedent: '{self.text}'")
+                norm = disjunction
+            else:
+                raise ValueError(f"operator '{node}' not recognized in antecedent: '{self.text}'")
+
+            compute = norm.compute
+            left = self._compile(conjunction, disjunction, node.left)
+            right = self._compile(conjunction, disjunction, node.right)
+
+            def operator() -> float:
+                return compute(left(), right())
+
+            return operator
+
+        raise RuntimeError(f"unexpected type of node '{node}': {type(node)}")
+
+    def clone(self, references: Dict[object, object]) -> 'Antecedent':
+        """
+        Creates a copy of the antecedent with a copy of the expression tree (if loaded), where
+        the variables and terms are replaced by their references, without parsing the text
+        again. The antecedent is compiled if this antecedent is compiled.
+        :param references: maps the components (e.g., variables and terms) to their
+        replacements, and the components not in the map are shared (e.g., hedges)
+        :return: the copy of the antecedent
+        """
+        result = Antecedent(self.text)
+        if self.expression:
+            result.expression = self._clone(references, self.expression)
+            if self._compiled:
+                result.compile(self._compiled[0], self._compiled[1])
+        return result
+
+    def _clone(self, references: Dict[object, object], node: Expression) -> Expression:
+        if isinstance(node, Proposition):
+            return Proposition(typing.cast('Variable', references.get(node.variable,
+                                                                      node.variable)),
+                               node.hedges,
+                               typing.cast('Term', references.get(node.term, node.term)))
+        if isinstance(node, Operator):
+            return Operator(node.name,
+                            self._clone(references, node.right) if node.right else None,
+                            self._clone(references, node.left) if node.left else None)
+        raise RuntimeError(f"unexpected type of node '{node}': {type(node)}")
 
     def activation_degree(self,  # noqa C901 'Antecedent.activation_degree' is too complex (20)
                           conjunction: Optional[TNorm] = None,
                           disjunction: Optional[SNorm] = None,
                           node: Optional[Expression] = None) -> float:
         if not node:
+            if self._compiled and self.is_compiled(conjunction, disjunction):
+                return self._compiled[2]()
             if self.expression:
                 return self.activation_degree(conjunction, disjunction, self.expression)
             raise RuntimeError(f"antecedent '{self.text}' is not loaded")
@@ -127,7 +297,7 @@ class Antecedent(object):
 
             result = nan
             if isinstance(node.variable, InputVariable):
-                result = node.term.membership(node.variable.value)
+                result = node.variable.membership(node.term)
             elif isinstance(node.variable, OutputVariable):
                 result = node.variable.fuzzy.activation_degree(node.term)
 
@@ -162,6 +332,78 @@ class Antecedent(object):
 
         raise RuntimeError(f"unexpected type of node '{node}': {type(node)}")
 
+    def activation_degree_array(self,  # noqa C901 too complex (20)
+                                conjunction: Optional[TNorm] = None,
+                                disjunction: Optional[SNorm] = None,
+                                node: Optional[Expression] = None) -> 'np.ndarray':
+        """
+        Computes the activation degrees of the antecedent for a batch of values, where the
+        values of the input variables are arrays, and the activated terms of the output
+        variables have arrays of activation degrees (see Engine::process_batch).
+        """
+        import numpy as np  # type: ignore
+        if not node:
+            if self.expression:
+                return self.activation_degree_array(conjunction, disjunction, self.expression)
+            raise RuntimeError(f"antecedent '{self.text}' is not loaded")
+
+        # PROPOSITION
+        if isinstance(node, Proposition):
+            if not node.variable:
+                raise ValueError(f"expected a variable in proposition '{node}', "
+                                 f"but found none in antecedent: '{self.text}'")
+            if not node.variable.enabled:
+                return np.asarray(0.0)
+
+            if node.hedges:
+                # if last hedge is "Any", apply hedges in reverse order and return degree
+                if isinstance(node.hedges[-1], Any):
+                    result = np.asarray(nan)
+                    for hedge in reversed(node.hedges):
+                        result = hedge.hedge_array(result)
+                    return result
+
+            if not node.term:
+                raise ValueError(f"expected a term in proposition '{node}', "
+                                 f"but found none for antecedent: '{self.text}'")
+
+            result = np.asarray(nan)
+            if isinstance(node.variable, InputVariable):
+                result = node.variable.membership_array(node.term)
+            elif isinstance(node.variable, OutputVariable):
+                result = node.variable.fuzzy.activation_degree_array(node.term)
+
+            for hedge in reversed(node.hedges):
+                result = hedge.hedge_array(result)
+
+            return result
+
+        # OPERATOR
+        if isinstance(node, Operator):
+            if not (node.left and node.right):
+                raise ValueError(f"expected left and right operands for operator '{node}' "
+                                 f"in antecedent: '{self.text}'")
+
+            if node.name == Rule.AND:
+                if not conjunction:
+                    raise ValueError(f"expected a conjunction operator, "
+                                     f"but found none for antecedent: '{self.text}'")
+                return conjunction.compute_array(
+                    self.activation_degree_array(conjunction, disjunction, node.left),
+                    self.activation_degree_array(conjunction, disjunction, node.right))
+
+            if node.name == Rule.OR:
+                if not disjunction:
+                    raise ValueError(f"expected a disjunction operator, "
+                                     f"but found none for antecedent: '{self.text}'")
+                return disjunction.compute_array(
+                    self.activation_degree_array(conjunction, disjunction, node.left),
+                    self.activation_degree_array(conjunction, disjunction, node.right))
+
+            raise ValueError(f"operator '{node}' not recognized in antecedent: '{self.text}'")
+
+        raise RuntimeError(f"unexpected type of node '{node}': {type(node)}")
+
     def load(self, engine: 'Engine') -> None:  # noqa: C901 'Antecedent.load' is too complex (23)
         from collections import deque
         from . import lib
@@ -171,7 +413,7 @@ class Antecedent(object):
         if not self.text:
             raise SyntaxError("expected the antecedent of a rule, but found none")
 
-        postfix = Function().infix_to_postfix(self.text)
+        postfix = Function.infix_to_postfix(self.text)
         if lib.debugging:
             lib.logger.debug(f"antecedent={self.text}\npostfix={postfix}")
 
@@ -230,7 +472,8 @@ class Antecedent(object):
                     if len(stack) < 2:
                         raise SyntaxError(f"operator '{token}' expects 2 operands, "
                                           f"but found {len(stack)}")
-                    operator = Operator(token)
+                    # the keyword is shared by the operators instead of keeping every token
+                    operator = Operator(Rule.AND if token == Rule.AND else Rule.OR)
                     operator.right = stack.pop()
                     operator.left = stack.pop()
                     stack.append(operator)
@@ -262,6 +505,7 @@ class Antecedent(object):
             raise SyntaxError(f"unable to parse the following expressions: {errors}")
 
         self.expression = stack.pop()
+        RuleBlock.revision += 1
 
     def prefix(self, node: Optional[Expression] = None) -> str:
         if not node:
@@ -324,10 +568,12 @@ class Antecedent(object):
 
 
 class Consequent:
+    __slots__ = ("text", "conclusions", "_activated")
 
     def __init__(self, text: str = "") -> None:
         self.text: str = text
         self.conclusions: List[Proposition] = []
+        self._activated: List['Activated'] = []
 
     def __str__(self) -> str:
         return self.text
@@ -337,14 +583,50 @@ class Consequent:
 
     def unload(self) -> None:
         self.conclusions.clear()
+        self._activated = []
+
+    def activated(self) -> List['Activated']:
+        """
+        Gets the activated terms that the consequent adds to the output variables, one per
+        conclusion, which are created once (in the bound state, if any) and reused every time
+        the consequent is modified, so processing the engine does not create activated terms
+        :return: the activated term of each conclusion
+        """
+        state = State.current.get() if State.bound else None
+        result = self._activated if state is None else state.activated.get(self)
+        if result is None or len(result) != len(self.conclusions):
+            from .term import Activated
+
+            result = [Activated(typing.cast('Term', proposition.term), 0.0)
+                      for proposition in self.conclusions]
+            if state is None:
+                self._activated = result
+            else:
+                state.activated[self] = result
+        return result
+
+    def clone(self, references: Dict[object, object]) -> 'Consequent':
+        """
+        Creates a copy of the consequent with a copy of the conclusions (if loaded), where the
+        variables and terms are replaced by their references, without parsing the text again.
+        :param references: maps the components (e.g., variables and terms) to their
+        replacements, and the components not in the map are shared (e.g., hedges)
+        :return: the copy of the consequent
+        """
+        result = Consequent(self.text)
+        result.conclusions = [
+            Proposition(typing.cast('Variable', references.get(proposition.variable,
+                                                               proposition.variable)),
+                        proposition.hedges,
+                        typing.cast('Term', references.get(proposition.term, proposition.term)))
+            for proposition in self.conclusions]
+        return result
 
     def modify(self, activation_degree: float, implication: Optional[TNorm]) -> None:
-        from .term import Activated
-
         if not self.conclusions:
             raise RuntimeError(f"consequent is not loaded")
 
-        for proposition in self.conclusions:
+        for proposition, activated_term in zip(self.conclusions, self.activated()):
             if not proposition.variable:
                 raise ValueError(f"expected a variable in '{proposition}', "
                                  f"but found none in consequent")
@@ -357,7 +639,42 @@ class Consequent:
                 if not proposition.term:
                     raise ValueError(f"expected a term in proposition '{proposition}', "
                                      f"but found none")
-                activated_term = Activated(proposition.term, activation_degree, implication)
+                activated_term.term = proposition.term
+                activated_term.degree = activation_degree
+                activated_term.implication = implication
+                if isinstance(proposition.variable, OutputVariable):
+                    proposition.variable.fuzzy.add_term(activated_term,
+                                                        proposition.variable.compacts())
+                else:
+                    raise RuntimeError(f"expected an output variable, but found "
+                                       f"'{type(proposition.variable)}'")
+
+    def modify_array(self, activation_degree: 'np.ndarray', implication: Optional[TNorm],
+                     triggered: 'np.ndarray') -> None:
+        """
+        Modifies the consequent for a batch of activation degrees, adding to the output
+        variables the activated terms whose degrees are zero where the rule was not triggered.
+        """
+        import numpy as np  # type: ignore
+        from .term import Activated
+
+        if not self.conclusions:
+            raise RuntimeError("consequent is not loaded")
+
+        for proposition in self.conclusions:
+            if not proposition.variable:
+                raise ValueError(f"expected a variable in '{proposition}', "
+                                 f"but found none in consequent")
+            if proposition.variable.enabled:
+                for hedge in reversed(proposition.hedges):
+                    activation_degree = hedge.hedge_array(activation_degree)
+
+                if not proposition.term:
+                    raise ValueError(f"expected a term in proposition '{proposition}', "
+                                     f"but found none")
+                activated_term = Activated(proposition.term,
+                                           np.where(triggered, activation_degree, 0.0),
+                                           implication)
                 if isinstance(proposition.variable, OutputVariable):
                     proposition.variable.fuzzy.terms.append(activated_term)
                 else:
@@ -450,6 +767,9 @@ class Consequent:
 
 
 class Rule(object):
+    __slots__ = ("enabled", "_weight", "_activation_degree", "_triggered", "antecedent",
+                 "consequent")
+
     IF = 'if'
     IS = 'is'
     THEN = 'then'
@@ -459,15 +779,54 @@ class Rule(object):
 
     def __init__(self) -> None:
         self.enabled: bool = True
-        self.weight: float = 1.0
-        self.activation_degree: float = 0.0
-        self.triggered: bool = False
+        self._weight: float = 1.0
+        self._activation_degree: float = 0.0
+        self._triggered: bool = False
         self.antecedent: Antecedent = Antecedent()
         self.consequent: Consequent = Consequent()
 
     def __str__(self) -> str:
         return FllExporter().rule(self)
 
+    @property
+    def weight(self) -> float:
+        return self._weight
+
+    @weight.setter
+    def weight(self, weight: float) -> None:
+        self._weight = weight
+        RuleBlock.revision += 1
+
+    @property
+    def activation_degree(self) -> float:
+        state = State.current.get() if State.bound else None
+        if state is None:
+            return self._activation_degree
+        return state.activation_degrees.get(self, 0.0)
+
+    @activation_degree.setter
+    def activation_degree(self, value: float) -> None:
+        state = State.current.get() if State.bound else None
+        if state is None:
+            self._activation_degree = value
+        else:
+            state.activation_degrees[self] = value
+
+    @property
+    def triggered(self) -> bool:
+        state = State.current.get() if State.bound else None
+        if state is None:
+            return self._triggered
+        return state.triggered.get(self, False)
+
+    @triggered.setter
+    def triggered(self, value: bool) -> None:
+        state = State.current.get() if State.bound else None
+        if state is None:
+            self._triggered = value
+        else:
+            state.triggered[self] = value
+
     @property
     def text(self) -> str:
         result = [Rule.IF,
@@ -535,24 +894,91 @@ class Rule(object):
         self.consequent.text = " ".join(consequent)
         self.weight = weight
 
+    # the following methods access the state once instead of using the properties, as they
+    # are called for every rule every time the engine is processed
+
     def deactivate(self) -> None:
-        self.activation_degree = 0.0
-        self.triggered = False
+        state = State.current.get() if State.bound else None
+        if state is None:
+            self._activation_degree = 0.0
+            self._triggered = False
+        else:
+            state.activation_degrees[self] = 0.0
+            state.triggered[self] = False
 
     def activate_with(self, conjunction: Optional[TNorm], disjunction: Optional[SNorm]) -> float:
         if not self.is_loaded():
             raise RuntimeError(f"rule is not loaded: '{self.text}'")
-        self.activation_degree = (self.weight
-                                  * self.antecedent.activation_degree(conjunction, disjunction))
-        return self.activation_degree
+        activation_degree = (self._weight
+                             * self.antecedent.activation_degree(conjunction, disjunction))
+        state = State.current.get() if State.bound else None
+        if state is None:
+            self._activation_degree = activation_degree
+        else:
+            state.activation_degrees[self] = activation_degree
+        return activation_degree
 
     def trigger(self, implication: Optional[TNorm]) -> None:
+        state = State.current.get() if State.bound else None
+        if state is None:
+            self._triggered = False
+            activation_degree = self._activation_degree
+        else:
+            state.triggered[self] = False
+            activation_degree = state.activation_degrees.get(self, 0.0)
+        if not self.is_loaded():
+            raise RuntimeError(f"rule is not loaded: '{self.text}'")
+        if self.enabled and Op.gt(activation_degree, 0.0):
+            self.consequent.modify(activation_degree, implication)
+            if state is None:
+                self._triggered = True
+            else:
+                state.triggered[self] = True
+
+    def activate_with_array(self, conjunction: Optional[TNorm],
+                            disjunction: Optional[SNorm]) -> 'np.ndarray':
+        if not self.is_loaded():
+            raise RuntimeError(f"rule is not loaded: '{self.text}'")
+        self.activation_degree = (self.weight  # type: ignore
+                                  * self.antecedent.activation_degree_array(conjunction,
+                                                                            disjunction))
+        return self.activation_degree
+
+    def trigger_array(self, implication: Optional[TNorm],
+                      selected: Optional['np.ndarray'] = None) -> None:
+        """
+        Triggers the rule for a batch of activation degrees, where the rule is triggered for
+        the degrees greater than zero that are selected by the activation method (if any).
+        Afterwards, the triggered attribute is an array indicating where the rule was triggered.
+        """
         self.triggered = False
         if not self.is_loaded():
             raise RuntimeError(f"rule is not loaded: '{self.text}'")
-        if self.enabled and Op.gt(self.activation_degree, 0.0):
-            self.consequent.modify(self.activation_degree, implication)
-            self.triggered = True
+        if self.enabled:
+            triggered = Op.gt_array(self.activation_degree, 0.0)
+            if selected is not None:
+                triggered = triggered & selected
+            if triggered.any():
+                self.consequent.modify_array(self.activation_degree, implication, triggered)
+            self.triggered = triggered
+
+    def clone(self, references: Dict[object, object]) -> 'Rule':
+        """
+        Creates a copy of the rule with copies of its antecedent and consequent, where the
+        variables and terms are replaced by their references, without parsing the rule again
+        (see Engine::clone).
+        :param references: maps the components (e.g., variables and terms) to their
+        replacements, and the components not in the map are shared (e.g., hedges)
+        :return: the copy of the rule
+        """
+        result = Rule()
+        result.enabled = self.enabled
+        result.weight = self.weight
+        result.activation_degree = self.activation_degree
+        result.triggered = self.triggered
+        result.antecedent = self.antecedent.clone(references)
+        result.consequent = self.consequent.clone(references)
+        return result
 
     def is_loaded(self) -> bool:
         return self.antecedent.is_loaded() and self.consequent.is_loaded()
@@ -578,6 +1004,108 @@ class Rule(object):
 
 class RuleBlock:
 
+    class Index:
+        """
+          The Index class indexes the loaded rules of a rule block by the terms of the input
+          variables in their antecedents (see RuleBlock::candidates). The rules indexed are those
+          whose antecedents are conjunctions of propositions without hedges on input variables,
+          and whose weights are not negative, such that their activation degrees are zero when
+          any of their terms has a zero membership function value.
+
+          Attributes:
+              rules is a copy of the list of rules of the rule block when indexed
+              revision is the revision of the rules when indexed (see RuleBlock::revision)
+              conjunction is the conjunction operator of the rule block when indexed
+              terms is the list of input variables in the antecedents of the rules indexed, each
+              with the terms referenced
+              tree is the tree of positions of the rules indexed, whose levels correspond to the
+              input variables and are keyed by the set of terms of each variable in the rules
+              (empty if none), and whose leaves are the lists of positions of the rules
+              unindexed is the positions of the rules not indexed, which are always activated
+              (if loaded)
+              degrees is the activation degree of every rule when deactivated
+              triggered is whether every rule is triggered when deactivated
+        """
+        __slots__ = ("rules", "revision", "conjunction", "terms", "tree", "unindexed", "degrees",
+                     "triggered")
+
+        def __init__(self, rules: List[Rule], conjunction: Optional[TNorm]) -> None:
+            self.rules = list(rules)
+            self.revision = RuleBlock.revision
+            self.conjunction = conjunction
+            self.terms: List[Tuple[InputVariable, List['Term']]] = []
+            self.tree: Dict[FrozenSet['Term'], object] = {}
+            self.unindexed: List[int] = []
+            self.degrees: Dict[Rule, float] = dict.fromkeys(rules, 0.0)
+            self.triggered: Dict[Rule, bool] = dict.fromkeys(rules, False)
+
+    class Rules(List[Rule]):
+        """
+          The Rules class is the list of rules of a rule block, which counts every change to
+          the list (see RuleBlock::revision) so the index of the rules is created again.
+        """
+
+        def __setitem__(self, index, rule):  # type: ignore
+            RuleBlock.revision += 1
+            super().__setitem__(index, rule)
+
+        def __delitem__(self, index):  # type: ignore
+            RuleBlock.revision += 1
+            super().__delitem__(index)
+
+        def __iadd__(self, rules):  # type: ignore
+            RuleBlock.revision += 1
+            return super().__iadd__(rules)
+
+        def __imul__(self, times):  # type: ignore
+            RuleBlock.revision += 1
+            return super().__imul__(times)
+
+        def append(self, rule: Rule) -> None:
+            RuleBlock.revision += 1
+            super().append(rule)
+
+        def extend(self, rules: Iterable[Rule]) -> None:
+            RuleBlock.revision += 1
+            super().extend(rules)
+
+        def insert(self, index: int, rule: Rule) -> None:
+            RuleBlock.revision += 1
+            super().insert(index, rule)
+
+        def pop(self, index: int = -1) -> Rule:
+            RuleBlock.revision += 1
+            return super().pop(index)
+
+        def remove(self, rule: Rule) -> None:
+            RuleBlock.revision += 1
+            super().remove(rule)
+
+        def clear(self) -> None:
+            RuleBlock.revision += 1
+            super().clear()
+
+        def sort(self, *args, **kwargs):  # type: ignore
+            RuleBlock.revision += 1
+            super().sort(*args, **kwargs)
+
+        def reverse(self) -> None:
+            RuleBlock.revision += 1
+            super().reverse()
+
+    # the number of changes to the rules that affect the indices of the rule blocks (see
+    # RuleBlock::index), namely to the lists of rules, the weights of the rules, and the
+    # expressions of their antecedents when loaded or unloaded
+    revision = 0
+
+    # the conjunction operators that are zero when either operand is zero and the other is a
+    # finite value not negative, which allow the sparse activation of the rules
+    ANNIHILATING: Tuple[type, ...] = (AlgebraicProduct, Minimum)
+
+    # whether to activate only the rules that can be activated given the membership function
+    # values of the terms of the input variables (see RuleBlock::candidates)
+    sparse = True
+
     def __init__(self,
                  name: str = "",
                  description: str = "",
@@ -594,24 +1122,209 @@ class RuleBlock:
         self.disjunction = disjunction
         self.implication = implication
         self.activation = activation
-        self.rules: List[Rule] = []
-        if rules:
-            self.rules.extend(rules)
+        self._rules = RuleBlock.Rules(rules if rules else [])
+        self._index: Optional[RuleBlock.Index] = None
 
     def __str__(self) -> str:
         return FllExporter().rule_block(self)
 
+    def __getstate__(self) -> Dict[str, object]:
+        # the index is left out and created again when needed
+        state = self.__dict__.copy()
+        state["_index"] = None
+        return state
+
+    @property
+    def rules(self) -> List[Rule]:
+        """
+        Gets the list of rules of the rule block (see RuleBlock::Rules)
+        """
+        return self._rules
+
+    @rules.setter
+    def rules(self, rules: Iterable[Rule]) -> None:
+        RuleBlock.revision += 1
+        self._rules = RuleBlock.Rules(rules)
+
     def activate(self) -> None:
         if not self.activation:
             raise ValueError(f"expected an activation method, "
                              f"but found none in rule block:\n{str(self)}")
         return self.activation.activate(self)
 
+    def activate_array(self) -> None:
+        if not self.activation:
+            raise ValueError(f"expected an activation method, "
+                             f"but found none in rule block:\n{str(self)}")
+        return self.activation.activate_array(self)
+
+    def compile(self) -> None:
+        """
+        Compiles the antecedents of the loaded rules using the conjunction and disjunction
+        operators of the rule block, so the activation degrees of the rules are computed
+        without walking the expression trees (see Antecedent::compile). The rules need to be
+        compiled again after they are loaded or the operators of the rule block change.
+        """
+        for rule in self.rules:
+            if rule.is_loaded():
+                rule.antecedent.compile(self.conjunction, self.disjunction)
+
+    def index(self) -> 'RuleBlock.Index':
+        """
+        Gets the index of the rules by the terms of the input variables in their antecedents
+        (see RuleBlock::Index), which is created when first needed and created again whenever
+        the conjunction operator or the rules change (see RuleBlock::revision), without
+        comparing the rules every time. The index only needs to be created again explicitly
+        (see RuleBlock::reindex) after the expressions of the antecedents are assigned or
+        modified directly.
+        :return: the index of the rules
+        """
+        index = self._index
+        if (index is None or index.revision != RuleBlock.revision
+                or index.conjunction is not self.conjunction):
+            index = self._index = self._create_index()
+        return index
+
+    def reindex(self) -> None:
+        """
+        Discards the index of the rules, which is created again when needed (see
+        RuleBlock::index)
+        """
+        self._index = None
+
+    def _create_index(self) -> 'RuleBlock.Index':
+        index = RuleBlock.Index(self.rules, self.conjunction)
+        annihilating = isinstance(self.conjunction, RuleBlock.ANNIHILATING)
+        signatures: List[Tuple[int, Dict[InputVariable, Set['Term']]]] = []
+        # the terms of each variable in the order first referenced
+        variables: Dict[InputVariable, Dict['Term', None]] = {}
+        for position, rule in enumerate(self.rules):
+            propositions = RuleBlock._conjoined(rule.antecedent.expression)
+            if (propositions is None or not rule.is_loaded()
+                    or (len(propositions) > 1 and not annihilating)
+                    or not (0.0 <= rule.weight < inf and copysign(1.0, rule.weight) > 0.0)):
+                index.unindexed.append(position)
+                continue
+            signature: Dict[InputVariable, Set['Term']] = {}
+            for proposition in propositions:
+                variable, term = proposition.variable, proposition.term
+                signature.setdefault(variable, set()).add(term)  # type: ignore
+                variables.setdefault(variable, {})[term] = None  # type: ignore
+            signatures.append((position, signature))
+
+        index.terms = [(variable, list(terms)) for variable, terms in variables.items()]
+        empty: FrozenSet['Term'] = frozenset()
+        for position, signature in signatures:
+            keys = [frozenset(signature[variable]) if variable in signature else empty
+                    for variable in variables]
+            node = index.tree
+            for key in keys[:-1]:
+                node = node.setdefault(key, {})  # type: ignore
+            node.setdefault(keys[-1], []).append(position)  # type: ignore
+        return index
+
+    @staticmethod
+    def _conjoined(expression: Optional[Expression]) -> Optional[List[Proposition]]:
+        """
+        Gets the propositions of the expression if it is a conjunction of propositions without
+        hedges on input variables
+        :param expression: is the expression of an antecedent
+        :return: the propositions of the conjunction, or None if the expression is not such
+        """
+        result: List[Proposition] = []
+        pending: List[Optional[Expression]] = [expression]
+        while pending:
+            node = pending.pop()
+            if isinstance(node, Proposition):
+                if not (isinstance(node.variable, InputVariable) and node.term
+                        and not node.hedges):
+                    return None
+                result.append(node)
+            elif isinstance(node, Operator) and node.name == Rule.AND:
+                pending.append(node.right)
+                pending.append(node.left)
+            else:
+                return None
+        return result
+
+    def candidates(self) -> List[Rule]:
+        """
+        Deactivates the rules and gets the loaded rules to activate (in order). If the rule block
+        is sparse (see RuleBlock::sparse), the rules indexed (see RuleBlock::Index) with a term
+        whose membership function value is zero are left deactivated, as their activation
+        degrees would be zero. All the loaded rules are activated when a membership function
+        value is neither zero nor finite and positive (e.g., nan), as then the activation
+        degrees of the rules could be other than zero.
+        :return: the loaded rules to activate
+        """
+        if self.sparse and self.rules:
+            index = self.index()
+            positions = self._positions(index)
+            if positions is not None:
+                state = State.current.get() if State.bound else None
+                if state is None:
+                    for rule in self.rules:
+                        rule._activation_degree = 0.0
+                        rule._triggered = False
+                else:
+                    state.activation_degrees.update(index.degrees)
+                    state.triggered.update(index.triggered)
+                rules = self.rules
+                positions.sort()
+                return [rules[position] for position in positions
+                        if rules[position].is_loaded()]
+
+        result: List[Rule] = []
+        for rule in self.rules:
+            rule.deactivate()
+            if rule.is_loaded():
+                result.append(rule)
+        return result
+
+    @staticmethod
+    def _positions(index: 'RuleBlock.Index') -> Optional[List[int]]:
+        """
+        Gets the positions of the rules to activate using the index
+        :param index: is the index of the rules
+        :return: the positions of the rules (unsorted), or None if all the loaded rules need to
+        be activated
+        """
+        nodes = [index.tree] if index.terms else []
+        for variable, terms in index.terms:
+            nonzero: Set['Term'] = set()
+            if variable.enabled:
+                for term in terms:
+                    y = variable.membership(term)
+                    if 0.0 < y < inf:
+                        nonzero.add(term)
+                    elif not (y == 0.0 and copysign(1.0, y) > 0.0):
+                        return None
+            nodes = [child for node in nodes for key, child in node.items()  # type: ignore
+                     if key <= nonzero]
+        result = list(index.unindexed)
+        for positions in nodes:
+            result.extend(positions)  # type: ignore
+        return result
+
+    def clone(self, references: Dict[object, object]) -> 'RuleBlock':
+        """
+        Creates a copy of the rule block with copies of its rules (see Rule::clone), sharing
+        the operators and the activation method
+        :param references: maps the components (e.g., variables and terms) to their
+        replacements, and the components not in the map are shared (e.g., hedges)
+        :return: the copy of the rule block
+        """
+        return RuleBlock(self.name, self.description, self.enabled, self.conjunction,
+                         self.disjunction, self.implication, self.activation,
+                         [rule.clone(references) for rule in self.rules])
+
     def unload_rules(self) -> None:
+        self._index = None
         for rule in self.rules:
             rule.unload()
 
     def load_rules(self, engine: 'Engine') -> None:
+        self._index = None
         exceptions: List[str] = []  # noqa E701 (False Positive)
         for rule in self.rules:
             rule.unload()
@@ -0,0 +1,113 @@
+"""
+ pyfuzzylite (TM), a fuzzy logic control library in Python.
+ Copyright (C) 2010-2017 FuzzyLite Limited. All rights reserved.
+ Author: Juan Rada-Vilela, Ph.D. <jcrada@fuzzylite.com>
+
+ This file is part of pyfuzzylite.
+
+ pyfuzzylite is free software: you can redistribute it and/or modify it under
+ the terms of the FuzzyLite License included with the software.
+
+ You should have received a copy of the FuzzyLite License along with
+ pyfuzzylite. If not, see <http://www.fuzzylite.com/license/>.
+
+ pyfuzzylite is a trademark of FuzzyLite Limited
+ fuzzylite is a registered trademark of FuzzyLite Limited.
+"""
+
+__all__ = ["State"]
+
+import contextlib
+import contextvars
+import threading
+import typing
+from typing import Dict, Iterator, List, Optional
+
+if typing.TYPE_CHECKING:
+    from .rule import Consequent, Rule  # noqa: F401
+    from .term import Activated, Aggregated, Term  # noqa: F401
+    from .variable import InputVariable, OutputVariable, Variable  # noqa: F401
+
+
+class State:
+    """
+      The State class holds the values that change while an engine is processed, namely the
+      values of the variables, the previous values of the output variables, the fuzzification
+      tables of the input variables, the activated terms of the output variables and of the
+      consequents of the rules, and the activation degrees of the rules. While a state is bound
+      (see State::bind), the engine components read and write these values in the state instead
+      of in themselves, so the same engine can be processed by many threads (or asyncio tasks)
+      at once, each with its own state (see Engine::evaluate). A new state is equivalent to a
+      restarted engine.
+
+      @see Engine::evaluate
+
+      Attributes:
+          values is the value of each variable
+          previous_values is the previous value of each output variable
+          fuzzifications is the fuzzification table of each input variable
+          fuzzification_tables is the fuzzification table reused by each input variable every
+          time the engine is processed (see InputVariable::fuzzification_table)
+          terms is the list of activated terms of each output variable (in its Aggregated term)
+          activated is the list of activated terms of each consequent (see Consequent::activated)
+          indices is the index of the activated terms of each output variable (see
+          Aggregated::index)
+          activation_degrees is the activation degree of each rule
+          triggered is whether each rule was triggered
+          samples is the fuzzy output computed beforehand of each output variable (see
+          OutputVariable::tabulated)
+          bound is the number of states bound at the moment in any thread (or asyncio task),
+          so the engine components look up State::current only while a state is bound, as in
+          `State.current.get() if State.bound else None`
+    """
+
+    current: 'contextvars.ContextVar[Optional[State]]' = contextvars.ContextVar(
+        "fuzzylite.State.current", default=None)
+    bound = 0
+    _lock = threading.Lock()
+
+    def __init__(self) -> None:
+        self.values: Dict['Variable', float] = {}
+        self.previous_values: Dict['OutputVariable', float] = {}
+        self.fuzzifications: Dict['InputVariable', Optional[Dict['Term', float]]] = {}
+        self.fuzzification_tables: Dict['InputVariable', Dict['Term', float]] = {}
+        self.terms: Dict['Aggregated', List['Activated']] = {}
+        self.activated: Dict['Consequent', List['Activated']] = {}
+        self.indices: Dict['Aggregated', Optional['Aggregated.Index']] = {}
+        self.activation_degrees: Dict['Rule', float] = {}
+        self.triggered: Dict['Rule', bool] = {}
+        self.samples: Dict['OutputVariable', 'OutputVariable.Samples'] = {}
+
+    @contextlib.contextmanager
+    def bind(self) -> Iterator['State']:
+        """
+        Binds the state to the current thread (or asyncio task) within the context. The
+        contexts copied within the context (e.g., of the asyncio tasks created within it) are to
+        be finished within it too, as the state is no longer looked up once none is bound (see
+        State::bound).
+        :return: the state
+        """
+        with State._lock:
+            State.bound += 1
+        token = State.current.set(self)
+        try:
+            yield self
+        finally:
+            State.current.reset(token)
+            with State._lock:
+                State.bound -= 1
+
+    def clear(self) -> None:
+        """
+        Clears the values in the state, which is equivalent to restarting the engine
+        """
+        self.values.clear()
+        self.previous_values.clear()
+        self.fuzzifications.clear()
+        self.fuzzification_tables.clear()
+        self.terms.clear()
+        self.activated.clear()
+        self.indices.clear()
+        self.activation_degrees.clear()
+        self.triggered.clear()
+        self.samples.clear()
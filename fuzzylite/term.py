@@ -16,25 +16,34 @@
 """
 
 __all__ = ["Activated", "Aggregated", "Bell", "Binary", "Concave", "Constant", "Cosine",
-           "Discrete", "Function", "Gaussian", "GaussianProduct", "Linear", "PiShape", "Ramp",
-           "Rectangle", "SShape", "Sigmoid", "SigmoidDifference", "SigmoidProduct", "Spike",
+           "Discrete", "Function", "Gaussian", "GaussianProduct", "Linear", "Lookup", "PiShape",
+           "Ramp", "Rectangle", "SShape", "Sigmoid", "SigmoidDifference", "SigmoidProduct", "Spike",
            "Term", "Trapezoid", "Triangle", "ZShape"]
 
 import bisect
 import enum
-import logging
+import operator
 import re
 import typing
-from math import cos, exp, fabs, inf, isnan, nan, pi
-from typing import (Callable, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Set,
-                    SupportsFloat, Tuple, TypeVar, Union)
+from array import array
+from math import cos, exp, fabs, inf, isfinite, isnan, nan, pi
+from typing import (Callable, Deque, Dict, Iterable, Iterator, List, MutableSequence, Optional,
+                    Sequence, SupportsFloat, Tuple, TypeVar, Union)
 
 from .exporter import FllExporter
-from .norm import SNorm, TNorm
+from .norm import (AlgebraicProduct, AlgebraicSum, BoundedDifference, BoundedSum, DrasticProduct,
+                   DrasticSum, EinsteinProduct, EinsteinSum, HamacherProduct, HamacherSum, Maximum,
+                   Minimum, NilpotentMaximum, NilpotentMinimum, NormalizedSum, SNorm, TNorm,
+                   UnboundedSum)
 from .operation import Op
+from .state import State
+from .tracer import Tracer
 
 if typing.TYPE_CHECKING:
+    import numpy as np  # type: ignore # noqa: F401
     from .engine import Engine  # noqa F401
+    from .factory import FunctionFactory  # noqa F401
+    from .variable import Variable  # noqa F401
 
 
 class Term:
@@ -64,12 +73,24 @@ class Term:
       Attributes:
           name is the name of the term
           height is the height of the term
+          revision is the number of changes to the attributes of the terms (e.g., their
+          parameters), which invalidates the values of the terms computed beforehand (see
+          OutputVariable::table). The terms whose attributes change while processing the
+          engine (e.g., Activated) are not counted.
     """
 
+    __slots__ = ("name", "height")
+
+    revision = 0
+
     def __init__(self, name: str = "", height: float = 1.0) -> None:
         self.name = name
         self.height = height
 
+    def __setattr__(self, name: str, value: object) -> None:
+        object.__setattr__(self, name, value)
+        Term.revision += 1
+
     def __str__(self) -> str:
         """
          Returns the representation of the term in the FuzzyLite Language
@@ -123,6 +144,19 @@ class Term:
         """
         raise NotImplementedError()
 
+    def membership_array(self, xs: 'np.ndarray') -> 'np.ndarray':
+        r"""
+          Computes the membership function values at each of the values in the array. By
+          default, the scalar membership function is applied to each value, and subclasses
+          override this method to vectorize the computation. The vectorized computations
+          follow the same operations of the scalar membership function, but the exponential
+          and power functions in numpy may differ from those in math in the last digit.
+          :param xs is the array of values
+          :return the array of membership function values @f$\mu(x)@f$
+        """
+        import numpy as np  # type: ignore
+        return np.vectorize(self.membership, otypes=[float])(xs)  # type: ignore
+
     def update_reference(self, engine: Optional['Engine']) -> None:
         """
           Updates the references (if any) to point to the current engine (useful
@@ -147,6 +181,20 @@ class Term:
         """
         return self.membership(activation_degree)
 
+    def tsukamoto_array(self, activation_degree: 'np.ndarray', minimum: float,
+                        maximum: float) -> 'np.ndarray':
+        """
+          Computes the tsukamoto values of the term for each of the activation degrees in the
+          array. By default, Term::tsukamoto is applied to each activation degree.
+          :param activation_degree: is the array of activation degrees
+          :param minimum is the minimum value of the range of the term
+          :param maximum is the maximum value of the range of the term
+          :return the array of tsukamoto values
+        """
+        import numpy as np  # type: ignore
+        return np.vectorize(self.tsukamoto, otypes=[float])(  # type: ignore
+            activation_degree, minimum, maximum)
+
     def is_monotonic(self) -> bool:
         """
         Indicates whether the term is monotonic.
@@ -154,20 +202,40 @@ class Term:
         """
         return False
 
+    def support(self) -> Tuple[float, float]:
+        """
+        Gets the support of the term, that is, the interval outside of which the membership
+        function is zero. The support is empty when its start is greater than its end.
+          :return the start and end of the support, which is the real line by default.
+        """
+        return -inf, inf
+
+    def _support(self, start: float, end: float) -> Tuple[float, float]:
+        """
+        Returns the support from start to end, unbounded where start or end are nan, or the real
+        line if the height is not finite, in which case the membership function is not zero.
+        """
+        if not isfinite(self.height):
+            return -inf, inf
+        return -inf if isnan(start) else start, inf if isnan(end) else end
+
     def discretize(self, start: float, end: float, resolution: int = 100,
                    bounded_mf: bool = True) -> 'Discrete':
         result = Discrete(self.name)
         dx = (end - start) / resolution
-        for i in range(0, resolution + 1):
-            x = start + i * dx
-            y = self.membership(x)
-            if bounded_mf:
-                y = Op.bound(y, 0.0, 1.0)
-            result.xy.append(Discrete.Pair(x, y))
+        xs = [start + i * dx for i in range(0, resolution + 1)]
+        ys = [self.membership(x) for x in xs]
+        if bounded_mf:
+            ys = [Op.bound(y, 0.0, 1.0) for y in ys]
+        result.set_points(xs, ys)
         return result
 
 
 class Activated(Term):
+    __slots__ = ("term", "degree", "implication")
+
+    # the attributes change while processing the engine (see Term::revision)
+    __setattr__ = object.__setattr__
 
     def __init__(self, term: Term, degree: float = 1.0,
                  implication: Optional[TNorm] = None) -> None:
@@ -194,11 +262,63 @@ class Activated(Term):
         if not self.implication:
             raise ValueError("expected an implication operator, but none found")
         result = self.implication.compute(self.term.membership(x), self.degree)
-        logging.debug(f"{Op.str(result)}: {str(self)}")
+        if Tracer.active:
+            Tracer.active.trace(self, x, result)
         return result
 
+    def membership_array(self, xs: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        if not self.term:
+            raise ValueError("expected a term to activate, but none found")
+        if not self.implication:
+            raise ValueError("expected an implication operator, but none found")
+        # the degree is an array when processing a batch, which is broadcast against xs
+        result = self.implication.compute_array(self.term.membership_array(xs), self.degree)
+        return np.where(np.isnan(xs), nan, result)  # type: ignore
+
+    # the T-norms whose value is zero when either value is zero and the other is in [0, 1]
+    ZERO_PRESERVING = (AlgebraicProduct, BoundedDifference, DrasticProduct, EinsteinProduct,
+                       HamacherProduct, Minimum, NilpotentMinimum)
+
+    def support(self) -> Tuple[float, float]:
+        if not (self.term and type(self.implication) in Activated.ZERO_PRESERVING):
+            return -inf, inf
+        # the degree is an array when processing a batch
+        valid = (0.0 <= self.degree) & (self.degree <= 1.0)
+        if not (valid.all() if hasattr(valid, 'all') else valid):
+            return -inf, inf
+        return self.term.support()
+
 
 class Aggregated(Term):
+    __slots__ = ("minimum", "maximum", "aggregation", "_terms", "_index")
+
+    # the attributes change while processing the engine (see Term::revision)
+    __setattr__ = object.__setattr__
+
+    class Index:
+        """
+          The Index class indexes the activated terms of an aggregated term by their terms, as
+          the activated terms are added (see Aggregated::add_term).
+
+          Attributes:
+              count is the number of activated terms indexed
+              aggregation is the aggregation operator of the aggregated term when indexed
+              degrees is the activation degree of each term, accumulated with the aggregation
+              compacted is the activated term of each term and type of implication operator
+              into which the others are compacted (see Aggregated::add_term)
+        """
+        __slots__ = ("count", "aggregation", "degrees", "compacted")
+
+        def __init__(self, aggregation: Optional[SNorm]) -> None:
+            self.count = 0
+            self.aggregation = aggregation
+            self.degrees: Dict[Term, float] = {}
+            self.compacted: Dict[Tuple[Term, type], Activated] = {}
+
+    # the terms whose membership function values are never negative, which are compacted with
+    # the AlgebraicProduct implication, set once the terms are defined at the end of the module
+    NONNEGATIVE: Tuple[typing.Type[Term], ...] = ()
 
     def __init__(self, name: str = "", minimum: float = nan, maximum: float = nan,
                  aggregation: Optional[SNorm] = None,
@@ -207,9 +327,30 @@ class Aggregated(Term):
         self.minimum = minimum
         self.maximum = maximum
         self.aggregation = aggregation
-        self.terms: List[Activated] = []
+        self._terms: List[Activated] = []
         if terms:
-            self.terms.extend(terms)
+            self._terms.extend(terms)
+        self._index: Optional[Aggregated.Index] = None
+
+    @property
+    def terms(self) -> List[Activated]:
+        state = State.current.get() if State.bound else None
+        if state is None:
+            return self._terms
+        result = state.terms.get(self)
+        if result is None:
+            result = state.terms[self] = []
+        return result
+
+    @terms.setter
+    def terms(self, terms: List[Activated]) -> None:
+        state = State.current.get() if State.bound else None
+        if state is None:
+            self._terms = terms
+            self._index = None
+        else:
+            state.terms[self] = terms
+            state.indices[self] = None
 
     def parameters(self) -> str:
         result = []
@@ -234,18 +375,136 @@ class Aggregated(Term):
         result = 0.0
         for term in self.terms:
             result = self.aggregation.compute(result, term.membership(x))  # type: ignore
-        logging.debug(f"{Op.str(result)}: {str(self)}")
+        if Tracer.active:
+            Tracer.active.trace(self, x, result)
         return result
 
+    def membership_array(self, xs: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        if self.terms and not self.aggregation:
+            raise ValueError("expected an aggregation operator, but none found")
+
+        result = np.zeros(np.shape(xs))
+        for term in self.terms:
+            result = self.aggregation.compute_array(  # type: ignore
+                result, term.membership_array(xs))
+        return np.where(np.isnan(xs), nan, result)  # type: ignore
+
+    # the S-norms whose value is zero when both values are zero
+    ZERO_PRESERVING = (AlgebraicSum, BoundedSum, DrasticSum, EinsteinSum, HamacherSum, Maximum,
+                       NilpotentMaximum, NormalizedSum, UnboundedSum)
+
+    def support(self) -> Tuple[float, float]:
+        """
+        Gets the smallest interval that contains the supports of the activated terms, which is
+        empty (inf, -inf) when there are no activated terms
+        """
+        terms = self.terms
+        if terms and type(self.aggregation) not in Aggregated.ZERO_PRESERVING:
+            return -inf, inf
+        start, end = inf, -inf
+        for term in terms:
+            term_start, term_end = term.support()
+            if term_start <= term_end:
+                start, end = min(start, term_start), max(end, term_end)
+        return start, end
+
+    def compacts(self, activated: Activated) -> bool:
+        """
+        Gets whether the activated term can be compacted with the other activated terms of the
+        same term and implication operator into a single activated term whose activation degree
+        is the maximum of theirs, which yields the same membership function values. This is the
+        case when the aggregation operator is Maximum and the implication operator is Minimum,
+        or the implication operator is AlgebraicProduct and the membership function values of
+        the term are never negative (see Aggregated::NONNEGATIVE).
+        :param activated: is the activated term
+        :return: whether the activated term can be compacted
+        """
+        if not (type(self.aggregation) is Maximum and not isnan(activated.degree)):
+            return False
+        implication = type(activated.implication)
+        return implication is Minimum or (
+            implication is AlgebraicProduct and type(activated.term) in Aggregated.NONNEGATIVE
+            and activated.term.height >= 0.0)
+
+    def add_term(self, activated: Activated, compact: bool = False) -> None:
+        """
+        Adds the activated term, indexing its activation degree (see
+        Aggregated::activation_degree). When compacting, the activated term is compacted into
+        the activated term of the same term and implication operator added before, if any,
+        raising its activation degree instead of adding the activated term (see
+        Aggregated::compacts), so the number of activated terms is at most the number of terms.
+        The membership function values are the same, but not the activated terms, which matter
+        to the weighted defuzzifiers (see OutputVariable::compacts).
+        :param activated: is the activated term to add
+        :param compact: is whether to compact the activated term
+        """
+        terms = self.terms
+        index = self.index()
+        term = activated.term
+        if compact and self.compacts(activated):
+            key = (term, type(activated.implication))
+            compacted = index.compacted.get(key)
+            if compacted is not None:
+                compacted.degree = max(compacted.degree, activated.degree)
+                index.degrees[term] = self._accumulate(index.degrees[term], activated.degree)
+                return
+            index.compacted[key] = activated
+        terms.append(activated)
+        index.count += 1
+        index.degrees[term] = self._accumulate(index.degrees.get(term, 0.0), activated.degree)
+
     def activation_degree(self, term: Term) -> float:
-        result = 0.0
+        """
+        Gets the activation degree of the term, accumulated with the aggregation operator over
+        the activated terms of the term, or added up without an aggregation operator, which is
+        looked up in constant time from the index (see Aggregated::index)
+        :param term: is the term whose activation degree is looked up
+        :return: the activation degree of the term
+        """
+        return self.index().degrees.get(term, 0.0)
+
+    def index(self) -> 'Aggregated.Index':
+        """
+        Gets the index of the activated terms, which is updated as the activated terms are
+        added (see Aggregated::add_term), and created again when the activated terms are added
+        otherwise, when the list of activated terms is replaced, or when the aggregation
+        operator changes. Hence, the activated terms are not to be modified once added.
+        :return: the index of the activated terms
+        """
+        state = State.current.get() if State.bound else None
+        index = self._index if state is None else state.indices.get(self)
+        terms = self.terms
+        if index is None or index.count != len(terms) or index.aggregation is not self.aggregation:
+            index = Aggregated.Index(self.aggregation)
+            for activated in terms:
+                index.count += 1
+                index.degrees[activated.term] = self._accumulate(
+                    index.degrees.get(activated.term, 0.0), activated.degree)
+                if self.compacts(activated):
+                    index.compacted.setdefault((activated.term, type(activated.implication)),
+                                               activated)
+            if state is None:
+                self._index = index
+            else:
+                state.indices[self] = index
+        return index
+
+    def _accumulate(self, degree: float, activation_degree: float) -> float:
+        if self.aggregation:
+            return self.aggregation.compute(degree, activation_degree)
+        return degree + activation_degree
+
+    def activation_degree_array(self, term: Term) -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        result = np.asarray(0.0)
 
         for activation in self.terms:
             if activation.term == term:
                 if self.aggregation:
-                    result = self.aggregation.compute(result, activation.degree)
+                    result = self.aggregation.compute_array(result, activation.degree)
                 else:
-                    result += activation.degree
+                    result = result + activation.degree
 
         return result
 
@@ -260,9 +519,15 @@ class Aggregated(Term):
 
     def clear(self) -> None:
         self.terms.clear()
+        # the index is cleared instead of created again every time the engine is processed
+        index = self.index()
+        index.count = 0
+        index.degrees.clear()
+        index.compacted.clear()
 
 
 class Bell(Term):
+    __slots__ = ("center", "width", "slope")
 
     def __init__(self, name: str = "", center: float = nan, width: float = nan, slope: float = nan,
                  height: float = 1.0) -> None:
@@ -277,6 +542,14 @@ class Bell(Term):
         return self.height * (1.0 / (1.0 + (fabs((x - self.center) / self.width)
                                             ** (2.0 * self.slope))))
 
+    def membership_array(self, xs: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        xs = np.asarray(xs, dtype=float)
+        with np.errstate(all='ignore'):
+            result = self.height * (1.0 / (1.0 + (np.fabs((xs - self.center) / self.width)
+                                                  ** (2.0 * self.slope))))
+        return np.where(np.isnan(xs), nan, result)  # type: ignore
+
     def parameters(self) -> str:
         return super()._parameters(self.center, self.width, self.slope)
 
@@ -287,6 +560,7 @@ class Bell(Term):
 
 
 class Binary(Term):
+    __slots__ = ("start", "direction")
 
     def __init__(self, name: str = "", start: float = nan, direction: float = nan,
                  height: float = 1.0) -> None:
@@ -306,6 +580,22 @@ class Binary(Term):
 
         return self.height * 0.0
 
+    def membership_array(self, xs: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        xs = np.asarray(xs, dtype=float)
+        with np.errstate(all='ignore'):
+            result = np.where(((self.direction > self.start) & (xs >= self.start))
+                              | ((self.direction < self.start) & (xs <= self.start)),
+                              self.height * 1.0, self.height * 0.0)
+        return np.where(np.isnan(xs), nan, result)  # type: ignore
+
+    def support(self) -> Tuple[float, float]:
+        if self.direction > self.start:
+            return self._support(self.start, inf)
+        if self.direction < self.start:
+            return self._support(-inf, self.start)
+        return -inf, inf
+
     def parameters(self) -> str:
         return super()._parameters(self.start, self.direction)
 
@@ -316,6 +606,7 @@ class Binary(Term):
 
 
 class Concave(Term):
+    __slots__ = ("inflection", "end")
 
     def __init__(self, name: str = "", inflection: float = nan, end: float = nan,
                  height: float = 1.0) -> None:
@@ -339,6 +630,22 @@ class Concave(Term):
 
         return self.height * 1.0
 
+    def membership_array(self, xs: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        xs = np.asarray(xs, dtype=float)
+        with np.errstate(all='ignore'):
+            if self.inflection <= self.end:  # Concave increasing
+                result = np.where(xs < self.end,
+                                  (self.height * (self.end - self.inflection)
+                                   / (2.0 * self.end - self.inflection - xs)),
+                                  self.height * 1.0)
+            else:  # Concave decreasing
+                result = np.where(xs > self.end,
+                                  (self.height * (self.inflection - self.end)
+                                   / (self.inflection - 2.0 * self.end + xs)),
+                                  self.height * 1.0)
+        return np.where(np.isnan(xs), nan, result)  # type: ignore
+
     def is_monotonic(self) -> bool:
         return True
 
@@ -357,6 +664,7 @@ class Concave(Term):
 
 
 class Constant(Term):
+    __slots__ = ("value",)
 
     def __init__(self, name: str = "", value: float = nan) -> None:
         super().__init__(name)
@@ -365,6 +673,10 @@ class Constant(Term):
     def membership(self, x: float) -> float:
         return self.value
 
+    def membership_array(self, xs: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        return np.full(np.shape(xs), self.value)  # type: ignore
+
     def parameters(self) -> str:
         return super()._parameters(self.value)
 
@@ -377,6 +689,7 @@ class Constant(Term):
 
 
 class Cosine(Term):
+    __slots__ = ("center", "width")
 
     def __init__(self, name: str = "", center: float = nan, width: float = nan,
                  height: float = 1.0) -> None:
@@ -393,6 +706,20 @@ class Cosine(Term):
 
         return self.height * 0.5 * (1.0 + cos(2.0 / self.width * pi * (x - self.center)))
 
+    def membership_array(self, xs: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        xs = np.asarray(xs, dtype=float)
+        with np.errstate(all='ignore'):
+            result = np.where((xs < self.center - 0.5 * self.width)
+                              | (xs > self.center + 0.5 * self.width),
+                              self.height * 0.0,
+                              self.height * 0.5 * (1.0 + np.cos(2.0 / self.width * pi
+                                                                * (xs - self.center))))
+        return np.where(np.isnan(xs), nan, result)  # type: ignore
+
+    def support(self) -> Tuple[float, float]:
+        return self._support(self.center - 0.5 * self.width, self.center + 0.5 * self.width)
+
     def parameters(self) -> str:
         return super()._parameters(self.center, self.width)
 
@@ -403,7 +730,10 @@ class Cosine(Term):
 
 
 class Discrete(Term):
+    __slots__ = ("_x", "_y")
+
     class Pair:
+        __slots__ = ("x", "y")
 
         def __init__(self, x: float = nan, y: float = nan) -> None:
             self.x = x
@@ -462,45 +792,212 @@ class Discrete(Term):
         def values(self, xy: Tuple[float, float]) -> None:
             self.x, self.y = xy
 
+    class PairView(Pair):
+        """
+          The PairView class is the pair at a position of the points of a Discrete term, which
+          reads and writes the values of x and y in the arrays of the term, so changing the
+          values of the pair changes the term.
+        """
+
+        __slots__ = ("term", "index")
+
+        def __init__(self, term: 'Discrete', index: int) -> None:
+            self.term = term
+            self.index = index
+
+        @property  # type: ignore
+        def x(self) -> float:  # type: ignore
+            return self.term._x[self.index]
+
+        @x.setter
+        def x(self, x: float) -> None:
+            self.term._x[self.index] = x
+            Term.revision += 1
+
+        @property  # type: ignore
+        def y(self) -> float:  # type: ignore
+            return self.term._y[self.index]
+
+        @y.setter
+        def y(self, y: float) -> None:
+            self.term._y[self.index] = y
+            Term.revision += 1
+
+    class Pairs(MutableSequence['Discrete.Pair']):
+        """
+          The Pairs class is the view of the points of a Discrete term as a list of pairs,
+          which reads and writes the arrays of the term. The pairs are views of the points at
+          their positions (see Discrete::PairView), so changing the values of a pair changes
+          the term. A new view is created every time it is accessed (see Discrete::xy), and
+          inserting or deleting a pair moves the values after it in both arrays, so many
+          points are better set at once (see Discrete::set_points) or appended at once (see
+          Discrete.Pairs::extend).
+        """
+
+        __slots__ = ("term",)
+
+        def __init__(self, term: 'Discrete') -> None:
+            self.term = term
+
+        def __len__(self) -> int:
+            return len(self.term._x)
+
+        @typing.overload
+        def __getitem__(self, index: int) -> 'Discrete.Pair':
+            pass
+
+        @typing.overload  # noqa: F811
+        def __getitem__(self, index: slice) -> List['Discrete.Pair']:
+            pass
+
+        def __getitem__(self, index):  # type: ignore # noqa: F811
+            if isinstance(index, slice):
+                return [Discrete.PairView(self.term, i)
+                        for i in range(*index.indices(len(self.term._x)))]
+            size = len(self.term._x)
+            if not -size <= index < size:
+                raise IndexError("list index out of range")
+            return Discrete.PairView(self.term, index % size)
+
+        def __setitem__(self, index, pair):  # type: ignore
+            if isinstance(index, slice):
+                pairs = list(pair)
+                self.term._x[index] = array('d', [p.x for p in pairs])
+                self.term._y[index] = array('d', [p.y for p in pairs])
+            else:
+                self.term._x[index], self.term._y[index] = pair.values
+            Term.revision += 1
+
+        def __delitem__(self, index):  # type: ignore
+            del self.term._x[index]
+            del self.term._y[index]
+            Term.revision += 1
+
+        def __eq__(self, other: object) -> bool:
+            return list(self) == other
+
+        def __str__(self) -> str:
+            return str([str(pair) for pair in self])
+
+        def insert(self, index: int, pair: 'Discrete.Pair') -> None:
+            x, y = pair.values
+            self.term._x.insert(index, x)
+            self.term._y.insert(index, y)
+            Term.revision += 1
+
+        def append(self, pair: 'Discrete.Pair') -> None:
+            x, y = pair.values
+            self.term._x.append(x)
+            self.term._y.append(y)
+            Term.revision += 1
+
+        def extend(self, pairs: Iterable['Discrete.Pair']) -> None:
+            values = [pair.values for pair in pairs]
+            self.term._x.extend(x for x, _ in values)
+            self.term._y.extend(y for _, y in values)
+            Term.revision += 1
+
+        def sort(self) -> None:
+            self.term.sort()
+
     def __init__(self, name: str = "", xy: Optional[Iterable[Pair]] = None,
                  height: float = 1.0) -> None:
         super().__init__(name, height)
-        self.xy: List[Discrete.Pair] = []
+        # the points are kept in two arrays of floats, which are bisected natively
+        self._x = array('d')
+        self._y = array('d')
         if xy:
-            self.xy.extend(xy)
+            self.xy = xy  # type: ignore
 
     def __iter__(self) -> Iterator['Discrete.Pair']:
         return iter(self.xy)
 
+    @property
+    def xy(self) -> 'Discrete.Pairs':
+        """
+        Gets the points of the term as a list of pairs, which is a new view of the arrays of
+        the term every time (see Discrete::Pairs)
+        """
+        return Discrete.Pairs(self)
+
+    @xy.setter
+    def xy(self, pairs: Iterable['Discrete.Pair']) -> None:
+        pairs = list(pairs)
+        self.set_points((pair.x for pair in pairs), (pair.y for pair in pairs))
+
+    def set_points(self, x: Iterable[float], y: Iterable[float]) -> None:
+        """
+        Sets the points of the term from the values of x and y, without creating pairs
+        :param x: is the values of x, sorted in ascending order
+        :param y: is the values of y
+        """
+        x_values, y_values = array('d', x), array('d', y)
+        if len(x_values) != len(y_values):
+            raise ValueError(f"expected the same number of values of x and y, but found "
+                             f"{len(x_values)} values of x and {len(y_values)} values of y")
+        self._x, self._y = x_values, y_values
+
     def membership(self, x: float) -> float:
         if isnan(x):
             return nan
 
-        if not self.xy:
+        x_values, y_values = self._x, self._y
+        if not x_values:
             raise ValueError("expected a list of (x,y)-pairs, but found none")
 
-        if x <= self.xy[0].x:
-            return self.height * self.xy[0].y
+        if x <= x_values[0]:
+            return self.height * y_values[0]
+
+        if x >= x_values[-1]:
+            return self.height * y_values[-1]
 
-        if x >= self.xy[-1].x:
-            return self.height * self.xy[-1].y
+        # equivalent to bisect.bisect(self.xy, (x, -inf)) on the sorted pairs
+        index = bisect.bisect_left(x_values, x)
 
-        index = bisect.bisect(self.xy, (x, -inf))
+        upper_x = x_values[index]
+        if Op.eq(x, upper_x):
+            return self.height * y_values[index]
 
-        upper_bound = self.xy[index]
-        if Op.eq(x, upper_bound.x):
-            return self.height * upper_bound.y
+        return self.height * Op.scale(x, x_values[index - 1], upper_x,
+                                      y_values[index - 1], y_values[index])
 
-        lower_bound = self.xy[index - 1]
+    def membership_array(self, xs: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        xs = np.asarray(xs, dtype=float)
 
-        return self.height * Op.scale(x, lower_bound.x, upper_bound.x, lower_bound.y, upper_bound.y)
+        if not self._x:
+            raise ValueError("expected a list of (x,y)-pairs, but found none")
+
+        # the arrays of the term are shared with numpy without copying them
+        x = np.frombuffer(self._x, dtype=float)
+        y = np.frombuffer(self._y, dtype=float)
+        index = np.clip(np.searchsorted(x, xs, side='left'), 1, len(x) - 1)
+        upper_x, upper_y = x[index], y[index]
+        lower_x, lower_y = x[index - 1], y[index - 1]
+        with np.errstate(all='ignore'):
+            result = np.select(
+                [xs <= x[0], xs >= x[-1], Op.eq_array(xs, upper_x)],
+                [self.height * y[0], self.height * y[-1], self.height * upper_y],
+                self.height * Op.scale(xs, lower_x, upper_x, lower_y, upper_y))
+        return np.where(np.isnan(xs), nan, result)  # type: ignore
 
     def tsukamoto(self, activation_degree: float, minimum: float, maximum: float) -> float:
         # todo: approximate tsukamoto
         pass
 
+    def support(self) -> Tuple[float, float]:
+        nonzero = [i for i, y in enumerate(self._y) if y != 0.0]
+        if not nonzero:
+            return -inf, inf
+        first, last = nonzero[0], nonzero[-1]
+        return self._support(self._x[first - 1] if first > 0 else -inf,
+                             self._x[last + 1] if last + 1 < len(self._x) else inf)
+
     def parameters(self) -> str:
-        return super()._parameters(*Discrete.values_from(self.xy))
+        values: List[float] = []
+        for x, y in zip(self._x, self._y):
+            values.extend((x, y))
+        return super()._parameters(*values)
 
     def configure(self, parameters: str) -> None:
         values = [Op.scalar(x) for x in parameters.split()]
@@ -510,16 +1007,17 @@ class Discrete(Term):
             self.height = values[-1]
             del values[-1]
 
-        self.xy = Discrete.pairs_from(values)
+        self.set_points(values[0::2], values[1::2])
 
     def x(self) -> Iterable[float]:
-        return (pair.x for pair in self.xy)
+        return iter(self._x)
 
     def y(self) -> Iterable[float]:
-        return (pair.y for pair in self.xy)
+        return iter(self._y)
 
     def sort(self) -> None:
-        self.xy.sort()
+        order = sorted(range(len(self._x)), key=lambda i: (self._x[i], self._y[i]))
+        self.set_points((self._x[i] for i in order), (self._y[i] for i in order))
 
     Floatable = TypeVar("Floatable", SupportsFloat, str, bytes)
 
@@ -552,6 +1050,7 @@ class Discrete(Term):
 
 
 class Gaussian(Term):
+    __slots__ = ("mean", "standard_deviation")
 
     def __init__(self, name: str = "", mean: float = nan, standard_deviation: float = nan,
                  height: float = 1.0) -> None:
@@ -565,6 +1064,15 @@ class Gaussian(Term):
         return self.height * exp((-(x - self.mean) * (x - self.mean))
                                  / (2.0 * self.standard_deviation * self.standard_deviation))
 
+    def membership_array(self, xs: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        xs = np.asarray(xs, dtype=float)
+        with np.errstate(all='ignore'):
+            result = self.height * np.exp(
+                (-(xs - self.mean) * (xs - self.mean))
+                / (2.0 * self.standard_deviation * self.standard_deviation))
+        return np.where(np.isnan(xs), nan, result)  # type: ignore
+
     def parameters(self) -> str:
         return super()._parameters(self.mean, self.standard_deviation)
 
@@ -575,6 +1083,7 @@ class Gaussian(Term):
 
 
 class GaussianProduct(Term):
+    __slots__ = ("mean_a", "standard_deviation_a", "mean_b", "standard_deviation_b")
 
     def __init__(self, name: str = "", mean_a: float = nan, standard_deviation_a: float = nan,
                  mean_b: float = nan, standard_deviation_b: float = nan,
@@ -601,6 +1110,21 @@ class GaussianProduct(Term):
 
         return self.height * a * b
 
+    def membership_array(self, xs: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        xs = np.asarray(xs, dtype=float)
+        with np.errstate(all='ignore'):
+            a = np.where(xs < self.mean_a,
+                         np.exp((-(xs - self.mean_a) * (xs - self.mean_a))
+                                / (2.0 * self.standard_deviation_a * self.standard_deviation_a)),
+                         1.0)
+            b = np.where(xs > self.mean_b,
+                         np.exp((-(xs - self.mean_b) * (xs - self.mean_b))
+                                / (2.0 * self.standard_deviation_b * self.standard_deviation_b)),
+                         1.0)
+            result = self.height * a * b
+        return np.where(np.isnan(xs), nan, result)  # type: ignore
+
     def parameters(self) -> str:
         return super()._parameters(self.mean_a, self.standard_deviation_a,
                                    self.mean_b, self.standard_deviation_b)
@@ -612,6 +1136,7 @@ class GaussianProduct(Term):
 
 
 class Linear(Term):
+    __slots__ = ("coefficients", "engine")
 
     def __init__(self, name: str = "", coefficients: Optional[Iterable[float]] = None,
                  engine: Optional['Engine'] = None) -> None:
@@ -636,6 +1161,11 @@ class Linear(Term):
 
         return result
 
+    def membership_array(self, xs: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        # the values of the input variables are arrays when processing a batch
+        return self.membership(nan) + np.zeros(np.shape(xs))  # type: ignore
+
     def configure(self, parameters: str) -> None:
         self.coefficients = [Op.scalar(p) for p in parameters.split()]
 
@@ -647,6 +1177,7 @@ class Linear(Term):
 
 
 class PiShape(Term):
+    __slots__ = ("bottom_left", "top_left", "top_right", "bottom_right")
 
     def __init__(self, name: str = "", bottom_left: float = nan, top_left: float = nan,
                  top_right: float = nan, bottom_right: float = nan, height: float = 1.0) -> None:
@@ -680,6 +1211,34 @@ class PiShape(Term):
 
         return self.height * s_shape * z_shape
 
+    def membership_array(self, xs: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        xs = np.asarray(xs, dtype=float)
+        with np.errstate(all='ignore'):
+            s_shape = np.select(
+                [xs <= self.bottom_left,
+                 xs <= 0.5 * (self.bottom_left + self.top_left),
+                 xs < self.top_left],
+                [0.0,
+                 2.0 * ((xs - self.bottom_left) / (self.top_left - self.bottom_left)) ** 2,
+                 1.0 - 2.0 * ((xs - self.top_left) / (self.top_left - self.bottom_left)) ** 2],
+                1.0)
+            z_shape = np.select(
+                [xs <= self.top_right,
+                 xs <= 0.5 * (self.top_right + self.bottom_right),
+                 xs < self.bottom_right],
+                [1.0,
+                 1.0 - 2.0 * ((xs - self.top_right) / (self.bottom_right - self.top_right)) ** 2,
+                 2.0 * ((xs - self.bottom_right) / (self.bottom_right - self.top_right)) ** 2],
+                0.0)
+            result = self.height * s_shape * z_shape
+        return np.where(np.isnan(xs), nan, result)  # type: ignore
+
+    def support(self) -> Tuple[float, float]:
+        if not self.bottom_left <= self.top_left <= self.top_right <= self.bottom_right:
+            return -inf, inf
+        return self._support(self.bottom_left, self.bottom_right)
+
     def parameters(self) -> str:
         return super()._parameters(self.bottom_left, self.top_left,
                                    self.top_right, self.bottom_right)
@@ -691,6 +1250,7 @@ class PiShape(Term):
 
 
 class Ramp(Term):
+    __slots__ = ("start", "end")
 
     def __init__(self, name: str = "", start: float = nan, end: float = nan,
                  height: float = 1.0) -> None:
@@ -719,6 +1279,31 @@ class Ramp(Term):
                 return self.height * 1.0
             return self.height * (self.start - x) / (self.start - self.end)
 
+    def membership_array(self, xs: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        xs = np.asarray(xs, dtype=float)
+        with np.errstate(all='ignore'):
+            if self.start == self.end:
+                result = np.full(xs.shape, self.height * 0.0)
+            elif self.start < self.end:
+                result = np.select(
+                    [xs <= self.start, xs >= self.end],
+                    [self.height * 0.0, self.height * 1.0],
+                    self.height * (xs - self.start) / (self.end - self.start))
+            else:
+                result = np.select(
+                    [xs >= self.start, xs <= self.end],
+                    [self.height * 0.0, self.height * 1.0],
+                    self.height * (self.start - xs) / (self.start - self.end))
+        return np.where(np.isnan(xs), nan, result)  # type: ignore
+
+    def support(self) -> Tuple[float, float]:
+        if self.start < self.end:
+            return self._support(self.start, inf)
+        if self.start > self.end:
+            return self._support(-inf, self.start)
+        return -inf, inf
+
     def is_monotonic(self) -> bool:
         return True
 
@@ -737,6 +1322,7 @@ class Ramp(Term):
 
 
 class Rectangle(Term):
+    __slots__ = ("start", "end")
 
     def __init__(self, name: str = "", start: float = nan, end: float = nan,
                  height: float = 1.0) -> None:
@@ -753,6 +1339,17 @@ class Rectangle(Term):
 
         return self.height * 0.0
 
+    def membership_array(self, xs: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        xs = np.asarray(xs, dtype=float)
+        with np.errstate(all='ignore'):
+            result = np.where((self.start <= xs) & (xs <= self.end),
+                              self.height * 1.0, self.height * 0.0)
+        return np.where(np.isnan(xs), nan, result)  # type: ignore
+
+    def support(self) -> Tuple[float, float]:
+        return self._support(self.start, self.end)
+
     def parameters(self) -> str:
         return super()._parameters(self.start, self.end)
 
@@ -764,6 +1361,7 @@ class Rectangle(Term):
 
 # TODO: Tsukamoto
 class Sigmoid(Term):
+    __slots__ = ("inflection", "slope")
 
     def __init__(self, name: str = "", inflection: float = nan, slope: float = nan,
                  height: float = 1.0) -> None:
@@ -776,6 +1374,13 @@ class Sigmoid(Term):
             return nan
         return self.height * 1.0 / (1.0 + exp(-self.slope * (x - self.inflection)))
 
+    def membership_array(self, xs: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        xs = np.asarray(xs, dtype=float)
+        with np.errstate(all='ignore'):
+            result = self.height * 1.0 / (1.0 + np.exp(-self.slope * (xs - self.inflection)))
+        return np.where(np.isnan(xs), nan, result)  # type: ignore
+
     def is_monotonic(self) -> bool:
         return True
 
@@ -789,6 +1394,7 @@ class Sigmoid(Term):
 
 
 class SigmoidDifference(Term):
+    __slots__ = ("left", "rising", "falling", "right")
 
     def __init__(self, name: str = "", left: float = nan, rising: float = nan,
                  falling: float = nan, right: float = nan, height: float = 1.0) -> None:
@@ -807,6 +1413,15 @@ class SigmoidDifference(Term):
 
         return self.height * fabs(a - b)
 
+    def membership_array(self, xs: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        xs = np.asarray(xs, dtype=float)
+        with np.errstate(all='ignore'):
+            a = 1.0 / (1.0 + np.exp(-self.rising * (xs - self.left)))
+            b = 1.0 / (1.0 + np.exp(-self.falling * (xs - self.right)))
+            result = self.height * np.fabs(a - b)
+        return np.where(np.isnan(xs), nan, result)  # type: ignore
+
     def parameters(self) -> str:
         return super()._parameters(self.left, self.rising, self.falling, self.right)
 
@@ -817,6 +1432,7 @@ class SigmoidDifference(Term):
 
 
 class SigmoidProduct(Term):
+    __slots__ = ("left", "rising", "falling", "right")
 
     def __init__(self, name: str = "", left: float = nan, rising: float = nan,
                  falling: float = nan, right: float = nan, height: float = 1.0) -> None:
@@ -835,6 +1451,15 @@ class SigmoidProduct(Term):
 
         return self.height * 1.0 / (a * b)
 
+    def membership_array(self, xs: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        xs = np.asarray(xs, dtype=float)
+        with np.errstate(all='ignore'):
+            a = 1.0 + np.exp(-self.rising * (xs - self.left))
+            b = 1.0 + np.exp(-self.falling * (xs - self.right))
+            result = self.height * 1.0 / (a * b)
+        return np.where(np.isnan(xs), nan, result)  # type: ignore
+
     def parameters(self) -> str:
         return super()._parameters(self.left, self.rising, self.falling, self.right)
 
@@ -845,6 +1470,7 @@ class SigmoidProduct(Term):
 
 
 class Spike(Term):
+    __slots__ = ("center", "width")
 
     def __init__(self, name: str = "", inflection: float = nan, slope: float = nan,
                  height: float = 1.0) -> None:
@@ -857,6 +1483,13 @@ class Spike(Term):
             return nan
         return self.height * exp(-fabs(10.0 / self.width * (x - self.center)))
 
+    def membership_array(self, xs: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        xs = np.asarray(xs, dtype=float)
+        with np.errstate(all='ignore'):
+            result = self.height * np.exp(-np.fabs(10.0 / self.width * (xs - self.center)))
+        return np.where(np.isnan(xs), nan, result)  # type: ignore
+
     def parameters(self) -> str:
         return super()._parameters(self.center, self.width)
 
@@ -868,6 +1501,7 @@ class Spike(Term):
 
 # TODO: Tsukamoto
 class SShape(Term):
+    __slots__ = ("start", "end")
 
     def __init__(self, name: str = "", start: float = nan, end: float = nan,
                  height: float = 1.0) -> None:
@@ -890,6 +1524,23 @@ class SShape(Term):
 
         return self.height * 1.0
 
+    def membership_array(self, xs: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        xs = np.asarray(xs, dtype=float)
+        with np.errstate(all='ignore'):
+            result = np.select(
+                [xs <= self.start,
+                 xs <= 0.5 * (self.start + self.end),
+                 xs < self.end],
+                [self.height * 0.0,
+                 self.height * 2.0 * ((xs - self.start) / (self.end - self.start)) ** 2,
+                 self.height * (1.0 - 2.0 * ((xs - self.end) / (self.end - self.start)) ** 2)],
+                self.height * 1.0)
+        return np.where(np.isnan(xs), nan, result)  # type: ignore
+
+    def support(self) -> Tuple[float, float]:
+        return self._support(self.start, inf)
+
     def is_monotonic(self) -> bool:
         return True
 
@@ -903,6 +1554,7 @@ class SShape(Term):
 
 
 class Trapezoid(Term):
+    __slots__ = ("vertex_a", "vertex_b", "vertex_c", "vertex_d")
 
     def __init__(self, name: str = "", vertex_a: float = nan, vertex_b: float = nan,
                  vertex_c: float = nan, vertex_d: float = nan, height: float = 1.0) -> None:
@@ -939,6 +1591,27 @@ class Trapezoid(Term):
 
         return self.height * 0.0
 
+    def membership_array(self, xs: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        xs = np.asarray(xs, dtype=float)
+        with np.errstate(all='ignore'):
+            result = np.select(
+                [(xs < self.vertex_a) | (xs > self.vertex_d),
+                 xs < self.vertex_b,
+                 (self.vertex_b <= xs) & (xs <= self.vertex_c),
+                 xs > self.vertex_c],
+                [self.height * 0.0,
+                 self.height * 1.0 if self.vertex_a == -inf
+                 else self.height * (xs - self.vertex_a) / (self.vertex_b - self.vertex_a),
+                 self.height * 1.0,
+                 self.height * 1.0 if self.vertex_d == inf
+                 else self.height * (self.vertex_d - xs) / (self.vertex_d - self.vertex_c)],
+                self.height * 0.0)
+        return np.where(np.isnan(xs), nan, result)  # type: ignore
+
+    def support(self) -> Tuple[float, float]:
+        return self._support(self.vertex_a, self.vertex_d)
+
     def parameters(self) -> str:
         return super()._parameters(self.vertex_a, self.vertex_b, self.vertex_c, self.vertex_d)
 
@@ -949,6 +1622,7 @@ class Trapezoid(Term):
 
 
 class Triangle(Term):
+    __slots__ = ("vertex_a", "vertex_b", "vertex_c")
 
     def __init__(self, name: str = "", vertex_a: float = nan, vertex_b: float = nan,
                  vertex_c: float = nan, height: float = 1.0) -> None:
@@ -982,6 +1656,27 @@ class Triangle(Term):
 
         return self.height * 0.0
 
+    def membership_array(self, xs: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        xs = np.asarray(xs, dtype=float)
+        with np.errstate(all='ignore'):
+            result = np.select(
+                [(xs < self.vertex_a) | (xs > self.vertex_c),
+                 xs < self.vertex_b,
+                 xs == self.vertex_b,
+                 xs > self.vertex_b],
+                [self.height * 0.0,
+                 self.height * 1.0 if self.vertex_a == -inf
+                 else self.height * (xs - self.vertex_a) / (self.vertex_b - self.vertex_a),
+                 self.height * 1.0,
+                 self.height * 1.0 if self.vertex_c == inf
+                 else self.height * (self.vertex_c - xs) / (self.vertex_c - self.vertex_b)],
+                self.height * 0.0)
+        return np.where(np.isnan(xs), nan, result)  # type: ignore
+
+    def support(self) -> Tuple[float, float]:
+        return self._support(self.vertex_a, self.vertex_c)
+
     def parameters(self) -> str:
         return super()._parameters(self.vertex_a, self.vertex_b, self.vertex_c)
 
@@ -993,6 +1688,7 @@ class Triangle(Term):
 
 # TODO: Tsukamoto
 class ZShape(Term):
+    __slots__ = ("start", "end")
 
     def __init__(self, name: str = "", start: float = nan, end: float = nan,
                  height: float = 1.0) -> None:
@@ -1015,6 +1711,24 @@ class ZShape(Term):
 
         return self.height * 0.0
 
+    def membership_array(self, xs: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np  # type: ignore
+        xs = np.asarray(xs, dtype=float)
+        with np.errstate(all='ignore'):
+            result = np.select(
+                [xs <= self.start,
+                 xs <= 0.5 * (self.start + self.end),
+                 xs < self.end],
+                [self.height * 1.0,
+                 self.height * (1.0 - 2.0 * ((xs - self.start) / (self.end - self.start)) ** 2),
+                 self.height * 2.0 * ((xs - self.end) / (self.end - self.start)) ** 2],
+                self.height * 0.0)
+        return np.where(np.isnan(xs), nan, result)  # type: ignore
+
+    def support(self) -> Tuple[float, float]:
+        # the membership function is one up to the start when the start is after the end
+        return self._support(-inf, self.end if self.start <= self.end else self.start)
+
     def is_monotonic(self) -> bool:
         return True
 
@@ -1028,7 +1742,15 @@ class ZShape(Term):
 
 
 class Function(Term):
+    __slots__ = ("root", "formula", "engine", "variables", "_compiled", "_bindings")
+
+    # the attributes change while processing the engine (see Term::revision)
+    __setattr__ = object.__setattr__
+
     class Element:
+        __slots__ = ("name", "description", "type", "method", "arity", "precedence",
+                     "associativity", "method_array")
+
         @enum.unique
         class Type(enum.Enum):
             Operator, Function = range(2)
@@ -1036,7 +1758,13 @@ class Function(Term):
         def __init__(self, name: str, description: str, type: 'Function.Element.Type',
                      method: Callable[..., float],
                      arity: int = 0, precedence: int = 0,
-                     associativity: int = -1) -> None:
+                     associativity: int = -1,
+                     method_array: Optional[Callable[..., 'np.ndarray']] = None) -> None:
+            """
+            Creates the element
+            :param method_array: is the method computing the element element-wise on (broadcast)
+            arrays, or None to apply the method to each value (see Function.Node::evaluate_array)
+            """
             self.name = name
             self.description = description
             self.type = type
@@ -1044,6 +1772,7 @@ class Function(Term):
             self.arity = Op.arity_of(method) if arity < 0 else arity
             self.precedence = precedence
             self.associativity = associativity
+            self.method_array = method_array
 
         def __str__(self) -> str:
             result = [f"name='{self.name}'",
@@ -1062,6 +1791,7 @@ class Function(Term):
             return self.type == Function.Element.Type.Operator
 
     class Node(object):
+        __slots__ = ("element", "variable", "constant", "left", "right")
 
         def __init__(self, element: Optional['Function.Element'] = None,
                      variable: str = "", constant: float = nan,
@@ -1119,6 +1849,52 @@ class Function(Term):
 
             return result
 
+        def evaluate_array(self, local_variables: Optional[Dict[str, 'np.ndarray']] = None
+                           ) -> 'np.ndarray':
+            """
+            Evaluates the node element-wise on the (broadcast) arrays of the variables, computing
+            the elements with their methods on arrays (or, if an element has none, applying its
+            method to each value)
+            :param local_variables: is the map of arrays of the variables
+            :return: the array of values of the node, or a scalar if the node has no variables
+            """
+            import numpy as np  # type: ignore
+            if self.element:
+                if not self.element.method:
+                    raise ValueError("expected a method reference, but found none")
+                arity = self.element.arity
+                method = self.element.method_array
+                if not method:
+                    method = (self.element.method if arity == 0 else
+                              np.vectorize(self.element.method, otypes=[float]))
+                if arity == 0:
+                    return method()
+                if arity == 1:
+                    if not self.right:
+                        raise ValueError("expected a right node, but found none")
+                    result = method(self.right.evaluate_array(local_variables))
+                elif arity == 2:
+                    if not self.right:
+                        raise ValueError("expected a right node, but found none")
+                    if not self.left:
+                        raise ValueError("expected a left node, but found none")
+                    result = method(self.left.evaluate_array(local_variables),
+                                    self.right.evaluate_array(local_variables))
+                else:
+                    return nan
+                # the comparisons and logical operators result in booleans, on which numpy
+                # computes in half precision (e.g., exp(gt(x, 1))), so they become floats
+                if getattr(result, "dtype", None) == bool:
+                    result = result.astype(float)
+                return result
+            if self.variable:
+                if not local_variables or self.variable not in local_variables:
+                    raise ValueError(
+                        f"expected a map of variables containing the value for '{self.variable}', "
+                        f"but the map contains: {local_variables}")
+                return local_variables[self.variable]
+            return self.constant
+
         def prefix(self, node: Optional['Function.Node'] = None) -> str:
             if not node:
                 return self.prefix(self)
@@ -1177,6 +1953,153 @@ class Function(Term):
             result.append(node.value())
             return " ".join(result)
 
+    class Compiler:
+        """
+          The Compiler class compiles the tree of a Function into a Python function that evaluates
+          the formula without walking the tree. The compiled function calls the same methods of
+          the elements in the same order as Function.Node::evaluate does, and hence computes the
+          same values, except that the subtrees without variables are computed once when
+          compiling (but for the methods in Function.Compiler::UNFOLDED), and the subtrees
+          repeated in the tree are computed once per evaluation. The tree is not modified, so the
+          formula is still exported as written.
+        """
+        __slots__ = ("namespace", "variables", "statements", "keys", "counts", "computed")
+
+        # the methods of the operators computed inline, which compute the same values as calling
+        # the methods
+        INLINE: Dict[Callable[..., float], str] = {
+            operator.add: "({0} + {1})", operator.sub: "({0} - {1})",
+            operator.mul: "({0} * {1})", operator.truediv: "({0} / {1})",
+            operator.mod: "({0} % {1})", operator.pow: "({0} ** {1})",
+            operator.neg: "(-{0})", operator.pos: "(+{0})", operator.not_: "(not {0})"}
+
+        # the methods not computed when compiling, which compare values within lib.abs_tolerance
+        UNFOLDED = {Op.eq, Op.neq, Op.gt, Op.ge, Op.le, Op.lt, Op.logical_and, Op.logical_or}
+
+        # the maximum nesting of the expressions, which are otherwise computed in statements
+        # because the Python parser limits the nesting of parentheses
+        NESTING = 50
+
+        def __init__(self) -> None:
+            self.namespace: Dict[str, object] = {}
+            self.variables: Dict[str, str] = {}
+            self.statements: List[str] = []
+            self.keys: Dict[int, Tuple[object, ...]] = {}
+            self.counts: Dict[Tuple[object, ...], int] = {}
+            self.computed: Dict[Tuple[object, ...], str] = {}
+
+        def compile(self, root: 'Function.Node',
+                    filename: str) -> Callable[[Dict[str, float]], float]:
+            """
+            Compiles the tree into a Python function
+            :param root: is the root of the tree
+            :param filename: is the name shown in the tracebacks of the compiled function
+            :return: the Python function that evaluates the tree given the map of variables
+            """
+            self.key(root)
+            result, _, _ = self.source(root)
+            # the variables are read first, so missing variables are reported by the tree
+            lines = (["def evaluate(variables):"]
+                     + [f"{local} = variables[{name!r}]" for name, local in self.variables.items()]
+                     + self.statements + [f"return {result}"])
+            exec(compile("\n    ".join(lines), filename, "exec"), self.namespace)
+            return typing.cast(Callable[[Dict[str, float]], float], self.namespace["evaluate"])
+
+        def key(self, node: 'Function.Node') -> Tuple[object, ...]:
+            """
+            Computes the keys identifying the subtrees of the tree, and counts their occurrences
+            :param node: is the node of the subtree
+            :return: the key identifying the subtree
+            """
+            if node.element:
+                children = (node.left, node.right) if node.element.arity == 2 else (node.right,)
+                key: Tuple[object, ...] = (node.element.method,
+                                           *(self.key(child) for child in children if child))
+                self.counts[key] = self.counts.get(key, 0) + 1
+            elif node.variable:
+                key = ("variable", node.variable)
+            else:
+                key = ("constant", type(node.constant), repr(node.constant))
+            self.keys[id(node)] = key
+            return key
+
+        def source(self,  # noqa: C901 'Function.Compiler.source' is too complex (16)
+                   node: 'Function.Node') -> Tuple[str, Optional[List[object]], int]:
+            """
+            Creates the expression computing the node, appending to the statements of the
+            compiled function the subtrees computed once per evaluation
+            :param node: is the node of the subtree
+            :return: the expression computing the node, the value of the node in a list if the
+            subtree has no variables, and the nesting of the expression
+            """
+            if node.variable and not node.element:
+                if node.variable not in self.variables:
+                    self.variables[node.variable] = f"v{len(self.variables)}"
+                return self.variables[node.variable], None, 0
+            if not node.element:
+                return self.constant(node.constant)
+
+            element = node.element
+            if not element.method or element.arity not in (0, 1, 2):
+                raise ValueError(f"cannot compile element '{element.name}'")
+            if (element.arity == 2 and not node.left) or (element.arity >= 1 and not node.right):
+                raise ValueError(f"cannot compile element '{element.name}' without its nodes")
+            key = self.keys[id(node)]
+            if key in self.computed:
+                return self.computed[key], None, 0
+
+            children: List[Tuple[str, Optional[List[object]], int]] = []
+            if element.arity == 2:
+                children.append(self.source(node.left))  # type: ignore
+                mark = len(self.statements)
+                children.append(self.source(node.right))  # type: ignore
+                if len(self.statements) > mark and children[0][2]:
+                    # the left node is computed before the statements of the right node
+                    left = f"t{len(self.statements)}"
+                    self.statements.insert(mark, f"{left} = {children[0][0]}")
+                    children[0] = (left, children[0][1], 0)
+            elif element.arity == 1:
+                children.append(self.source(node.right))  # type: ignore
+
+            if (element.method not in Function.Compiler.UNFOLDED
+                    and all(value for _, value, _ in children)):
+                try:
+                    folded = element.method(*(value[0] for _, value, _ in children))  # type: ignore
+                except Exception:
+                    pass  # the error is raised when evaluating
+                else:
+                    return self.constant(folded)
+
+            arguments = [expression for expression, _, _ in children]
+            if element.method in Function.Compiler.INLINE:
+                expression = Function.Compiler.INLINE[element.method].format(*arguments)
+            else:
+                name = f"_{len(self.namespace)}"
+                self.namespace[name] = element.method
+                expression = f"{name}({', '.join(arguments)})"
+            nesting = 1 + max((nesting for _, _, nesting in children), default=0)
+            if self.counts[key] == 1 and nesting < Function.Compiler.NESTING:
+                return expression, None, nesting
+
+            result = f"t{len(self.statements)}"
+            self.statements.append(f"{result} = {expression}")
+            if self.counts[key] > 1:
+                self.computed[key] = result
+            return result, None, 0
+
+        def constant(self, value: object) -> Tuple[str, Optional[List[object]], int]:
+            """
+            Creates the expression of the constant value
+            :param value: is the constant value
+            :return: the expression of the value, the value in a list, and the nesting of zero
+            """
+            if type(value) is float and isfinite(value):  # type: ignore
+                # the representation of finite floats is exact
+                return f"({value!r})", [value], 0
+            name = f"_{len(self.namespace)}"
+            self.namespace[name] = value
+            return name, [value], 0
+
     def __init__(self, name: str = "", formula: str = "", engine: Optional['Engine'] = None,
                  variables: Optional[Dict[str, float]] = None) -> None:
         super().__init__(name)
@@ -1186,6 +2109,34 @@ class Function(Term):
         self.variables: Dict[str, float] = {}
         if variables:
             self.variables.update(variables)
+        # the root from which the function was compiled, and the compiled function
+        self._compiled: Optional[Tuple[Function.Node, Callable[[Dict[str, float]], float]]] = None
+        # the root, engine and map of variables from which the engine variables referenced by the
+        # formula were bound, and the engine variables bound to their names
+        self._bindings: Optional[Tuple[Function.Node, Optional['Engine'], Dict[str, float],
+                                       Tuple[Tuple[str, 'Variable'], ...]]] = None
+
+    def __copy__(self) -> 'Function':
+        # the copy shares the compiled function, as it shares the root
+        result = Function.__new__(type(self))
+        for attribute, value in self.__getstate__().items():
+            setattr(result, attribute, value)
+        result._compiled = self._compiled
+        return result
+
+    def __getstate__(self) -> Dict[str, object]:
+        # the compiled function cannot be pickled, so it is left out and compiled again
+        return {attribute: getattr(self, attribute)
+                for cls in type(self).__mro__ for attribute in getattr(cls, "__slots__", ())
+                if attribute not in {"_compiled", "_bindings"} and hasattr(self, attribute)}
+
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        for attribute, value in state.items():
+            setattr(self, attribute, value)
+        self._compiled = None
+        self._bindings = None
+        if self.root:
+            self.compile()
 
     def parameters(self) -> str:
         return self.formula
@@ -1195,9 +2146,9 @@ class Function(Term):
         self.load()
 
     def update_reference(self, engine: Optional['Engine']) -> None:
+        # the formula is parsed independently of the engine, so it need not be loaded again
         self.engine = engine
-        if self.is_loaded():
-            self.load()
+        self._bindings = None
 
     @staticmethod
     def create(name: str, formula: str, engine: Optional['Engine'] = None) -> 'Function':
@@ -1206,14 +2157,79 @@ class Function(Term):
         return result
 
     def membership(self, x: float) -> float:
+        return self.evaluate(self._local_variables(x))
+
+    def membership_array(self, xs: 'np.ndarray') -> 'np.ndarray':
+        """
+        Computes the membership function values at each of the values in the array (see
+        Function::evaluate_array)
+        :param xs: is the array of values
+        :return: the array of membership function values
+        """
+        import numpy as np  # type: ignore
+        # the values of the engine variables are arrays when processing a batch
+        local_variables = self._local_variables(xs)  # type: ignore
+        shape = np.broadcast_arrays(*local_variables.values())[0].shape
+        result = self.evaluate_array(local_variables)  # type: ignore
+        return np.array(np.broadcast_to(result, shape), dtype=float)
+
+    def _local_variables(self, x: float) -> Dict[str, float]:
+        bindings = self._bindings
+        if not (bindings and bindings[0] is self.root and bindings[1] is self.engine
+                and bindings[2] is self.variables):
+            bindings = self._bind()
+            if not bindings:
+                # the errors about the missing variables report every variable in the engine
+                return self._engine_variables(x)
+        local_variables = {name: variable.value for name, variable in bindings[3]}
+        local_variables['x'] = x
+        local_variables.update(self.variables)
+        return local_variables
+
+    def _bind(self) -> Optional[Tuple['Function.Node', Optional['Engine'], Dict[str, float],
+                                      Tuple[Tuple[str, 'Variable'], ...]]]:
+        """
+        Binds the engine variables referenced by the formula to their names, checking once for
+        conflicts between the names of the engine variables and the function variables. The
+        bindings are kept until the function is loaded again, its reference is updated, or its
+        map of variables is replaced, so the function needs to be loaded again after renaming
+        engine variables.
+        :return: the bindings, or None if the formula references variables not found
+        """
+        self._bindings = None
+        # checks for conflicts between the names
+        self._engine_variables(nan)
+        if not self.root:
+            return None
+        engine_variables: Dict[str, 'Variable'] = {}
+        if self.engine:
+            for variables in (self.engine.input_variables, self.engine.output_variables):
+                for variable in variables:
+                    engine_variables[variable.name] = variable
+        bindings: Dict[str, 'Variable'] = {}
+        nodes = [self.root]
+        while nodes:
+            node = nodes.pop()
+            nodes.extend(child for child in (node.left, node.right) if child)
+            name = node.variable
+            if not node.element and name and name != 'x' and name not in self.variables:
+                if name not in engine_variables:
+                    return None
+                bindings[name] = engine_variables[name]
+        self._bindings = (self.root, self.engine, self.variables, tuple(bindings.items()))
+        return self._bindings
+
+    def _engine_variables(self, x: float) -> Dict[str, float]:
         if 'x' in self.variables:
             raise ValueError("variable 'x' is reserved for internal use of Function term, please "
                              f"remove it from the map of variables: {self.variables}")
 
         engine_variables: Dict[str, float] = {}
         if self.engine:
-            for variable in self.engine.variables:
-                engine_variables[variable.name] = variable.value
+            # the variables are not joined in a list (see Engine::variables) on every evaluation
+            for variables in (self.engine.input_variables, self.engine.output_variables):
+                for variable in variables:
+                    engine_variables[variable.name] = variable.value
 
             if 'x' in engine_variables:
                 raise ValueError("variable 'x' is reserved for internal use of Function term, "
@@ -1225,47 +2241,112 @@ class Function(Term):
             raise ValueError("function variables cannot override engine variables, please "
                              f"resolve the name ambiguity of the following variables: {overrides}")
         engine_variables.update(self.variables)
-        return self.evaluate(engine_variables)
+        return engine_variables
 
     def evaluate(self, variables: Optional[Dict[str, float]] = None) -> float:
         if not self.root:
             raise RuntimeError(f"function '{self.formula}' is not loaded")
+        compiled = self._compiled
+        if compiled and compiled[0] is self.root:
+            try:
+                return compiled[1](variables)  # type: ignore
+            except (KeyError, TypeError):
+                # the tree raises the errors about the missing variables, or raises them again
+                pass
         return self.root.evaluate(variables)
 
+    def evaluate_array(self, variables: Optional[Dict[str, 'np.ndarray']] = None) -> 'np.ndarray':
+        """
+        Evaluates the formula element-wise on the (broadcast) arrays of the variables at once (see
+        Function.Node::evaluate_array). The values are computed as in Function::evaluate, but the
+        functions in numpy may differ from those in math in the last digit, and the errors in the
+        computations (e.g., division by zero) result in infinity or nan as in numpy.
+        :param variables: is the map of arrays of the variables
+        :return: the array of values of the formula, or a scalar if the formula has no variables
+        """
+        import numpy as np  # type: ignore
+        if not self.root:
+            raise RuntimeError(f"function '{self.formula}' is not loaded")
+        arrays = ({name: np.asarray(value, dtype=float) for name, value in variables.items()}
+                  if variables else variables)
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            return self.root.evaluate_array(arrays)
+
     def is_loaded(self) -> bool:
         return bool(self.root)
 
     def unload(self) -> None:
         self.root = None
+        self._compiled = None
         self.variables.clear()
 
-    def load(self) -> None:
+    def load(self, compiled: bool = True) -> None:
+        """
+        Loads the function by parsing the formula into a tree
+        :param compiled: is whether to compile the tree (see Function::compile)
+        """
         self.root = self.parse(self.formula)
+        self._compiled = None
+        if compiled:
+            self.compile()
+
+    def is_compiled(self) -> bool:
+        """
+        Gets whether the tree of the function is compiled (see Function::compile)
+        :return: whether the tree of the function is compiled
+        """
+        return bool(self.root and self._compiled and self._compiled[0] is self.root)
+
+    def compile(self) -> None:
+        """
+        Compiles the tree of the function into a Python function (see Function.Compiler), which
+        is used by Function::evaluate until the function is loaded again. The trees that cannot
+        be compiled (e.g., trees with invalid nodes) are walked instead.
+        """
+        if not self.root:
+            raise RuntimeError(f"function '{self.formula}' is not loaded")
+        self._compiled = None
+        try:
+            compiled = Function.Compiler().compile(self.root, f"<function '{self.formula}'>")
+        except (ValueError, SyntaxError, RecursionError, MemoryError):
+            return
+        self._compiled = (self.root, compiled)
 
     @classmethod
     def format_infix(cls, formula: str) -> str:
         from . import lib
-        from .factory import FunctionFactory
-        from .rule import Rule
-
-        factory: FunctionFactory = lib.factory_manager.function
-        operators: Set[str] = set(factory.operators().keys()).union({'(', ')', ','})
-        operators -= {Rule.AND, Rule.OR}
+        return cls._format_infix(formula, lib.factory_manager.function)
 
-        # sorted to have multi-char operators separated first (eg., ** and *)
-        regex = "|".join(re.escape(o) for o in sorted(operators, reverse=True))
-        spaced = re.sub(fr"({regex})", r' \1 ', formula)
+    @staticmethod
+    def _format_infix(formula: str, factory: 'FunctionFactory') -> str:
+        spaced = factory.tokenizer().sub(r' \1 ', formula)
         result = re.sub(r"\s+", " ", spaced).strip()
         return result
 
-    @classmethod  # noqa: C901 mccabe complexity=19
+    @classmethod
     def infix_to_postfix(cls, formula: str) -> str:
+        """
+        Converts the formula from infix to postfix notation, keeping the postfix notations of the
+        most recent formulas (see FunctionFactory::postfix)
+        :param formula: is the formula in infix notation
+        :return: the formula in postfix notation
+        """
+        from . import lib
+        return lib.factory_manager.function.postfix(formula)
+
+    @staticmethod
+    def convert_to_postfix(formula: str,  # noqa: C901 mccabe complexity=20
+                           factory: 'FunctionFactory') -> str:
+        """
+        Converts the formula from infix to postfix notation using the elements of the factory
+        :param formula: is the formula in infix notation
+        :param factory: is the factory of the elements of the formula
+        :return: the formula in postfix notation
+        """
         # TODO: support for unary and binary (+,-)
         from . import lib
-        from .factory import FunctionFactory
 
-        formula = cls.format_infix(formula)
-        factory: FunctionFactory = lib.factory_manager.function
+        formula = Function._format_infix(formula, factory)
 
         from collections import deque
         queue: Deque[str] = deque()
@@ -1351,7 +2432,8 @@ class Function(Term):
                 if element.arity > len(stack):
                     raise SyntaxError(f"function element {element.name} has arity {element.arity}, "
                                       f"but the size of the stack is {len(stack)}")
-                node = Function.Node(factory.copy(token))
+                # the elements are shared by the nodes, and not copied
+                node = Function.Node(element)
                 if element.arity >= 1:
                     node.right = stack.pop()
                 if element.arity == 2:
@@ -1373,3 +2455,197 @@ class Function(Term):
             lib.logger.debug("\n  ".join(Op.describe(node, class_hierarchy=False)
                                          for node in stack))
         return stack[-1]
+
+
+class Lookup:
+    """
+      The Lookup class approximates the membership functions of terms within a range by linear
+      interpolation of their values at equally spaced values of the range, within a maximum
+      absolute error. The number of values is the smallest power of two (up to
+      Lookup::maximum_resolution) for which the error of the interpolation, measured at the
+      quarters of every interval between consecutive values and at the values where the
+      membership functions are not smooth (see Lookup::breakpoints), does not exceed the
+      maximum error.
+      The values of every term are interpolated at once for the same value, which computes the
+      position of the value in the table only once (see InputVariable::approximate). Outside
+      the range, the membership functions are computed as they are. The approximation does not
+      change when the parameters of the terms change, so it needs to be created again.
+
+      @see InputVariable::approximate
+      @see Engine::approximate
+
+      Attributes:
+          terms are the terms to approximate
+          minimum is the minimum value of the range
+          maximum is the maximum value of the range
+          error is the maximum absolute error of the approximation
+          resolution is the number of intervals in which the range is divided
+    """
+
+    # the terms whose membership functions are more expensive to compute than to interpolate
+    TERMS = (Bell, Concave, Cosine, Gaussian, GaussianProduct, Sigmoid, SigmoidDifference,
+             SigmoidProduct, Spike)
+
+    maximum_resolution = 2 ** 16
+
+    def __init__(self, terms: Iterable[Term], minimum: float, maximum: float,
+                 error: float) -> None:
+        if not (isfinite(minimum) and isfinite(maximum) and minimum < maximum):
+            raise ValueError(f"expected a finite range to approximate the terms, "
+                             f"but found [{minimum}, {maximum}]")
+        if not error > 0.0:
+            raise ValueError(f"expected a maximum error greater than zero, but found {error}")
+        self.terms = list(terms)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.error = error
+        self.resolution = 16
+        self._scale = 0.0
+        self._rows: List[Tuple[Term, List[float], List[float]]] = []
+        self._index: Dict[Term, int] = {term: i for i, term in enumerate(self.terms)}
+        while True:
+            worst = self._tabulate(error)
+            if worst <= error:
+                break
+            if self.resolution >= Lookup.maximum_resolution:
+                raise ValueError(f"expected to approximate the terms within an error of {error} "
+                                 f"using at most {Lookup.maximum_resolution} intervals, "
+                                 f"but the error is {worst}")
+            self.resolution *= 2
+
+    def __contains__(self, term: object) -> bool:
+        """
+        Gets whether the term is approximated by the lookup table
+        """
+        return term in self._index
+
+    @staticmethod
+    def breakpoints(term: Term) -> List[float]:
+        """
+        Gets the values where the membership function of the term is not smooth (e.g., the
+        center of a Spike), where the error of the interpolation is largest when the values
+        fall between the values of the table
+        :param term: is the term
+        :return: the values where the membership function of the term is not smooth
+        """
+        if isinstance(term, Spike):
+            return [term.center]
+        if isinstance(term, Concave):
+            return [term.end]
+        if isinstance(term, Cosine):
+            return [term.center - 0.5 * term.width, term.center + 0.5 * term.width]
+        if isinstance(term, GaussianProduct):
+            return [term.mean_a, term.mean_b]
+        if isinstance(term, (Ramp, Rectangle, SShape, ZShape)):
+            return [term.start, 0.5 * (term.start + term.end), term.end]
+        if isinstance(term, Triangle):
+            return [term.vertex_a, term.vertex_b, term.vertex_c]
+        if isinstance(term, Trapezoid):
+            return [term.vertex_a, term.vertex_b, term.vertex_c, term.vertex_d]
+        if isinstance(term, PiShape):
+            return [term.bottom_left, 0.5 * (term.bottom_left + term.top_left), term.top_left,
+                    term.top_right, 0.5 * (term.top_right + term.bottom_right),
+                    term.bottom_right]
+        if isinstance(term, Discrete):
+            # the membership function is the value of a point within the tolerance of its x
+            from . import lib
+            return [x + offset for x in term._x
+                    for offset in (-lib.abs_tolerance, 0.0, lib.abs_tolerance)]
+        return []
+
+    def _tabulate(self, error: float) -> float:
+        """
+        Tabulates the terms at the resolution of the table
+        :param error: is the maximum error, beyond which the error is no longer measured
+        :return: the largest error of the interpolation, or the first error beyond the maximum
+        """
+        dx = (self.maximum - self.minimum) / self.resolution
+        x = [self.minimum + i * dx for i in range(self.resolution)] + [self.maximum]
+        worst = 0.0
+        self._scale = self.resolution / (self.maximum - self.minimum)
+        self._rows = []
+        for term in self.terms:
+            y = [term.membership(x_i) for x_i in x]
+            if not all(isfinite(y_i) for y_i in y):
+                raise ValueError(f"expected finite membership function values to approximate "
+                                 f"term '{term.name}', but found non-finite values")
+            slope = [y[i + 1] - y[i] for i in range(self.resolution)]
+            self._rows.append((term, y[:-1], slope))
+            checked = [x_i for x_i in Lookup.breakpoints(term)
+                       if self.minimum <= x_i <= self.maximum]
+            checked.extend(x[i] + fraction * dx for fraction in (0.25, 0.5, 0.75)
+                           for i in range(self.resolution))
+            for x_i in checked:
+                index, fraction = self._position(x_i)
+                difference = fabs(term.membership(x_i) - (y[index] + fraction * slope[index]))
+                if not difference <= worst:
+                    worst = difference
+                    if not worst <= error:
+                        return worst
+        return worst
+
+    def _position(self, x: float) -> Tuple[int, float]:
+        """
+        Finds the interval of the table that contains the value within the range
+        :return: the index of the interval and the fraction of the interval before the value
+        """
+        position = (x - self.minimum) * self._scale
+        index = min(int(position), self.resolution - 1)
+        return index, position - index
+
+    def membership(self, term: Term, x: float) -> float:
+        """
+        Approximates the membership function value of the term at the value
+        :param term: is a term of the lookup table
+        :param x: is the value
+        :return: the approximate membership function value of the term
+        """
+        if not self.minimum <= x <= self.maximum:
+            return term.membership(x)
+        _, y, slope = self._rows[self._index[term]]
+        index, fraction = self._position(x)
+        return y[index] + fraction * slope[index]
+
+    def memberships(self, x: float,
+                    result: Optional[Dict[Term, float]] = None) -> Dict[Term, float]:
+        """
+        Approximates the membership function values of every term at the value
+        :param x: is the value
+        :param result: is the dictionary to update with the membership function values (e.g.,
+        the fuzzification table of the variable), or None to create a new dictionary
+        :return: the dictionary of terms and their approximate membership function values
+        """
+        if result is None:
+            result = {}
+        if not self.minimum <= x <= self.maximum:
+            for term in self.terms:
+                result[term] = term.membership(x)
+        else:
+            index, fraction = self._position(x)
+            for term, y, slope in self._rows:
+                result[term] = y[index] + fraction * slope[index]
+        return result
+
+    def membership_array(self, term: Term, xs: 'np.ndarray') -> 'np.ndarray':
+        """
+        Approximates the membership function values of the term at the array of values, as
+        computed by Lookup::membership
+        :param term: is a term of the lookup table
+        :param xs: is the array of values
+        :return: the array of approximate membership function values of the term
+        """
+        import numpy as np  # type: ignore
+        xs = np.asarray(xs, dtype=float)
+        _, y, slope = self._rows[self._index[term]]
+        inside = (self.minimum <= xs) & (xs <= self.maximum)
+        position = (np.where(inside, xs, self.minimum) - self.minimum) * self._scale
+        index = np.minimum(position.astype(int), self.resolution - 1)
+        result = np.asarray(y)[index] + (position - index) * np.asarray(slope)[index]
+        if inside.all():
+            return result  # type: ignore
+        return np.where(inside, result, term.membership_array(xs))  # type: ignore
+
+
+Aggregated.NONNEGATIVE = (Bell, Binary, Concave, Cosine, Gaussian, GaussianProduct, PiShape, Ramp,
+                          Rectangle, SShape, Sigmoid, SigmoidDifference, SigmoidProduct, Spike,
+                          Trapezoid, Triangle, ZShape)
@@ -0,0 +1,79 @@
+"""
+ pyfuzzylite (TM), a fuzzy logic control library in Python.
+ Copyright (C) 2010-2017 FuzzyLite Limited. All rights reserved.
+ Author: Juan Rada-Vilela, Ph.D. <jcrada@fuzzylite.com>
+
+ This file is part of pyfuzzylite.
+
+ pyfuzzylite is free software: you can redistribute it and/or modify it under
+ the terms of the FuzzyLite License included with the software.
+
+ You should have received a copy of the FuzzyLite License along with
+ pyfuzzylite. If not, see <http://www.fuzzylite.com/license/>.
+
+ pyfuzzylite is a trademark of FuzzyLite Limited
+ fuzzylite is a registered trademark of FuzzyLite Limited.
+"""
+
+__all__ = ["Tracer"]
+
+from typing import Dict, List, Optional, Tuple
+
+
+class Tracer:
+    """
+      The Tracer class records the calls to the hot paths of the library (e.g., the membership
+      functions of the Activated and Aggregated terms), keeping the number of calls to each
+      component and, optionally, a sample of the values computed. The hot paths are traced
+      only while a tracer is active (see Library::tracer), and they only check whether
+      Tracer.active is set otherwise. The components and values are recorded as they are, and
+      they are converted to strings only when the tracer is described (see Tracer::summary).
+
+      @see Library::tracer
+
+      Attributes:
+          counts is the number of calls to each component
+          sampling is the number of calls to a component between consecutive samples, or zero
+          to record no samples
+          max_samples is the maximum number of samples to record
+          samples is the list of samples (component, x, result)
+    """
+
+    active: Optional['Tracer'] = None
+
+    def __init__(self, sampling: int = 0, max_samples: int = 1000) -> None:
+        self.counts: Dict[object, int] = {}
+        self.sampling = sampling
+        self.max_samples = max_samples
+        self.samples: List[Tuple[object, float, float]] = []
+
+    def __str__(self) -> str:
+        return self.summary()
+
+    def trace(self, component: object, x: float, result: float) -> None:
+        """
+        Records a call to the component, and a sample of the call if due
+        :param component: is the component called (e.g., an Activated term)
+        :param x: is the value given to the component
+        :param result: is the value computed by the component
+        """
+        count = self.counts.get(component, 0) + 1
+        self.counts[component] = count
+        if (self.sampling and count % self.sampling == 0
+                and len(self.samples) < self.max_samples):
+            self.samples.append((component, x, result))
+
+    def clear(self) -> None:
+        """
+        Clears the counts and samples recorded
+        """
+        self.counts.clear()
+        self.samples.clear()
+
+    def summary(self) -> str:
+        """
+        Describes the counts of calls to each component, from the most called to the least
+        :return: a line per component with the number of calls and the component
+        """
+        counts = sorted(self.counts.items(), key=lambda item: item[1], reverse=True)
+        return "\n".join(f"{count}: {str(component)}" for component, count in counts)
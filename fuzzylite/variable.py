@@ -17,19 +17,27 @@
 
 __all__ = ["Variable", "InputVariable", "OutputVariable"]
 
+import functools
+import itertools
 import math
+import operator
 import typing
 from math import inf, isnan, nan
-from typing import Iterable, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
+from .defuzzifier import Defuzzifier, IntegralDefuzzifier
 from .exporter import FllExporter
-from .norm import SNorm
+from .norm import AlgebraicProduct, Maximum, Minimum, SNorm
 from .operation import Op
-from .term import Aggregated
+from .state import State
+from .term import (Activated, Aggregated, Bell, Binary, Concave, Constant, Cosine, Discrete,
+                   Gaussian, GaussianProduct, Lookup, PiShape, Ramp, Rectangle, SShape,
+                   Sigmoid, SigmoidDifference, SigmoidProduct, Spike, Term, Trapezoid, Triangle,
+                   ZShape)
+from .tracer import Tracer
 
 if typing.TYPE_CHECKING:
-    from .term import Term
-    from .defuzzifier import Defuzzifier  # noqa: F401
+    import numpy as np  # type: ignore # noqa: F401
 
 
 class Variable:
@@ -76,11 +84,20 @@ class Variable:
 
     @property
     def value(self) -> float:
-        return self._value
+        state = State.current.get() if State.bound else None
+        if state is None:
+            return self._value
+        return state.values.get(self, nan)
 
     @value.setter
     def value(self, value: float) -> None:
-        self._value = Op.bound(value, self.minimum, self.maximum) if self.lock_range else value
+        if self.lock_range:
+            value = Op.bound(value, self.minimum, self.maximum)
+        state = State.current.get() if State.bound else None
+        if state is None:
+            self._value = value
+        else:
+            state.values[self] = value
 
     def fuzzify(self, x: float) -> str:
         result: List[str] = []
@@ -128,16 +145,212 @@ class InputVariable(Variable):
                          maximum=maximum,
                          lock_range=lock_range,
                          terms=terms)
+        self._fuzzification: Optional[Dict['Term', float]] = None
+        self._fuzzification_table: Dict['Term', float] = {}
+        self.lookup: Optional[Lookup] = None
 
     def __str__(self) -> str:
         return FllExporter().input_variable(self)
 
+    @property
+    def fuzzification(self) -> Optional[Dict['Term', float]]:
+        state = State.current.get() if State.bound else None
+        if state is None:
+            return self._fuzzification
+        return state.fuzzifications.get(self)
+
+    @fuzzification.setter
+    def fuzzification(self, fuzzification: Optional[Dict['Term', float]]) -> None:
+        state = State.current.get() if State.bound else None
+        if state is None:
+            self._fuzzification = fuzzification
+        else:
+            state.fuzzifications[self] = fuzzification
+
+    def fuzzification_table(self) -> Dict['Term', float]:
+        """
+        Gets the fuzzification table to use while the engine is processing (see
+        InputVariable::fuzzification), which is created once for the variable (or for each state)
+        and reused every time the engine is processed. The membership function values in the
+        table are reset to None instead of clearing the table, so the keys are not allocated
+        again.
+        :return: the fuzzification table without membership function values
+        """
+        state = State.current.get() if State.bound else None
+        if state is None:
+            table = self._fuzzification_table
+        else:
+            table = state.fuzzification_tables.get(self)  # type: ignore
+            if table is None:
+                table = state.fuzzification_tables[self] = {}
+        for term in table:
+            table[term] = None  # type: ignore
+        return table
+
+    def membership(self, term: 'Term') -> float:
+        """
+        Computes the membership function value of the term at the value of the variable. While
+        the engine is processing, the fuzzification table maps the terms to their membership
+        function values, which are computed once and shared by the propositions of the rules
+        :param term: is the term of the variable
+        :return: the membership function value of the term at the value of the variable
+        """
+        fuzzification = self.fuzzification
+        lookup = self.lookup
+        if fuzzification is None:
+            if lookup is not None and term in lookup:
+                return lookup.membership(term, self.value)
+            return term.membership(self.value)
+        result = fuzzification.get(term)
+        if result is None:
+            if lookup is not None and term in lookup:
+                # the approximated terms are interpolated at once
+                lookup.memberships(self.value, fuzzification)
+                result = fuzzification[term]
+            else:
+                result = fuzzification[term] = term.membership(self.value)
+        return result
+
+    def membership_array(self, term: 'Term') -> 'np.ndarray':
+        """
+        Computes the membership function values of the term at the array of values of the
+        variable (see Engine::process_batch), using the fuzzification table as in
+        InputVariable::membership
+        :param term: is the term of the variable
+        :return: the membership function values of the term at the values of the variable
+        """
+        fuzzification = self.fuzzification
+        lookup = self.lookup
+        if lookup is not None and term in lookup:
+            compute = functools.partial(lookup.membership_array, term)
+        else:
+            compute = term.membership_array
+        if fuzzification is None:
+            return compute(self.value)
+        result = fuzzification.get(term)
+        if result is None:
+            result = fuzzification[term] = compute(self.value)
+        return result
+
+    def approximate(self, error: Optional[float],
+                    terms: Optional[Iterable['Term']] = None) -> None:
+        """
+        Approximates the membership functions of the terms within the range of the variable by
+        linear interpolation within the maximum absolute error (see Lookup), which
+        InputVariable::membership uses instead of the membership functions. The approximation
+        needs to be created again when the range or the terms change.
+        :param error: is the maximum absolute error, or None to remove the approximation
+        :param terms: are the terms to approximate, or None to approximate the terms of the
+        variable in Lookup::TERMS
+        """
+        if error is None:
+            self.lookup = None
+            return
+        if terms is None:
+            terms = [term for term in self.terms if type(term) in Lookup.TERMS]
+        self.lookup = Lookup(terms, self.minimum, self.maximum, error)
+
     def fuzzy_value(self) -> str:
         return super().fuzzify(self.value)
 
 
 class OutputVariable(Variable):
 
+    class Samples(Term):
+        """
+          The Samples class is the fuzzy output of an output variable computed beforehand at the
+          values where an integral defuzzifier evaluates it (see OutputVariable::tabulated),
+          whose membership function values are computed again in place every time.
+
+          Attributes:
+              fuzzy is the fuzzy output of the output variable
+              positions is the position of each value where the fuzzy output is evaluated
+              y is the membership function value of the fuzzy output at each position
+        """
+
+        # the attributes change while processing the engine (see Term::revision)
+        __setattr__ = object.__setattr__
+
+        def __init__(self, fuzzy: Aggregated, positions: Dict[float, int], size: int) -> None:
+            super().__init__("_")
+            self.fuzzy = fuzzy
+            self.positions = positions
+            self.y = [0.0] * size
+
+        def membership(self, x: float) -> float:
+            position = self.positions.get(x)
+            if position is None:
+                return self.fuzzy.membership(x)
+            return self.y[position]
+
+        def support(self) -> Tuple[float, float]:
+            return self.fuzzy.support()
+
+    class Table:
+        """
+          The Table class is the table of membership function values of the terms of an output
+          variable at the values where its integral defuzzifier evaluates the fuzzy output (see
+          OutputVariable::table), which is valid while the terms, their parameters, the range
+          and the defuzzifier do not change.
+
+          Attributes:
+              revision is the revision of the terms when tabulated (see Term::revision)
+              terms is a copy of the list of terms of the output variable when tabulated
+              minimum is the minimum value of the range when tabulated
+              maximum is the maximum value of the range when tabulated
+              defuzzifier is the defuzzifier when tabulated
+              resolution is the resolution of the defuzzifier when tabulated
+              values is the list of values where the fuzzy output is evaluated, and the
+              dictionary of tabulated terms and their membership function values at each value
+              positions is the position of each value where the fuzzy output is evaluated
+              zeros is the list of zeros to reset the fuzzy output computed beforehand
+              samples is the fuzzy output computed beforehand when no state is bound (see
+              OutputVariable::tabulated)
+        """
+        __slots__ = ("revision", "terms", "minimum", "maximum", "defuzzifier", "resolution",
+                     "values", "positions", "zeros", "samples")
+
+        def __init__(self, variable: 'OutputVariable', defuzzifier: IntegralDefuzzifier) -> None:
+            self.revision = Term.revision
+            self.terms = list(variable.terms)
+            self.minimum = variable.minimum
+            self.maximum = variable.maximum
+            self.defuzzifier = defuzzifier
+            self.resolution = defuzzifier.resolution
+            x = defuzzifier.sample_points(self.minimum, self.maximum)
+            rows = {term: [term.membership(x_i) for x_i in x] for term in self.terms
+                    if type(term) in OutputVariable.TABULATED}
+            self.values = (x, rows)
+            self.positions = {x_i: i for i, x_i in enumerate(x)}
+            self.zeros = [0.0] * len(x)
+            self.samples = OutputVariable.Samples(variable.fuzzy, self.positions, len(x))
+
+        def is_valid(self, variable: 'OutputVariable', defuzzifier: IntegralDefuzzifier) -> bool:
+            """
+            Gets whether the table is valid for the output variable and its defuzzifier
+            :return: whether the terms, their parameters, the range and the defuzzifier are the
+            same as when tabulated
+            """
+            return (self.revision == Term.revision and self.defuzzifier is defuzzifier
+                    and self.resolution == defuzzifier.resolution
+                    and self.minimum == variable.minimum and self.maximum == variable.maximum
+                    and self.terms == variable.terms)
+
+    # the terms whose membership functions depend only on their parameters
+    TABULATED = (Bell, Binary, Concave, Constant, Cosine, Discrete, Gaussian, GaussianProduct,
+                 PiShape, Ramp, Rectangle, Sigmoid, SigmoidDifference, SigmoidProduct, Spike,
+                 SShape, Trapezoid, Triangle, ZShape)
+
+    # the norms computed by built-in functions, which compute the same without calling the norms
+    BUILTIN_NORMS: Dict[type, Callable[[float, float], float]] = {
+        AlgebraicProduct: operator.mul, Maximum: max, Minimum: min}
+
+    # whether to defuzzify the fuzzy output using the tabulated terms (see OutputVariable::table)
+    tabulate = True
+
+    # whether to compact the activated terms of the same term (see OutputVariable::compacts)
+    compact = True
+
     def __init__(self,
                  name: str = "",
                  description: str = "",
@@ -166,11 +379,27 @@ class OutputVariable(Variable):
         self.defuzzifier = defuzzifier
         self.lock_previous = lock_previous
         self.default_value = default_value
-        self.previous_value = nan
+        self._previous_value = nan
+        self._table: Optional[OutputVariable.Table] = None
 
     def __str__(self) -> str:
         return FllExporter().output_variable(self)
 
+    @property
+    def previous_value(self) -> float:
+        state = State.current.get() if State.bound else None
+        if state is None:
+            return self._previous_value
+        return state.previous_values.get(self, nan)
+
+    @previous_value.setter
+    def previous_value(self, value: float) -> None:
+        state = State.current.get() if State.bound else None
+        if state is None:
+            self._previous_value = value
+        else:
+            state.previous_values[self] = value
+
     @property  # type: ignore
     def name(self) -> str:  # type: ignore
         return self.fuzzy.name
@@ -221,7 +450,8 @@ class OutputVariable(Variable):
             is_valid = False
             if self.defuzzifier:
                 try:
-                    result = self.defuzzifier.defuzzify(self.fuzzy, self.minimum, self.maximum)
+                    result = self.defuzzifier.defuzzify(self.tabulated(), self.minimum,
+                                                        self.maximum)
                     is_valid = True
                 except ValueError as ex:
                     exception = ex
@@ -242,10 +472,146 @@ class OutputVariable(Variable):
         if exception:
             raise exception
 
+    def compacts(self) -> bool:
+        """
+        Gets whether to compact the activated terms of the same term in the fuzzy output as they
+        are added (see Aggregated::add_term), which is the case when the defuzzifier is an
+        integral defuzzifier, as these defuzzifiers only depend on the membership function
+        values of the fuzzy output, unlike the weighted defuzzifiers. The results are the same,
+        except for rounding errors when integrating exactly (see IntegralDefuzzifier::exact), as
+        fewer breakpoints are integrated.
+        :return: whether to compact the activated terms of the fuzzy output
+        """
+        return self.compact and isinstance(self.defuzzifier, IntegralDefuzzifier)
+
+    def table(self) -> Tuple[List[float], Dict[Term, List[float]]]:
+        """
+        Gets the table of membership function values of the terms at the values where the
+        integral defuzzifier evaluates the fuzzy output (see IntegralDefuzzifier::sample_points).
+        The table is computed once and computed again only when the terms, their parameters
+        (see Term::revision), the range, or the defuzzifier change (see OutputVariable.Table).
+        Only the terms in OutputVariable::TABULATED are tabulated, as the membership functions
+        of other terms may depend on the engine.
+        :return: the values where the fuzzy output is evaluated, and the dictionary of terms and
+        their membership function values at each of the values
+        """
+        return self._tabulation().values
+
+    def _tabulation(self) -> 'OutputVariable.Table':
+        defuzzifier = typing.cast(IntegralDefuzzifier, self.defuzzifier)
+        table = self._table
+        if table is None or not table.is_valid(self, defuzzifier):
+            # the table is replaced at once to be read from other threads
+            table = self._table = OutputVariable.Table(self, defuzzifier)
+        return table
+
+    def tabulated(self) -> Term:
+        """
+        Gets the fuzzy output to defuzzify, which is computed beforehand at the values where the
+        integral defuzzifier evaluates it (see IntegralDefuzzifier::sample_points) using the
+        tabulated terms (see OutputVariable::table). The results are the same as defuzzifying
+        the fuzzy output, with the membership functions of the terms computed once instead of
+        every time. The fuzzy output computed beforehand is the same term every time, whose
+        values are computed again in place, one per table and per state (see State::samples).
+        The fuzzy output is defuzzified as is when the defuzzifier is not an integral
+        defuzzifier, when it is vectorized or exact, or while tracing (see Tracer).
+        :return: the fuzzy output computed beforehand, or the fuzzy output
+        """
+        fuzzy = self.fuzzy
+        defuzzifier = self.defuzzifier
+        if not (self.tabulate and isinstance(defuzzifier, IntegralDefuzzifier)
+                and not (defuzzifier.vectorized or defuzzifier.exact or Tracer.active)
+                and math.isfinite(self.minimum + self.maximum)
+                and type(fuzzy) is Aggregated and fuzzy.aggregation):
+            return fuzzy
+        activated = fuzzy.terms
+        if not all(type(term) is Activated and term.term and term.implication
+                   for term in activated):
+            return fuzzy
+
+        table = self._tabulation()
+        x, rows = table.values
+        state = State.current.get() if State.bound else None
+        samples = table.samples if state is None else state.samples.get(self)
+        if samples is None or samples.positions is not table.positions:
+            samples = OutputVariable.Samples(fuzzy, table.positions, len(x))
+            state.samples[self] = samples  # type: ignore
+        samples.fuzzy = fuzzy
+        y = samples.y
+        y[:] = table.zeros
+        builtins = OutputVariable.BUILTIN_NORMS
+        aggregation = builtins.get(type(fuzzy.aggregation),
+                                   fuzzy.aggregation.compute)  # type: ignore
+        for term in activated:
+            row: Iterable[float] = rows.get(term.term)  # type: ignore
+            if row is None:
+                row = map(term.term.membership, x)
+            implication = builtins.get(type(term.implication),
+                                       term.implication.compute)  # type: ignore
+            # computes the same as Aggregated::membership, one activated term at a time, in place
+            for i, y_i in enumerate(map(aggregation, y,
+                                        map(implication, row, itertools.repeat(term.degree)))):
+                y[i] = y_i
+        return samples
+
+    def defuzzify_array(self, valid: 'np.ndarray') -> 'np.ndarray':
+        """
+        Defuzzifies the output variable for a batch of values (see Engine::process_batch),
+        applying the logic of default values and previous values like OutputVariable::defuzzify
+        does when the batch is processed one value after the other.
+        :param valid: is the array indicating the values for which rules were triggered
+        :return: the array of output values
+        """
+        import numpy as np  # type: ignore
+        if not self.enabled:
+            return np.full(valid.shape, self.value)  # type: ignore
+
+        result = np.full(valid.shape, nan)
+        exception = None
+        if valid.any():
+            if self.defuzzifier:
+                try:
+                    result = np.where(valid, self.defuzzifier.defuzzify_array(
+                        self.fuzzy, self.minimum, self.maximum), nan)
+                except ValueError as ex:
+                    exception = ex
+                    valid = np.full(valid.shape, False)
+            else:
+                exception = ValueError(f"expected a defuzzifier in output variable {self.name}, "
+                                       "but found none")
+                valid = np.full(valid.shape, False)
+
+        if self.lock_range:
+            result = np.clip(result, self.minimum, self.maximum)
+
+        default_value = self.default_value
+        if self.lock_range:
+            default_value = Op.bound(default_value, self.minimum, self.maximum)
+
+        if self.lock_previous:
+            previous_value = self.value if math.isfinite(self.value) else self.previous_value
+            # for each value, find the last finite value computed before it
+            index = np.where(valid & np.isfinite(result), np.arange(valid.size), -1)
+            last = np.concatenate(([-1], np.maximum.accumulate(index)[:-1]))
+            previous = np.where(last >= 0, result[last], previous_value)
+            result = np.where(valid, result,
+                              np.where(np.isnan(previous), default_value, previous))
+        else:
+            result = np.where(valid, result, default_value)
+
+        if exception:
+            raise exception
+
+        return result  # type: ignore
+
     def clear(self) -> None:
         self.fuzzy.clear()
         self.previous_value = nan
-        self._value = nan
+        state = State.current.get() if State.bound else None
+        if state is None:
+            self._value = nan
+        else:
+            state.values[self] = nan
 
     def fuzzy_value(self) -> str:
         result: List[str] = []
@@ -61,8 +61,8 @@ def setup_package() -> None:
         maintainer="Juan Rada-Vilela, Ph.D.",
         maintainer_email="jcrada@fuzzylite.com",
         license="Affero GNU General Public License v3",
-        packages=['fuzzylite'],
-        package_dir={'fuzzylite': '.'},
+        packages=['fuzzylite', 'fuzzylite.benchmark'],
+        package_dir={'fuzzylite': '.', 'fuzzylite.benchmark': 'fuzzylite/benchmark'},
         # entry_points={
         #     'console_scripts': ['fuzzylite=fuzzylite:console']
         # },
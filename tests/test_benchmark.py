@@ -0,0 +1,121 @@
+"""
+ pyfuzzylite (TM), a fuzzy logic control library in Python.
+ Copyright (C) 2010-2017 FuzzyLite Limited. All rights reserved.
+ Author: Juan Rada-Vilela, Ph.D. <jcrada@fuzzylite.com>
+
+ This file is part of pyfuzzylite.
+
+ pyfuzzylite is free software: you can redistribute it and/or modify it under
+ the terms of the FuzzyLite License included with the software.
+
+ You should have received a copy of the FuzzyLite License along with
+ pyfuzzylite. If not, see <http://www.fuzzylite.com/license/>.
+
+ pyfuzzylite is a trademark of FuzzyLite Limited
+ fuzzylite is a registered trademark of FuzzyLite Limited.
+"""
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+import fuzzylite as fl
+from fuzzylite.benchmark import Benchmark, main
+from tests.test_engine import TIPPER
+
+
+class TestBenchmark(unittest.TestCase):
+
+    def test_prepare(self) -> None:
+        benchmark = Benchmark("tipper", fl.FllImporter().from_string(TIPPER))
+        benchmark.prepare(io.StringIO("""\
+#comment
+food service mTip tsTip
+1.0 2.0 3.0 4.0
+5.0 6.0 7.0 8.0
+9.0 10.0 11.0 12.0
+"""))
+        self.assertEqual([[2.0, 1.0], [6.0, 5.0], [10.0, 9.0]], benchmark.inputs)
+        self.assertEqual([[3.0, 4.0], [7.0, 8.0], [11.0, 12.0]], benchmark.expected)
+
+        benchmark.prepare(io.StringIO("service food mTip\n1 2 3\n4 5 6\n7 8 9\n10 11 12\n"),
+                          rows=2)
+        self.assertEqual([[1.0, 2.0], [7.0, 8.0]], benchmark.inputs)
+        self.assertEqual([], benchmark.expected)
+        self.assertFalse(benchmark.can_compute_errors())
+
+        with self.assertRaisesRegex(ValueError, r"expected the input variables \['food'\] in "
+                                                r"the header of the dataset, but found "
+                                                r"\['service', 'mTip'\]"):
+            benchmark.prepare(io.StringIO("service mTip\n1 2\n"))
+
+    def test_prepare_grid(self) -> None:
+        benchmark = Benchmark("tipper", fl.FllImporter().from_string(TIPPER))
+        benchmark.prepare_grid(4)
+        self.assertEqual([[0.0, 0.0], [0.0, 5.0], [0.0, 10.0],
+                          [5.0, 0.0], [5.0, 5.0], [5.0, 10.0],
+                          [10.0, 0.0], [10.0, 5.0], [10.0, 10.0]], benchmark.inputs)
+
+    def test_run(self) -> None:
+        engine = fl.FllImporter().from_string(TIPPER)
+        expected = [engine.evaluate([service, food]) for service in range(11)
+                    for food in range(11)]
+        dataset = "service food mTip tsTip\n" + "\n".join(
+            f"{service} {food} {outputs[0]!r} {outputs[1]!r}"
+            for (service, food), outputs in zip(
+                ((s, f) for s in range(11) for f in range(11)), expected))
+
+        for mode, batch_size, calls in [("Scalar", None, 2 * 121), ("Batch", None, 2),
+                                        ("Batch", 50, 2 * 3)]:
+            benchmark = Benchmark("tipper", engine, mode, batch_size)
+            benchmark.prepare(io.StringIO(dataset))
+            benchmark.run(runs=2)
+            self.assertEqual(expected, benchmark.outputs)
+            self.assertEqual(calls, len(benchmark.times))
+
+            results = benchmark.results()
+            self.assertEqual("tipper", results["name"])
+            self.assertEqual(mode, results["mode"])
+            self.assertEqual((2, 2, 8, 121, 2, 242),
+                             (results["inputs"], results["outputs"], results["rules"],
+                              results["rows"], results["runs"], results["evaluations"]))
+            self.assertEqual(0, results["errors"])
+            self.assertEqual(0.0, results["max_error"])
+            latency = results["latency"]
+            self.assertLessEqual(latency["p50"], latency["p99"])  # type: ignore
+
+        benchmark.outputs[0][0] += 1.0
+        benchmark.outputs[1][1] = fl.nan
+        self.assertEqual({"errors": 2, "max_error": 1.0}, benchmark.errors())
+
+        with self.assertRaisesRegex(ValueError,
+                                    "expected a batch size greater than zero, but found 0"):
+            Benchmark(batch_size=0)
+
+    def test_main(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "tipper.fll")
+            with open(path, "w") as writer:
+                writer.write(TIPPER)
+            output = os.path.join(directory, "results.json")
+            self.assertEqual(0, main([path, "--grid", "25", "--runs", "2", "--output", output]))
+            with open(output) as reader:
+                results = json.load(reader)
+
+        self.assertEqual(f"{fl.lib.name} {fl.lib.version}", results["library"])
+        self.assertEqual([("tipper", "Scalar", 36), ("tipper", "Batch", 36)],
+                         [(benchmark["name"], benchmark["mode"], benchmark["rows"])
+                          for benchmark in results["benchmarks"]])
+        self.assertTrue(all(benchmark["errors"] is None for benchmark in results["benchmarks"]))
+
+        # the paths to the engines are required
+        with contextlib.redirect_stderr(io.StringIO()) as error, \
+                self.assertRaises(SystemExit):
+            main([])
+        self.assertIn("the following arguments are required: engines", error.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
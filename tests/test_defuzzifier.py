@@ -15,9 +15,11 @@
  fuzzylite is a registered trademark of FuzzyLite Limited.
 """
 
+import copy
+import math
 import re
 import unittest
-from typing import Dict
+from typing import Dict, List
 
 import fuzzylite as fl
 from tests.assert_component import BaseAssert
@@ -44,6 +46,15 @@ class DefuzzifierAssert(BaseAssert[fl.Defuzzifier]):
                                             places=15, msg=f"for {str(term)}")
         return self
 
+    def defuzzifies_vectorized(self, terms: Dict[fl.Term, float], minimum: float = -fl.inf,
+                               maximum: float = fl.inf) -> 'DefuzzifierAssert':
+        self.test.assertIsInstance(self.actual, fl.IntegralDefuzzifier)
+        self.actual.vectorized = True  # type: ignore
+        try:
+            return self.defuzzifies(terms, minimum, maximum)
+        finally:
+            del self.actual.vectorized  # type: ignore
+
 
 class TestDefuzzifier(unittest.TestCase):
 
@@ -93,6 +104,16 @@ class TestDefuzzifier(unittest.TestCase):
 
         DefuzzifierAssert(self, fl.Centroid()) \
             .defuzzifies(
+            {
+                fl.Triangle("", -1, 0): -0.5,
+                fl.Triangle("", -1, 1): 0.0,
+                fl.Triangle("", 0, 1): 0.5,
+                fl.Aggregated("", 0, 1, fl.Maximum(), [
+                    fl.Activated(fl.Triangle("Medium", 0.25, 0.5, 0.75), 0.2, fl.Minimum()),
+                    fl.Activated(fl.Triangle("High", 0.5, 0.75, 1.0), 0.8, fl.Minimum())
+                ]): 0.6900552486187845
+            }, -1, 1) \
+            .defuzzifies_vectorized(
             {
                 fl.Triangle("", -1, 0): -0.5,
                 fl.Triangle("", -1, 1): 0.0,
@@ -103,6 +124,157 @@ class TestDefuzzifier(unittest.TestCase):
                 ]): 0.6900552486187845
             }, -1, 1)
 
+    def test_vectorized_integral_defuzzifiers(self) -> None:
+        terms = [
+            fl.Triangle("", -1, 0, 1),
+            fl.Trapezoid("", -0.8, -0.2, 0.2, 0.8),
+            fl.Rectangle("", -0.3, 0.3),
+            fl.Aggregated("", -1, 1, fl.Maximum(), [
+                fl.Activated(fl.Triangle("Low", -1.0, -0.5, 0.0), 0.6, fl.Minimum()),
+                fl.Activated(fl.Triangle("Medium", -0.5, 0.0, 0.5), 0.6, fl.Minimum()),
+                fl.Activated(fl.Triangle("High", 0.25, 0.75, 1.0), 0.3, fl.AlgebraicProduct())
+            ]),
+            fl.Aggregated("", -1, 1, fl.Maximum(), []),
+        ]
+        for defuzzifier in [fl.Bisector(), fl.Centroid(), fl.LargestOfMaximum(),
+                            fl.MeanOfMaximum(), fl.SmallestOfMaximum()]:
+            for resolution in [1, 2, 3, 100, 1001]:
+                defuzzifier.resolution = resolution
+                for term in terms:
+                    for minimum, maximum in [(-1.0, 1.0), (-2.0, 0.5), (-fl.inf, 1.0)]:
+                        defuzzifier.vectorized = False
+                        try:
+                            expected = defuzzifier.defuzzify(term, minimum, maximum)
+                        except ZeroDivisionError:
+                            expected = fl.nan
+                        defuzzifier.vectorized = True
+                        obtained = defuzzifier.defuzzify(term, minimum, maximum)
+                        self.assertEqual(str(expected), str(obtained),
+                                         f"{defuzzifier} for {term} in [{minimum}, {maximum}]")
+
+    def test_integral_defuzzifiers_sample_support(self) -> None:
+        evaluations: List[float] = []
+
+        class Narrow(fl.Triangle):
+            def membership(self, x: float) -> float:
+                evaluations.append(x)
+                return super().membership(x)
+
+        terms = [
+            Narrow("", 0.1, 0.2, 0.3),
+            fl.Aggregated("", 0, 10, fl.Maximum(), [
+                fl.Activated(Narrow("Low", 0.1, 0.2, 0.3), 0.6, fl.Minimum()),
+                fl.Activated(Narrow("High", 0.25, 0.3, 0.35), 0.3, fl.AlgebraicProduct())
+            ]),
+            fl.Aggregated("", 0, 10, fl.Maximum(), []),
+        ]
+        for defuzzifier in [fl.Bisector(), fl.Centroid(), fl.LargestOfMaximum(),
+                            fl.MeanOfMaximum(), fl.SmallestOfMaximum()]:
+            for term in terms:
+                evaluations.clear()
+                try:
+                    obtained = defuzzifier.defuzzify(term, 0.0, 10.0)
+                except ZeroDivisionError:
+                    obtained = fl.nan
+                self.assertTrue(all(0.1 <= x <= 0.35 for x in evaluations))
+
+                # the samples outside of the support are zero
+                defuzzifier.support = lambda term: (-fl.inf, fl.inf)  # type: ignore
+                try:
+                    expected = defuzzifier.defuzzify(term, 0.0, 10.0)
+                except ZeroDivisionError:
+                    expected = fl.nan
+                del defuzzifier.support
+                self.assertEqual(str(expected), str(obtained), f"{defuzzifier} for {term}")
+
+        # the terms with reversed parameters
+        for defuzzifier in [fl.Bisector(100), fl.Centroid(100), fl.LargestOfMaximum(100),
+                            fl.MeanOfMaximum(100), fl.SmallestOfMaximum(100)]:
+            for term in [fl.Ramp("", 1.0, 0.0), fl.SShape("", 1.0, 0.0),
+                         fl.ZShape("", 1.0, 0.0)]:
+                obtained = defuzzifier.defuzzify(term, -1.0, 2.0)
+                defuzzifier.support = lambda term: (-fl.inf, fl.inf)  # type: ignore
+                expected = defuzzifier.defuzzify(term, -1.0, 2.0)
+                del defuzzifier.support
+                self.assertEqual(str(expected), str(obtained), f"{defuzzifier} for {term}")
+
+    def test_exact_integral_defuzzifiers(self) -> None:
+        aggregated = fl.Aggregated("", 0, 1, fl.Maximum(), [
+            fl.Activated(fl.Triangle("Medium", 0.25, 0.5, 0.75), 0.2, fl.Minimum()),
+            fl.Activated(fl.Triangle("High", 0.5, 0.75, 1.0), 0.8, fl.Minimum())
+        ])
+        centroid = fl.Centroid()
+        centroid.exact = True
+        DefuzzifierAssert(self, centroid).defuzzifies(
+            {
+                fl.Triangle("", 0, 0, 3): 1.0,
+                fl.Rectangle("", -0.5, 0.25): -0.125,
+                fl.Triangle("", 0, 0.5, 1).discretize(0, 1, 10): 0.5,
+                aggregated: 20 / 29,
+            }, -1, 3)
+        bisector = fl.Bisector()
+        bisector.exact = True
+        DefuzzifierAssert(self, bisector).defuzzifies(
+            {
+                fl.Triangle("", 0, 0, 3): 3 - math.sqrt(4.5),
+                fl.Trapezoid("", -fl.inf, 2.0, 2.5, 3.0): 1.375,
+                aggregated: 23 / 32,
+            }, 0, 3)
+
+        # other fuzzy sets are sampled
+        terms = [
+            fl.Gaussian("", 0.0, 0.2),
+            fl.Aggregated("", -1, 1, fl.AlgebraicSum(), [
+                fl.Activated(fl.Triangle("Low", -1.0, -0.5, 0.0), 0.6, fl.Minimum())]),
+            fl.Aggregated("", -1, 1, fl.Maximum(), [
+                fl.Activated(fl.Triangle("Low", -1.0, -0.5, 0.0), 0.6, fl.BoundedDifference())]),
+            fl.Aggregated("", -1, 1, fl.Maximum(), [
+                fl.Activated(fl.Bell("Low", -0.5, 0.5, 2.0), 0.6, fl.Minimum())]),
+        ]
+        for defuzzifier in [fl.Bisector(), fl.Centroid()]:
+            for term in terms:
+                expected = defuzzifier.defuzzify(term, -1, 1)
+                defuzzifier.exact = True
+                self.assertEqual(expected, defuzzifier.defuzzify(term, -1, 1))
+                del defuzzifier.exact
+
+    def test_exact_integral_defuzzifiers_vectorized(self) -> None:
+        try:
+            import numpy as np  # type: ignore
+        except ImportError:
+            self.skipTest("numpy is not installed")
+        degrees = np.linspace(0.0, 1.0, 11)
+        terms = [
+            fl.Trapezoid("", -0.8, -0.2, 0.2, 0.8),
+            fl.Aggregated("", -1, 1, fl.Maximum(), [
+                fl.Activated(fl.Triangle("Low", -fl.inf, -0.5, 0.0), degrees, fl.Minimum()),
+                fl.Activated(fl.Rectangle("Medium", -0.5, 0.5), 1.0 - degrees, fl.Minimum()),
+                fl.Activated(fl.Triangle("High", 0.25, 0.75, 1.0), 0.3, fl.AlgebraicProduct())
+            ]),
+            fl.Aggregated("", -1, 1, fl.Maximum(), []),
+        ]
+        for defuzzifier in [fl.Bisector(), fl.Centroid()]:
+            defuzzifier.exact = True
+            for term in terms:
+                for minimum, maximum in [(-1.0, 1.0), (-2.0, 0.5), (-fl.inf, 1.0)]:
+                    obtained = np.broadcast_to(
+                        defuzzifier.defuzzify_array(term, minimum, maximum), degrees.shape)
+                    for i, degree in enumerate(degrees):
+                        scalar = copy.deepcopy(term)
+                        if isinstance(scalar, fl.Aggregated):
+                            for activated in scalar.terms:
+                                activated.degree = float(np.broadcast_to(
+                                    activated.degree, degrees.shape)[i])
+                        try:
+                            expected = defuzzifier.defuzzify(scalar, minimum, maximum)
+                        except ZeroDivisionError:
+                            expected = fl.nan
+                        if fl.isnan(expected):
+                            self.assertTrue(fl.isnan(obtained[i]))
+                        else:
+                            self.assertAlmostEqual(expected, obtained[i], places=12,
+                                                   msg=f"{defuzzifier} for {scalar}")
+
     def test_weighted_defuzzifier(self) -> None:
         self.assertEqual(fl.WeightedDefuzzifier().type, fl.WeightedDefuzzifier.Type.Automatic)
 
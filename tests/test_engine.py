@@ -15,7 +15,7 @@
  fuzzylite is a registered trademark of FuzzyLite Limited.
 """
 import unittest
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 import fuzzylite as fl
 from tests.assert_component import BaseAssert
@@ -92,6 +92,66 @@ class EngineAssert(BaseAssert[fl.Engine]):
         return self
 
 
+TIPPER = """\
+Engine: tipper
+InputVariable: service
+  enabled: true
+  range: 0.000 10.000
+  lock-range: true
+  term: poor Trapezoid 0.000 0.000 2.500 5.000
+  term: good Triangle 2.500 5.000 7.500
+  term: excellent Trapezoid 5.000 7.500 10.000 10.000
+InputVariable: food
+  enabled: true
+  range: 0.000 10.000
+  lock-range: false
+  term: rancid Trapezoid 0.000 0.000 2.500 7.500
+  term: delicious Trapezoid 2.500 7.500 10.000 10.000
+OutputVariable: mTip
+  enabled: true
+  range: 0.000 30.000
+  lock-range: false
+  aggregation: Maximum
+  defuzzifier: Centroid 100
+  default: nan
+  lock-previous: true
+  term: cheap Triangle 0.000 5.000 10.000
+  term: average Triangle 10.000 15.000 20.000
+  term: generous Triangle 20.000 25.000 30.000
+OutputVariable: tsTip
+  enabled: true
+  range: 0.000 30.000
+  lock-range: true
+  aggregation: none
+  defuzzifier: WeightedAverage TakagiSugeno
+  default: nan
+  lock-previous: false
+  term: cheap Constant 5.000
+  term: average Constant 15.000
+  term: generous Linear 1.000 2.000 10.000
+RuleBlock: mamdani
+  enabled: true
+  conjunction: AlgebraicProduct
+  disjunction: AlgebraicSum
+  implication: Minimum
+  activation: General
+  rule: if service is poor or food is rancid then mTip is cheap
+  rule: if service is good then mTip is average
+  rule: if service is excellent or food is delicious then mTip is generous with 0.5
+  rule: if service is excellent and food is delicious then mTip is generous with 1.0
+RuleBlock: takagiSugeno
+  enabled: true
+  conjunction: AlgebraicProduct
+  disjunction: AlgebraicSum
+  implication: none
+  activation: General
+  rule: if service is poor or food is rancid then tsTip is cheap
+  rule: if service is good then tsTip is average
+  rule: if service is excellent or food is delicious then tsTip is generous with 0.5
+  rule: if service is excellent and food is delicious then tsTip is generous with 1.0
+"""
+
+
 class TestEngine(unittest.TestCase):
 
     def test_empty_engine(self) -> None:
@@ -259,6 +319,279 @@ class TestEngine(unittest.TestCase):
         for i, iv in enumerate(flc.output_variables):
             self.assertEqual(iv.name, names[i])
 
+    def test_process_computes_memberships_once(self) -> None:
+        engine = fl.FllImporter().from_string("""\
+Engine: counter
+InputVariable: A
+  range: 0.000 1.000
+  term: low Ramp 1.000 0.000
+  term: high Ramp 0.000 1.000
+InputVariable: B
+  range: 0.000 1.000
+  term: low Ramp 1.000 0.000
+  term: high Ramp 0.000 1.000
+OutputVariable: Z
+  range: 0.000 1.000
+  aggregation: Maximum
+  defuzzifier: Centroid 100
+  default: nan
+  term: low Ramp 1.000 0.000
+  term: high Ramp 0.000 1.000
+RuleBlock:
+  conjunction: Minimum
+  disjunction: Maximum
+  implication: Minimum
+  activation: General
+  rule: if A is low and B is low then Z is low
+  rule: if A is low and B is high then Z is high
+  rule: if A is high and B is low then Z is high
+  rule: if A is high and B is very high then Z is low
+  rule: if A is very high or B is somewhat low then Z is low
+""")
+        from unittest.mock import patch
+
+        calls: Dict[str, int] = {}
+        keys = {term: f"{variable.name}.{term.name}"
+                for variable in engine.input_variables for term in variable.terms}
+        ramp_membership = fl.Ramp.membership
+
+        # terms have slots, so the membership function is counted on the class
+        def membership(term: fl.Ramp, x: float) -> float:
+            if term in keys:
+                calls[keys[term]] = calls.get(keys[term], 0) + 1
+            return ramp_membership(term, x)
+
+        with patch.object(fl.Ramp, "membership", membership):
+            for compiled in [False, True]:
+                if compiled:
+                    engine.rule_blocks[0].compile()
+                for a, b in [(0.25, 0.5), (0.75, 0.0)]:
+                    calls.clear()
+                    engine.input_variable("A").value = a
+                    engine.input_variable("B").value = b
+                    engine.process()
+                    self.assertEqual({"A.low": 1, "A.high": 1, "B.low": 1, "B.high": 1}, calls)
+                    self.assertTrue(all(variable.fuzzification is None
+                                        for variable in engine.input_variables))
+
+    def test_clone(self) -> None:
+        from unittest.mock import patch
+
+        engine = fl.FllImporter().from_string(TIPPER)
+        ts_tip = engine.output_variable("tsTip")
+        ts_tip.terms.append(fl.Function.create("function", "service + food", engine))
+        engine.rule_block("takagiSugeno").rules.append(
+            fl.Rule.create("if service is good and food is very delicious "
+                           "then tsTip is function", engine))
+        engine.rule_block("mamdani").compile()
+        engine.input_variables[0].value = 3.0
+        engine.input_variables[1].value = 7.0
+        engine.process()
+
+        with patch.object(fl.Antecedent, "load", side_effect=AssertionError), \
+                patch.object(fl.Consequent, "load", side_effect=AssertionError), \
+                patch.object(fl.Function, "parse", side_effect=AssertionError):
+            clone = engine.clone()
+        self.assertEqual(str(engine), str(clone))
+
+        # the state is copied
+        self.assertEqual([v.value for v in engine.variables], [v.value for v in clone.variables])
+        self.assertEqual(str(ts_tip.fuzzy), str(clone.output_variable("tsTip").fuzzy))
+        self.assertEqual([(rule.activation_degree, rule.triggered)
+                          for block in engine.rule_blocks for rule in block.rules],
+                         [(rule.activation_degree, rule.triggered)
+                          for block in clone.rule_blocks for rule in block.rules])
+
+        # the components are shared, except for those referring to the engine
+        for variable, variable_clone in zip(engine.variables, clone.variables):
+            self.assertIsNot(variable, variable_clone)
+            for term, term_clone in zip(variable.terms, variable_clone.terms):
+                if isinstance(term, (fl.Linear, fl.Function)):
+                    self.assertIsNot(term, term_clone)
+                    self.assertIs(clone, term_clone.engine)  # type: ignore
+                else:
+                    self.assertIs(term, term_clone)
+        self.assertIs(ts_tip.term("function").root,  # type: ignore
+                      clone.output_variable("tsTip").term("function").root)  # type: ignore
+        for block, block_clone in zip(engine.rule_blocks, clone.rule_blocks):
+            self.assertIs(block.activation, block_clone.activation)
+            for rule, rule_clone in zip(block.rules, block_clone.rules):
+                self.assertIsNot(rule.antecedent.expression, rule_clone.antecedent.expression)
+                self.assertEqual(rule.antecedent.is_compiled(block.conjunction, block.disjunction),
+                                 rule_clone.antecedent.is_compiled(block.conjunction,
+                                                                   block.disjunction))
+                self.assertEqual([str(conclusion) for conclusion in rule.consequent.conclusions],
+                                 [str(conclusion)
+                                  for conclusion in rule_clone.consequent.conclusions])
+            self.assertTrue(all(rule.is_loaded() for rule in block_clone.rules))
+
+        # the engines are processed independently
+        for service, food in [(1.0, 2.0), (5.0, 8.0), (9.0, 4.0)]:
+            clone.input_variables[0].value = service
+            clone.input_variables[1].value = food
+            clone.process()
+            self.assertEqual([3.0, 7.0], [v.value for v in engine.input_variables])
+
+            expected = engine.evaluate([service, food])
+            self.assertEqual(expected, [v.value for v in clone.output_variables])
+
+    def test_process_batch(self) -> None:
+        import numpy as np  # type: ignore
+
+        engine = fl.FllImporter().from_string(TIPPER)
+        inputs = np.array([[service, food]
+                           for service in [-1.0, 0.0, 2.5, 3.3, 5.0, 7.1, 10.0, 11.0, fl.nan]
+                           for food in [-1.0, 0.0, 2.5, 5.0, 6.6, 10.0, 11.0, fl.nan]])
+
+        for activation in [fl.General(), fl.Proportional(), fl.Threshold(">", 0.3),
+                           fl.First(2, 0.1), fl.Last(2, 0.1),
+                           fl.Highest(2), fl.Lowest(2)]:
+            for block in engine.rule_blocks:
+                block.activation = activation
+            engine.restart()
+
+            expected = []
+            for service, food in inputs:
+                engine.input_variables[0].value = service
+                engine.input_variables[1].value = food
+                engine.process()
+                expected.append([output.value for output in engine.output_variables])
+            engine.restart()
+
+            obtained = engine.process_batch(inputs)
+            np.testing.assert_equal(obtained, np.array(expected), err_msg=str(activation))
+
+            self.assertTrue(all(np.isnan(variable.value) for variable in engine.variables))
+
+        with self.assertRaisesRegex(ValueError, r"expected a 2-D array of inputs with 2 columns, "
+                                                r"but found an array of shape \(2, 3\)"):
+            engine.process_batch(np.zeros((2, 3)))
+
+    def test_evaluate(self) -> None:
+        engine = fl.FllImporter().from_string(TIPPER)
+        inputs = [[service, food]
+                  for service in [-1.0, 0.0, 2.5, 3.3, 5.0, 7.1, 10.0, 11.0, fl.nan]
+                  for food in [-1.0, 0.0, 2.5, 5.0, 6.6, 10.0, 11.0, fl.nan]]
+
+        expected = []
+        for service, food in inputs:
+            engine.input_variables[0].value = service
+            engine.input_variables[1].value = food
+            engine.process()
+            expected.append([output.value for output in engine.output_variables])
+        engine.restart()
+        rules = [(rule.activation_degree, rule.triggered)
+                 for block in engine.rule_blocks for rule in block.rules]
+
+        # the previous values of the output variables are kept in the state
+        state = fl.State()
+        obtained = [engine.evaluate(row, state) for row in inputs]
+        self.assertEqual(str(expected), str(obtained))
+        self.assertEqual(state.values[engine.output_variable("mTip")], obtained[-1][0])
+        self.assertEqual(state.previous_values[engine.output_variable("mTip")],
+                         obtained[-2][0])
+
+        # the state of the engine is left unchanged
+        self.assertTrue(all(fl.isnan(variable.value) for variable in engine.variables))
+        self.assertTrue(all(fl.isnan(variable.previous_value)
+                            for variable in engine.output_variables))
+        self.assertTrue(all(not variable.fuzzy.terms for variable in engine.output_variables))
+        self.assertEqual(rules, [(rule.activation_degree, rule.triggered)
+                                 for block in engine.rule_blocks for rule in block.rules])
+
+        # a new state is equivalent to a restarted engine
+        self.assertEqual(expected[0], engine.evaluate(inputs[0]))
+        state.clear()
+        self.assertEqual(expected[0], engine.evaluate(inputs[0], state))
+
+        with self.assertRaisesRegex(ValueError, r"expected 2 input values, but found 1: \[1.0\]"):
+            engine.evaluate([1.0])
+
+    def test_evaluate_concurrently(self) -> None:
+        import concurrent.futures
+
+        engine = fl.FllImporter().from_string(TIPPER)
+        for block in engine.rule_blocks:
+            block.compile()
+        inputs = [[service / 10, food / 10] for service in range(0, 101, 5)
+                  for food in range(0, 101, 5)]
+
+        expected = []
+        for service, food in inputs:
+            engine.input_variables[0].value = service
+            engine.input_variables[1].value = food
+            engine.process()
+            expected.append([output.value for output in engine.output_variables])
+        engine.restart()
+
+        def evaluate(offset: int) -> List[List[float]]:
+            state = fl.State()
+            return [engine.evaluate(row, state) for row in inputs[offset:] + inputs[:offset]]
+
+        offsets = [0, 1, 7, 100, 400]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(offsets)) as executor:
+            results = list(executor.map(evaluate, offsets))
+        for offset, obtained in zip(offsets, results):
+            self.assertEqual(str(expected[offset:] + expected[:offset]), str(obtained))
+        self.assertTrue(all(fl.isnan(variable.value) for variable in engine.variables))
+
+    def test_process_steady_state(self) -> None:
+        import os
+        import tracemalloc
+
+        engine = fl.FllImporter().from_string(TIPPER)
+        inputs = [[service, food] for service in range(11) for food in range(11)]
+
+        def process(row: List[float]) -> None:
+            engine.input_variables[0].value = row[0]
+            engine.input_variables[1].value = row[1]
+            engine.process()
+
+        def evaluate(row: List[float]) -> None:
+            engine.evaluate(row, state)
+
+        # the activated terms are created once and reused every time the engine is processed
+        process(inputs[0])
+        activated = [list(variable.fuzzy.terms) for variable in engine.output_variables]
+        process(inputs[0])
+        for expected, variable in zip(activated, engine.output_variables):
+            self.assertEqual(len(expected), len(variable.fuzzy.terms))
+            for expected_term, obtained_term in zip(expected, variable.fuzzy.terms):
+                self.assertIs(expected_term, obtained_term)
+
+        # once warmed up, processing the engine allocates no memory that is kept afterwards, in
+        # the engine or in a state, except for the free lists of the interpreter, which are
+        # bounded and hence amount to far less than a byte per cycle
+        state = fl.State()
+        traced = [tracemalloc.Filter(True, os.path.join(os.path.dirname(fl.__file__), "*"))]
+        cycles = inputs * 4
+        tracemalloc.start()
+        try:
+            for cycle in [process, evaluate]:
+                for row in inputs:
+                    cycle(row)
+                before = tracemalloc.take_snapshot().filter_traces(traced)
+                for row in cycles:
+                    cycle(row)
+                after = tracemalloc.take_snapshot().filter_traces(traced)
+                allocated = sum(difference.size_diff
+                                for difference in after.compare_to(before, "filename"))
+                self.assertLess(allocated, len(cycles))
+
+                # neither is memory allocated while processing, other than the temporary values
+                # of a single cycle, so the peak stays flat however many cycles are processed
+                peaks = []
+                for rows in [inputs, cycles]:
+                    tracemalloc.clear_traces()
+                    for row in rows:
+                        cycle(row)
+                    peaks.append(tracemalloc.get_traced_memory()[1])
+                once, many = peaks
+                self.assertLess(once, 4096)
+                self.assertLessEqual(many, once + 256)
+        finally:
+            tracemalloc.stop()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,116 @@
+"""
+ pyfuzzylite (TM), a fuzzy logic control library in Python.
+ Copyright (C) 2010-2017 FuzzyLite Limited. All rights reserved.
+ Author: Juan Rada-Vilela, Ph.D. <jcrada@fuzzylite.com>
+
+ This file is part of pyfuzzylite.
+
+ pyfuzzylite is free software: you can redistribute it and/or modify it under
+ the terms of the FuzzyLite License included with the software.
+
+ You should have received a copy of the FuzzyLite License along with
+ pyfuzzylite. If not, see <http://www.fuzzylite.com/license/>.
+
+ pyfuzzylite is a trademark of FuzzyLite Limited
+ fuzzylite is a registered trademark of FuzzyLite Limited.
+"""
+
+import pickle
+import unittest
+from typing import List
+
+import fuzzylite as fl
+
+SimpleDimmer = """
+Engine: SimpleDimmer
+InputVariable: Ambient
+  enabled: true
+  range: 0.000 1.000
+  lock-range: false
+  term: DARK Triangle 0.000 0.250 0.500
+  term: MEDIUM Triangle 0.250 0.500 0.750
+  term: BRIGHT Triangle 0.500 0.750 1.000
+OutputVariable: Power
+  enabled: true
+  range: 0.000 1.000
+  lock-range: false
+  aggregation: Maximum
+  defuzzifier: Centroid 200
+  default: nan
+  lock-previous: false
+  term: LOW Triangle 0.000 0.250 0.500
+  term: MEDIUM Triangle 0.250 0.500 0.750
+  term: HIGH Triangle 0.500 0.750 1.000
+RuleBlock:
+  enabled: true
+  conjunction: none
+  disjunction: none
+  implication: Minimum
+  activation: General
+  rule: if Ambient is DARK then Power is HIGH
+  rule: if Ambient is MEDIUM then Power is MEDIUM
+  rule: if Ambient is BRIGHT then Power is LOW
+"""
+
+
+class TestEngineExecutor(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.engine = fl.FllImporter().from_string(SimpleDimmer)
+        self.inputs = [[x / 100] for x in range(-10, 111)]
+        self.expected = fl.EngineExecutor.evaluate(self.engine, self.inputs)
+
+    def assert_outputs(self, expected: List[List[float]], obtained: List[List[float]]) -> None:
+        self.assertEqual(len(expected), len(obtained))
+        for row, (expected_row, obtained_row) in enumerate(zip(expected, obtained)):
+            self.assertEqual(str(expected_row), str(obtained_row), f"in row {row}")
+
+    def test_constructor(self) -> None:
+        executor = fl.EngineExecutor(self.engine)
+        self.assertEqual(executor.format, fl.EngineExecutor.Format.Pickle)
+        self.assertGreaterEqual(executor.workers, 1)
+        self.assertEqual(executor.chunk_size, 1000)
+        self.assertEqual(executor.batch, False)
+
+        executor = fl.EngineExecutor(self.engine, workers=3, chunk_size=10, format="FLL")
+        self.assertEqual(executor.format, fl.EngineExecutor.Format.FLL)
+        self.assertEqual(executor.workers, 3)
+        self.assertEqual(executor.chunk_size, 10)
+
+        with self.assertRaisesRegex(ValueError,
+                                    "expected a chunk size greater than zero, but found 0"):
+            fl.EngineExecutor(self.engine, chunk_size=0)
+
+    def test_definition(self) -> None:
+        self.assertEqual(fl.EngineExecutor(self.engine, format="FLL").definition(),
+                         fl.FllExporter().to_string(self.engine))
+
+        self.engine.rule_blocks[0].compile()
+        engine = pickle.loads(fl.EngineExecutor(self.engine).definition())  # type: ignore
+        self.assertEqual(str(engine), str(self.engine))
+
+    def test_evaluate(self) -> None:
+        self.assertEqual(len(self.expected), len(self.inputs))
+        self.assertEqual(str(self.expected[0]), "[nan]")
+        self.assertEqual(self.expected[60], [0.49999999999999956])
+        with self.assertRaisesRegex(ValueError,
+                                    r"expected 1 input values, but found 2: \[0.0, 1.0\]"):
+            fl.EngineExecutor.evaluate(self.engine, [[0.0, 1.0]])
+
+    def test_process(self) -> None:
+        for format in fl.EngineExecutor.Format:
+            for chunk_size in [1, 7, 1000]:
+                with fl.EngineExecutor(self.engine, workers=2, chunk_size=chunk_size,
+                                       format=format) as executor:
+                    self.assert_outputs(self.expected, executor.process(self.inputs))
+                    self.assert_outputs(self.expected[:10],
+                                        list(executor.map(iter(self.inputs[:10]))))
+                    self.assertEqual([], executor.process([]))
+
+    def test_process_batch(self) -> None:
+        with fl.EngineExecutor(self.engine, workers=2, chunk_size=16, batch=True) as executor:
+            self.assert_outputs(self.expected, executor.process(self.inputs))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -15,6 +15,7 @@
  fuzzylite is a registered trademark of FuzzyLite Limited.
 """
 
+import operator
 import unittest
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Type, Union
 
@@ -291,6 +292,65 @@ class TestFunctionFactory(unittest.TestCase):
                 ("or", (1, 0)): 1, ("or", (0, 0)): 0,
             })
 
+    def test_methods_array(self) -> None:
+        import numpy as np  # type: ignore
+        values = np.array([-2.0, -0.5, 0.0, 0.5, 1.0, 2.0])
+        for element in fl.FunctionFactory().objects.values():
+            self.assertIsNotNone(element.method_array, element.name)
+            if element.arity == 0:
+                self.assertEqual(element.method(), element.method_array())  # type: ignore
+                continue
+            arguments = [values] * element.arity
+            with np.errstate(all='ignore'):
+                obtained = element.method_array(*arguments)  # type: ignore
+            for index, value in enumerate(values.tolist()):
+                try:
+                    expected = float(element.method(*[value] * element.arity))
+                except (ArithmeticError, ValueError, TypeError):
+                    # e.g., division by zero, math domain errors, and complex numbers
+                    continue
+                self.assertAlmostEqual(expected, float(obtained[index]), places=15,
+                                       msg=f"{element.name}({value})")
+
+    def test_register(self) -> None:
+        factory = fl.FunctionFactory()
+        tokenizer = factory.tokenizer()
+        self.assertIs(tokenizer, factory.tokenizer())
+        self.assertEqual(["a ", "+", " b"], [token for token in tokenizer.split("a + b") if token])
+
+        self.assertEqual("a b +", factory.postfix("a+b"))
+        self.assertEqual("a b +", factory.postfix("a+b"))
+        self.assertEqual(1, factory._postfix.cache_info().hits)  # type: ignore
+        self.assertEqual("a@b", factory.postfix("a@b"))
+
+        factory.register(fl.Function.Element("@", "Matrix multiplication",
+                                             fl.Function.Element.Type.Operator, operator.matmul,
+                                             arity=2, precedence=factory._precedence(2)))
+        self.assertIsNot(tokenizer, factory.tokenizer())
+        self.assertEqual(0, factory._postfix.cache_info().currsize)  # type: ignore
+        self.assertEqual("a b @ c +", factory.postfix("a@b+c"))
+
+        # the elements set in the objects also clear the tokenizer and the postfix notations
+        factory.objects["$"] = fl.Function.Element("$", "Concatenation",
+                                                   fl.Function.Element.Type.Operator,
+                                                   lambda a, b: 10 * a + b,
+                                                   arity=2, precedence=factory._precedence(2))
+        self.assertEqual("a b $", factory.postfix("a$b"))
+        del factory.objects["$"]
+        self.assertEqual("a$b", factory.postfix("a$b"))
+
+        elements = fl.lib.factory_manager.function.objects
+        try:
+            elements["$"] = fl.Function.Element("$", "Concatenation",
+                                                fl.Function.Element.Type.Operator,
+                                                lambda a, b: 10 * a + b,
+                                                arity=2, precedence=factory._precedence(2))
+            self.assertEqual("3 2 $", fl.Function.infix_to_postfix("3 $ 2"))
+            self.assertEqual(32.0, fl.Function.create("f", "3 $ 2").evaluate())
+        finally:
+            del elements["$"]
+        self.assertEqual("3 $ 2", fl.Function.infix_to_postfix("3 $ 2"))
+
     @unittest.skip("Until fl.Function is ready")
     def test_function_precedence(self) -> None:
         pass
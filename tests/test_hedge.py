@@ -31,11 +31,23 @@ class HedgeAssert(BaseAssert[fl.Hedge]):
                 self.test.assertEqual(isnan(self.actual.hedge(a)), True, f"when x={a}")
             else:
                 self.test.assertEqual(self.actual.hedge(a), z, f"when x={a}")
+        return self.evaluates_array(az)
+
+    def evaluates_array(self, az: Dict[float, float]) -> 'HedgeAssert':
+        import numpy as np  # type: ignore
+        np.testing.assert_equal(self.actual.hedge_array(np.array(list(az.keys()))),
+                                np.array(list(az.values())))
         return self
 
 
 class TestHedge(unittest.TestCase):
 
+    def test_slots(self) -> None:
+        factory = fl.lib.factory_manager.hedge
+        for name in factory.constructors:
+            self.assertFalse(hasattr(factory.construct(name), "__dict__"), name)
+        self.assertFalse(hasattr(fl.HedgeLambda("lambda", lambda x: x), "__dict__"))
+
     def test_any(self) -> None:
         HedgeAssert(self, fl.Any()) \
             .has_name("any") \
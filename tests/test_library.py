@@ -25,32 +25,38 @@ class TestLibrary(unittest.TestCase):
     def test_library_exports_dir(self) -> None:
         expected = {'Activated', 'Activation', 'ActivationFactory', 'Aggregated',
                     'AlgebraicProduct', 'AlgebraicSum', 'Antecedent', 'Any', 'Bell', 'Binary',
-                    'Bisector', 'BoundedDifference', 'BoundedSum', 'Centroid', 'CloningFactory',
+                    'Bisector', 'BoundedDifference', 'BoundedSum', 'Centroid',
+                    'CloningFactory',
                     'Concave', 'Consequent', 'Constant', 'ConstructionFactory', 'Cosine',
                     'Defuzzifier', 'DefuzzifierFactory', 'Discrete', 'DrasticProduct', 'DrasticSum',
-                    'EinsteinProduct', 'EinsteinSum', 'Engine', 'Exporter', 'Expression',
+                    'EinsteinProduct', 'EinsteinSum', 'Engine', 'EngineExecutor', 'EnginePool',
+                    'Exporter', 'Expression',
                     'Extremely', 'FactoryManager', 'First', 'FldExporter', 'FllExporter',
                     'FllImporter', 'Function', 'FunctionFactory', 'Gaussian',
                     'GaussianProduct', 'General', 'HamacherProduct', 'HamacherSum', 'Hedge',
                     'HedgeFactory', 'HedgeFunction', 'HedgeLambda', 'Highest', 'Importer',
                     'InputVariable', 'IntegralDefuzzifier', 'LargestOfMaximum', 'Last', 'Library',
-                    'Linear', 'Lowest', 'Maximum', 'MeanOfMaximum', 'Minimum', 'NilpotentMaximum',
-                    'NilpotentMinimum', 'Norm', 'NormFunction', 'NormLambda', 'NormalizedSum',
+                    'Linear', 'Lookup', 'Lowest', 'Maximum', 'MeanOfMaximum', 'Minimum',
+                    'NilpotentMaximum', 'NilpotentMinimum', 'Norm', 'NormFunction', 'NormLambda',
+                    'NormalizedSum',
                     'Not', 'Op', 'Operation', 'Operator', 'OutputVariable', 'PiShape',
                     'Proportional', 'Proposition', 'PythonExporter', 'Ramp', 'Rectangle', 'Rule',
                     'RuleBlock',
                     'SNorm', 'SNormFactory', 'SShape', 'Seldom', 'Sigmoid', 'SigmoidDifference',
-                    'SigmoidProduct', 'SmallestOfMaximum', 'Somewhat', 'Spike', 'TNorm',
-                    'TNormFactory', 'Term', 'TermFactory', 'Threshold', 'Trapezoid', 'Triangle',
+                    'SigmoidProduct', 'SmallestOfMaximum', 'Somewhat', 'Spike', 'State', 'TNorm',
+                    'TNormFactory', 'Term', 'TermFactory', 'Threshold', 'Tracer', 'Trapezoid',
+                    'Triangle',
                     'UnboundedSum', 'Variable', 'Very', 'WeightedAverage', 'WeightedDefuzzifier',
                     'WeightedSum', 'ZShape', '__annotations__', '__builtins__', '__cached__',
                     '__doc__', '__file__', '__loader__', '__name__', '__package__', '__path__',
-                    '__spec__', '__version__', 'activation', 'defuzzifier', 'engine', 'exporter',
+                    '__spec__', '__version__', 'activation', 'defuzzifier', 'engine',
+                    'executor', 'exporter',
                     'factory', 'hedge', 'importer', 'inf', 'isinf', 'isnan', 'lib', 'library',
                     'nan', 'norm',
-                    'operation', 'rule', 'scalar', 'term', 'variable'}
+                    'operation', 'pool', 'rule', 'scalar', 'state', 'term', 'tracer', 'variable'}
 
-        self.assertSetEqual(expected, set(dir(fuzzylite)))
+        # the benchmark is a submodule imported on demand (e.g., by its tests)
+        self.assertSetEqual(expected, set(dir(fuzzylite)) - {'benchmark'})
 
     def test_library_vars(self) -> None:
         self.assertEqual(fuzzylite.__name__, "pyfuzzylite")
@@ -40,6 +40,17 @@ class NormAssert(BaseAssert[fl.Norm]):
             if commutative:
                 self.test.assertEqual(z, self.actual.compute(*reversed(ab)),
                                       f"when ({tuple(reversed(ab))})")
+        return self.evaluates_array(abz, commutative)
+
+    def evaluates_array(self,
+                        abz: Dict[Tuple[float, float], float],
+                        commutative: bool = True) -> 'NormAssert':
+        import numpy as np  # type: ignore
+        a, b = np.array(list(abz.keys())).T
+        z = np.array(list(abz.values()))
+        np.testing.assert_equal(self.actual.compute_array(a, b), z)
+        if commutative:
+            np.testing.assert_equal(self.actual.compute_array(b, a), z)
         return self
 
 
@@ -0,0 +1,92 @@
+"""
+ pyfuzzylite (TM), a fuzzy logic control library in Python.
+ Copyright (C) 2010-2017 FuzzyLite Limited. All rights reserved.
+ Author: Juan Rada-Vilela, Ph.D. <jcrada@fuzzylite.com>
+
+ This file is part of pyfuzzylite.
+
+ pyfuzzylite is free software: you can redistribute it and/or modify it under
+ the terms of the FuzzyLite License included with the software.
+
+ You should have received a copy of the FuzzyLite License along with
+ pyfuzzylite. If not, see <http://www.fuzzylite.com/license/>.
+
+ pyfuzzylite is a trademark of FuzzyLite Limited
+ fuzzylite is a registered trademark of FuzzyLite Limited.
+"""
+import concurrent.futures
+import threading
+import unittest
+from typing import List
+
+import fuzzylite as fl
+from tests.test_engine import TIPPER
+
+
+class TestEnginePool(unittest.TestCase):
+
+    def test_checkout_checkin(self) -> None:
+        engine = fl.FllImporter().from_string(TIPPER)
+        pool = fl.EnginePool(engine, size=2, maximum=3)
+        self.assertEqual(2, len(pool))
+        self.assertEqual(2, pool.available)
+
+        a = pool.checkout()
+        b = pool.checkout()
+        c = pool.checkout()
+        self.assertEqual(4, len({a, b, c, engine}))
+        self.assertEqual(3, len(pool))
+        self.assertEqual(0, pool.available)
+        with self.assertRaisesRegex(TimeoutError, "expected an engine available within 0.01 "
+                                                  "seconds, but all 3 engines are checked out"):
+            pool.checkout(timeout=0.01)
+
+        a.input_variables[0].value = 5.0
+        pool.checkin(a)
+        self.assertEqual(1, pool.available)
+        with self.assertRaisesRegex(ValueError, "expected an engine checked out from the pool, "
+                                                "but found engine 'tipper'"):
+            pool.checkin(a)
+
+        # engines are restarted when checked in
+        with pool.borrow() as borrowed:
+            self.assertIs(a, borrowed)
+            self.assertTrue(fl.isnan(borrowed.input_variables[0].value))
+        self.assertEqual(1, pool.available)
+
+        with self.assertRaisesRegex(ValueError, "expected a maximum number of engines greater "
+                                                "than zero, but found 0"):
+            fl.EnginePool(engine, maximum=0)
+
+    def test_checkout_waits_for_checkin(self) -> None:
+        engine = fl.FllImporter().from_string(TIPPER)
+        pool = fl.EnginePool(engine, maximum=1)
+        checked_out = pool.checkout()
+        timer = threading.Timer(0.05, pool.checkin, [checked_out])
+        timer.start()
+        self.assertIs(checked_out, pool.checkout(timeout=10.0))
+        timer.join()
+
+    def test_concurrent_checkouts(self) -> None:
+        engine = fl.FllImporter().from_string(TIPPER)
+        inputs = [[service / 2, food / 2] for service in range(21) for food in range(21)]
+        expected = [engine.evaluate(row) for row in inputs]
+
+        pool = fl.EnginePool(engine, maximum=3)
+
+        def process(row: List[float]) -> List[float]:
+            with pool.borrow() as borrowed:
+                for variable, value in zip(borrowed.input_variables, row):
+                    variable.value = value
+                borrowed.process()
+                return [variable.value for variable in borrowed.output_variables]
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            obtained = list(executor.map(process, inputs))
+        self.assertEqual(str(expected), str(obtained))
+        self.assertLessEqual(len(pool), 3)
+        self.assertEqual(len(pool), pool.available)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -15,9 +15,10 @@
  fuzzylite is a registered trademark of FuzzyLite Limited.
 """
 
+import pickle
 import unittest
 from typing import Dict, List, Optional, Type, Union
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import fuzzylite as fl
 from tests.assert_component import BaseAssert
@@ -49,6 +50,45 @@ OutputVariable: Power
   """
 
 
+SparseDimmer = """
+Engine: SparseDimmer
+InputVariable: Ambient
+  range: 0.000 1.000
+  term: DARK Triangle 0.000 0.250 0.500
+  term: MEDIUM Triangle 0.250 0.500 0.750
+  term: BRIGHT Triangle 0.500 0.750 1.000
+InputVariable: Light
+  range: 0.000 1.000
+  term: OFF Ramp 0.500 0.000
+  term: ON Ramp 0.500 1.000
+OutputVariable: Power
+  range: 0.000 1.000
+  aggregation: Maximum
+  defuzzifier: Centroid 200
+  default: nan
+  term: LOW Triangle 0.000 0.250 0.500
+  term: MEDIUM Triangle 0.250 0.500 0.750
+  term: HIGH Triangle 0.500 0.750 1.000
+RuleBlock:
+  conjunction: Minimum
+  disjunction: Maximum
+  implication: Minimum
+  activation: General
+  rule: if Ambient is DARK and Light is OFF then Power is HIGH
+  rule: if Ambient is MEDIUM and Light is OFF then Power is MEDIUM
+  rule: if Ambient is BRIGHT and Light is OFF then Power is LOW with 0.5
+  rule: if Light is OFF and Ambient is DARK and Ambient is DARK then Power is HIGH
+  rule: if Ambient is MEDIUM and Light is ON and Ambient is BRIGHT then Power is LOW
+  rule: if Ambient is BRIGHT and Light is ON then Power is LOW with 0.0
+  rule: if Ambient is MEDIUM then Power is MEDIUM
+  rule: if Ambient is DARK or Light is ON then Power is LOW
+  rule: if Ambient is somewhat BRIGHT and Light is OFF then Power is HIGH
+  rule: if Ambient is DARK and Power is HIGH then Power is LOW
+  rule: if Ambient is BRIGHT and Light is ON then Power is HIGH with -1.0
+  rule: if Light is ON then Power is HIGH
+"""
+
+
 class TestExpression(unittest.TestCase):
 
     def test_proposition(self) -> None:
@@ -143,6 +183,12 @@ class AssertAntecedent:
                 expected = values[index]
                 self.test.assertAlmostEqual(expected, obtained, places=decimal_places,
                                             msg=f"at index {index}")
+
+                antecedent.compile(conjunction, disjunction)
+                self.test.assertTrue(antecedent.is_compiled(conjunction, disjunction))
+                compiled = antecedent.activation_degree(
+                    conjunction=conjunction, disjunction=disjunction)
+                self.test.assertEqual(obtained, compiled, msg=f"at index {index}")
             index += 1
 
         return self
@@ -624,11 +670,21 @@ class RuleAssert:
 
 class TestRule(unittest.TestCase):
 
+    def test_slots(self) -> None:
+        engine = fl.FllImporter().from_string(SimpleDimmer)
+        rule = fl.Rule.create("if Ambient is DARK or Ambient is not BRIGHT "
+                              "then Power is HIGH", engine)
+        components = [rule, rule.antecedent, rule.antecedent.expression,
+                      rule.antecedent.expression.left,  # type: ignore
+                      rule.consequent, rule.consequent.conclusions[0]]
+        for component in components:
+            self.assertFalse(hasattr(component, "__dict__"), type(component).__name__)
+
     def test_text_setter(self) -> None:
         rule = fl.Rule()
-        rule.parse = MagicMock()  # type: ignore
-        rule.text = "if a then b"
-        rule.parse.assert_called_once_with("if a then b")  # type: ignore
+        with patch.object(fl.Rule, "parse") as parse:
+            rule.text = "if a then b"
+        parse.assert_called_once_with("if a then b")
 
     def test_can_parse_rule(self) -> None:
         RuleAssert(self).can_parse_rule("if a then b")
@@ -680,14 +736,14 @@ class TestRule(unittest.TestCase):
         rule.load(fl.FllImporter().from_string(SimpleDimmer))
         self.assertTrue(rule.is_loaded())
 
-        rule.antecedent.activation_degree = MagicMock(return_value=0.5)  # type: ignore
         weights = [0.0, 0.1, 0.25, 0.5, 0.75, 0.9, 1.0, -fl.inf, fl.inf]
         expected = [0.0, 0.05, 0.125, 0.25, 0.375, 0.45, 0.5, -fl.inf, fl.inf]
 
         obtained = []
-        for weight in weights:
-            rule.weight = weight
-            obtained.append(rule.activate_with(None, None))
+        with patch.object(fl.Antecedent, "activation_degree", return_value=0.5):
+            for weight in weights:
+                rule.weight = weight
+                obtained.append(rule.activate_with(None, None))
 
         self.assertEqual(expected, obtained)
 
@@ -701,7 +757,9 @@ class TestRule(unittest.TestCase):
         rule.load(fl.FllImporter().from_string(SimpleDimmer))
         self.assertTrue(rule.is_loaded())
 
-        rule.consequent.modify = MagicMock()  # type: ignore
+        modify = patch.object(fl.Consequent, "modify")
+        modify.start()
+        self.addCleanup(modify.stop)
         # combinations: enabled and activation_degree
         rule.enabled = False
         rule.activation_degree = 0.0
@@ -734,9 +792,9 @@ class TestRule(unittest.TestCase):
                  (False, True): False,
                  (False, False): False}
         for premise, expected in cases.items():
-            rule.antecedent.is_loaded = MagicMock(return_value=premise[0])  # type: ignore
-            rule.consequent.is_loaded = MagicMock(return_value=premise[1])  # type: ignore
-            self.assertEqual(expected, rule.is_loaded())
+            with patch.object(fl.Antecedent, "is_loaded", return_value=premise[0]), \
+                    patch.object(fl.Consequent, "is_loaded", return_value=premise[1]):
+                self.assertEqual(expected, rule.is_loaded())
 
     def test_unload(self) -> None:
         engine = fl.FllImporter().from_string(SimpleDimmer)
@@ -812,6 +870,161 @@ class TestRuleBlock(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, "expected an activation method, but found none"):
             rb.activate()
 
+    def test_compile(self) -> None:
+        engine = fl.FllImporter().from_string(SimpleDimmer)
+        rule_block = fl.RuleBlock(conjunction=fl.Minimum(), disjunction=fl.Maximum(),
+                                  rules=[fl.Rule.create("if Ambient is DARK or Ambient is very "
+                                                        "MEDIUM then Power is HIGH", engine),
+                                         fl.Rule.create("if Ambient is BRIGHT and Ambient is "
+                                                        "not DARK then Power is LOW", engine),
+                                         fl.Rule.create("if Ambient is any then Power is LOW")])
+        antecedents = [rule.antecedent for rule in rule_block.rules]
+
+        rule_block.compile()
+        self.assertEqual([True, True, False],
+                         [antecedent.is_compiled(rule_block.conjunction, rule_block.disjunction)
+                          for antecedent in antecedents])
+        self.assertEqual([False, False, False],
+                         [antecedent.is_compiled(fl.Minimum(), fl.Maximum())
+                          for antecedent in antecedents])
+
+        ambient = engine.input_variable("Ambient")
+        for value in [fl.nan, -1.0, 0.0, 0.1, 0.3, 0.5, 0.65, 0.7, 0.9, 1.0]:
+            ambient.value = value
+            for antecedent in antecedents[:2]:
+                self.assertEqual(
+                    str(antecedent.activation_degree(rule_block.conjunction,
+                                                     rule_block.disjunction,
+                                                     antecedent.expression)),
+                    str(antecedent.activation_degree(rule_block.conjunction,
+                                                     rule_block.disjunction)))
+
+        rule_block.reload_rules(engine)
+        self.assertEqual([False, False, False],
+                         [antecedent.is_compiled(rule_block.conjunction, rule_block.disjunction)
+                          for antecedent in antecedents])
+
+        with self.assertRaisesRegex(RuntimeError, "antecedent 'Ambient is any' is not loaded"):
+            fl.Rule.create("if Ambient is any then Power is LOW").antecedent.compile()
+        with self.assertRaisesRegex(ValueError, "expected a conjunction operator, but found none"):
+            rule_block.rules[1].antecedent.compile(None, fl.Maximum())
+
+    def test_index(self) -> None:
+        engine = fl.FllImporter().from_string(SparseDimmer)
+        rule_block = engine.rule_blocks[0]
+        rule_block.conjunction = fl.Minimum()
+
+        index = rule_block.index()
+        self.assertIs(index, rule_block.index())
+        self.assertEqual(rule_block.rules, index.rules)
+        self.assertIs(rule_block.conjunction, index.conjunction)
+        self.assertEqual(["Ambient", "Light"], [variable.name for variable, _ in index.terms])
+        self.assertEqual([["DARK", "MEDIUM", "BRIGHT"], ["OFF", "ON"]],
+                         [[term.name for term in terms] for _, terms in index.terms])
+        # the rules with disjunctions, hedges, output variables or negative weights
+        self.assertEqual([7, 8, 9, 10], index.unindexed)
+        self.assertEqual(5, len(index.tree))
+        self.assertEqual([0, 3], index.tree[frozenset([index.terms[0][1][0]])][
+            frozenset([index.terms[1][1][0]])])
+        self.assertEqual([11], index.tree[frozenset()][frozenset([index.terms[1][1][1]])])
+
+        # the conjunctions not annihilating by zero only index the single propositions
+        rule_block.conjunction = fl.BoundedDifference()
+        index = rule_block.index()
+        self.assertEqual([0, 1, 2, 3, 4, 5, 7, 8, 9, 10], index.unindexed)
+
+        rule_block.conjunction = fl.AlgebraicProduct()
+        self.assertIsNot(index, rule_block.index())
+        index = rule_block.index()
+        rule_block.rules.append(fl.Rule.create("if Light is ON then Power is HIGH", engine))
+        self.assertIsNot(index, rule_block.index())
+        index = rule_block.index()
+        rule_block.reload_rules(engine)
+        self.assertIsNot(index, rule_block.index())
+        index = rule_block.index()
+        rule_block.rules[1] = fl.Rule.create("if Ambient is DARK then Power is HIGH", engine)
+        self.assertIsNot(index, rule_block.index())
+        index = rule_block.index()
+        rule_block.rules[1].parse("if Ambient is BRIGHT then Power is HIGH with 0.5")
+        self.assertIsNot(index, rule_block.index())
+        index = rule_block.index()
+        rule_block.rules[1].load(engine)
+        self.assertIsNot(index, rule_block.index())
+        index = rule_block.index()
+        rule_block.rules[1].weight = 0.25
+        self.assertIsNot(index, rule_block.index())
+        index = rule_block.index()
+        rule_block.rules.reverse()
+        self.assertIsNot(index, rule_block.index())
+        index = rule_block.index()
+        del rule_block.rules[0]
+        self.assertIsNot(index, rule_block.index())
+        index = rule_block.index()
+        rule_block.rules = rule_block.rules[::-1]
+        self.assertIsInstance(rule_block.rules, fl.RuleBlock.Rules)
+        self.assertIsNot(index, rule_block.index())
+        # the index is not created again while the rules do not change
+        index = rule_block.index()
+        engine.process()
+        self.assertIs(index, rule_block.index())
+        rule_block.reindex()
+        self.assertIsNot(index, rule_block.index())
+        # the index is created again after unpickling
+        self.assertIsNone(pickle.loads(pickle.dumps(rule_block))._index)
+
+    def test_candidates(self) -> None:
+        engine = fl.FllImporter().from_string(SparseDimmer)
+        rule_block = engine.rule_blocks[0]
+        ambient, light = engine.input_variables
+        values = [fl.nan, -fl.inf, -1.0, 0.0, 0.1, 0.25, 0.4, 0.5, 0.6, 0.75, 1.0, fl.inf]
+        self.assertTrue(fl.RuleBlock.sparse)
+
+        def activate(sparse: bool, state: Optional[fl.State]) -> str:
+            rule_block.sparse = sparse
+            if state is None:
+                engine.process()
+                return str([engine.output_variables[0].value]
+                           + [(rule.activation_degree, rule.triggered)
+                              for rule in rule_block.rules])
+            state.clear()
+            return str(engine.evaluate([ambient.value, light.value], state)
+                       + [(state.activation_degrees[rule], state.triggered[rule])
+                          for rule in rule_block.rules])
+
+        for conjunction in [fl.Minimum(), fl.AlgebraicProduct(), fl.BoundedDifference()]:
+            for activation in [fl.General(), fl.Proportional(), fl.Threshold(">", 0.25)]:
+                rule_block.conjunction = conjunction
+                rule_block.activation = activation
+                for enabled in [True, False]:
+                    light.enabled = enabled
+                    for ambient.value in values:
+                        for light.value in values:
+                            for state in [None, fl.State()]:
+                                self.assertEqual(activate(False, state), activate(True, state),
+                                                 f"{conjunction}, {activation}, {enabled}, "
+                                                 f"{ambient.value}, {light.value}")
+
+        rule_block.sparse = True
+        rule_block.conjunction = fl.Minimum()
+        light.enabled = True
+        ambient.value, light.value = 0.1, 0.0
+        self.assertEqual([0, 3, 7, 8, 9, 10],
+                         [rule_block.rules.index(rule) for rule in rule_block.candidates()])
+        # the membership function values other than zero or finite and positive activate all
+        ambient.value = fl.nan
+        self.assertEqual(rule_block.rules, rule_block.candidates())
+        rule_block.sparse = False
+        ambient.value = 0.1
+        self.assertEqual(rule_block.rules, rule_block.candidates())
+
+        # the rules replaced are activated as expected
+        ambient.value = 0.1
+        expected = activate(True, None)
+        rule_block.rules[1] = fl.Rule.create("if Ambient is not MEDIUM then Power is LOW", engine)
+        self.assertNotEqual(expected, activate(True, None))
+        self.assertEqual(activate(False, None), activate(True, None))
+        self.assertEqual(1.0, rule_block.rules[1].activation_degree)
+
     def test_unload_rules(self) -> None:
         engine = fl.FllImporter().from_string(SimpleDimmer)
         rb = fl.RuleBlock(
@@ -863,14 +1076,12 @@ class TestRuleBlock(unittest.TestCase):
         engine = fl.FllImporter().from_string(SimpleDimmer)
 
         rule = fl.Rule.create("if Ambient is DARK then Power is HIGH", engine)
-        rule.load = MagicMock()  # type: ignore
-        rule.unload = MagicMock()  # type: ignore
-
         rb = fl.RuleBlock(rules=[rule])
 
-        rb.reload_rules(engine)
-        rule.unload.assert_called()  # type: ignore
-        rule.load.assert_called_once_with(engine)  # type: ignore
+        with patch.object(fl.Rule, "load") as load, patch.object(fl.Rule, "unload") as unload:
+            rb.reload_rules(engine)
+        unload.assert_called()
+        load.assert_called_once_with(engine)
 
 
 if __name__ == '__main__':
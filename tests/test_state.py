@@ -0,0 +1,117 @@
+"""
+ pyfuzzylite (TM), a fuzzy logic control library in Python.
+ Copyright (C) 2010-2017 FuzzyLite Limited. All rights reserved.
+ Author: Juan Rada-Vilela, Ph.D. <jcrada@fuzzylite.com>
+
+ This file is part of pyfuzzylite.
+
+ pyfuzzylite is free software: you can redistribute it and/or modify it under
+ the terms of the FuzzyLite License included with the software.
+
+ You should have received a copy of the FuzzyLite License along with
+ pyfuzzylite. If not, see <http://www.fuzzylite.com/license/>.
+
+ pyfuzzylite is a trademark of FuzzyLite Limited
+ fuzzylite is a registered trademark of FuzzyLite Limited.
+"""
+import threading
+import unittest
+
+import fuzzylite as fl
+
+
+class TestState(unittest.TestCase):
+
+    def test_bind(self) -> None:
+        input_variable = fl.InputVariable("input", minimum=0.0, maximum=1.0, lock_range=True)
+        output_variable = fl.OutputVariable("output")
+        rule = fl.Rule()
+        rule.consequent.conclusions.append(fl.Proposition(output_variable, term=fl.Triangle()))
+        input_variable.value = 0.25
+
+        state = fl.State()
+        self.assertIsNone(fl.State.current.get())
+        with state.bind() as bound:
+            self.assertIs(state, bound)
+            self.assertIs(state, fl.State.current.get())
+            # a new state is equivalent to a restarted engine
+            self.assertTrue(fl.isnan(input_variable.value))
+            self.assertTrue(fl.isnan(output_variable.previous_value))
+            self.assertEqual([], output_variable.fuzzy.terms)
+            self.assertEqual(0.0, rule.activation_degree)
+
+            input_variable.value = 2.0
+            input_variable.fuzzification = {}
+            output_variable.value = 3.0
+            output_variable.previous_value = 2.0
+            output_variable.fuzzy.terms.append(fl.Activated(fl.Triangle()))
+            rule.activation_degree = 0.5
+            rule.triggered = True
+            activated = rule.consequent.activated()
+            self.assertIs(activated, rule.consequent.activated())
+            self.assertEqual(1.0, input_variable.value)
+        self.assertIsNone(fl.State.current.get())
+
+        self.assertEqual(0.25, input_variable.value)
+        self.assertIsNone(input_variable.fuzzification)
+        self.assertTrue(fl.isnan(output_variable.value))
+        self.assertEqual([], output_variable.fuzzy.terms)
+        self.assertEqual((0.0, False), (rule.activation_degree, rule.triggered))
+        self.assertIsNot(activated[0], rule.consequent.activated()[0])
+
+        self.assertEqual({input_variable: 1.0, output_variable: 3.0}, state.values)
+        self.assertEqual({input_variable: {}}, state.fuzzifications)
+        self.assertEqual({output_variable: 2.0}, state.previous_values)
+        self.assertEqual(1, len(state.terms[output_variable.fuzzy]))
+        self.assertEqual({rule: 0.5}, state.activation_degrees)
+        self.assertEqual({rule: True}, state.triggered)
+        self.assertEqual({rule.consequent: activated}, state.activated)
+
+        with state.bind():
+            output_variable.clear()
+            self.assertTrue(fl.isnan(output_variable.value))
+            self.assertEqual([], output_variable.fuzzy.terms)
+
+        state.clear()
+        for values in [state.values, state.previous_values, state.fuzzifications, state.terms,
+                       state.activated, state.activation_degrees, state.triggered, state.samples]:
+            self.assertFalse(values)
+
+    def test_bound(self) -> None:
+        variable = fl.InputVariable("input")
+        variable.value = 0.25
+        self.assertEqual(0, fl.State.bound)
+        with fl.State().bind():
+            self.assertEqual(1, fl.State.bound)
+            with self.assertRaises(ValueError), fl.State().bind():
+                self.assertEqual(2, fl.State.bound)
+                variable.value = 0.5
+                raise ValueError()
+            self.assertEqual(1, fl.State.bound)
+            self.assertTrue(fl.isnan(variable.value))
+        self.assertEqual(0, fl.State.bound)
+        self.assertEqual(0.25, variable.value)
+
+        # the states bound in other threads are not seen, although they are counted
+        bound, release = threading.Event(), threading.Event()
+
+        def process() -> None:
+            with fl.State().bind():
+                variable.value = 0.75
+                bound.set()
+                release.wait()
+
+        thread = threading.Thread(target=process)
+        thread.start()
+        try:
+            bound.wait()
+            self.assertEqual(1, fl.State.bound)
+            self.assertEqual(0.25, variable.value)
+        finally:
+            release.set()
+            thread.join()
+        self.assertEqual(0, fl.State.bound)
+
+
+if __name__ == '__main__':
+    unittest.main()
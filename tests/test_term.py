@@ -18,6 +18,7 @@
 import copy
 import math
 import operator
+import pickle
 import platform
 import re
 import unittest
@@ -57,6 +58,7 @@ class TermAssert(BaseAssert[fl.Term]):
                              f"expected: \u03BC(x={x:.3f})={mf}, but"])
         if math.isnan(mf):
             self.test.assertEqual(str(fl.nan), str(self.actual.membership(x)), message)
+            self.test.assertEqual(str(fl.nan), str(self.actual.membership_array([x])[0]), message)
             return self
 
         # TODO: Find out why we get different values in different platforms
@@ -65,6 +67,9 @@ class TermAssert(BaseAssert[fl.Term]):
             self.test.assertEqual(mf, self.actual.membership(x), message)
         else:  # use approximate values in other platforms
             self.test.assertAlmostEqual(mf, self.actual.membership(x), places=15, msg=message)
+        # the vectorized membership functions may differ in the last digit in numpy
+        self.test.assertAlmostEqual(mf, self.actual.membership_array([x])[0], places=15,
+                                    msg=message)
         return self
 
     def has_memberships(self, x_mf: Dict[float, float], height: float = 1.0) -> 'TermAssert':
@@ -140,6 +145,64 @@ class TestTerm(unittest.TestCase):
                           0.8: 0.19999999999999996,
                           1.0: 0.0})
 
+    def test_slots(self) -> None:
+        factory = fl.lib.factory_manager.term
+        for name in factory.constructors:
+            term = factory.construct(name)
+            self.assertFalse(hasattr(term, "__dict__"), name)
+        for term in [fl.Activated(fl.Triangle()), fl.Aggregated(), fl.Discrete.Pair()]:
+            self.assertFalse(hasattr(term, "__dict__"), type(term).__name__)
+        with self.assertRaises(AttributeError):
+            fl.Triangle().vertex_z = 0.0  # type: ignore
+
+    def test_support(self) -> None:
+        discrete = fl.Discrete("discrete", fl.Discrete.pairs_from([0, 0, 1, 0, 2, 1, 3, 0, 4, 0]))
+        triangle = fl.Triangle("triangle", -0.5, 0.0, 0.5)
+        supports = {
+            fl.Term(): (-fl.inf, fl.inf),
+            fl.Gaussian("gaussian", 0.0, 0.2): (-fl.inf, fl.inf),
+            fl.Binary("binary", 0.0, fl.inf): (0.0, fl.inf),
+            fl.Binary("binary", 0.0, -fl.inf): (-fl.inf, 0.0),
+            fl.Cosine("cosine", 0.0, 1.0): (-0.5, 0.5),
+            discrete: (1.0, 3.0),
+            fl.Discrete("discrete", fl.Discrete.pairs_from([0, 1, 1, 0])): (-fl.inf, 1.0),
+            fl.PiShape("pi", -0.9, -0.1, 0.1, 0.9): (-0.9, 0.9),
+            fl.Ramp("ramp", 0.0, 1.0): (0.0, fl.inf),
+            fl.Ramp("ramp", 1.0, 0.0): (-fl.inf, 1.0),
+            fl.Rectangle("rectangle", -0.5, 0.5): (-0.5, 0.5),
+            fl.SShape("s_shape", -0.5, 0.5): (-0.5, fl.inf),
+            fl.Trapezoid("trapezoid", -fl.inf, -0.5, 0.0, 0.5): (-fl.inf, 0.5),
+            triangle: (-0.5, 0.5),
+            fl.Triangle("triangle", fl.nan, 0.0, 0.5): (-fl.inf, 0.5),
+            fl.Triangle("triangle", -0.5, 0.0, 0.5, fl.inf): (-fl.inf, fl.inf),
+            fl.ZShape("z_shape", -0.5, 0.5): (-fl.inf, 0.5),
+            # reversed parameters
+            fl.Ramp("ramp", 0.5, 0.5): (-fl.inf, fl.inf),
+            fl.Rectangle("rectangle", 0.5, -0.5): (0.5, -0.5),
+            fl.SShape("s_shape", 0.5, -0.5): (0.5, fl.inf),
+            fl.Sigmoid("sigmoid", 0.0, 10.0): (-fl.inf, fl.inf),
+            fl.Sigmoid("sigmoid", 0.0, -10.0): (-fl.inf, fl.inf),
+            fl.Triangle("triangle", 0.5, 0.0, -0.5): (0.5, -0.5),
+            fl.ZShape("z_shape", 0.5, -0.5): (-fl.inf, 0.5),
+            fl.ZShape("z_shape", fl.nan, 0.5): (-fl.inf, fl.inf),
+            fl.ZShape("z_shape", 0.5, fl.nan): (-fl.inf, 0.5),
+            fl.Activated(triangle, 0.5, fl.Minimum()): (-0.5, 0.5),
+            fl.Activated(triangle, 1.5, fl.BoundedDifference()): (-fl.inf, fl.inf),
+            fl.Activated(triangle, 0.5, fl.NormLambda(lambda a, b: 1.0 - a)): (-fl.inf, fl.inf),
+            fl.Aggregated("aggregated", aggregation=fl.Maximum(), terms=[
+                fl.Activated(triangle, 0.5, fl.Minimum()),
+                fl.Activated(discrete, 0.5, fl.Minimum())]): (-0.5, 3.0),
+            fl.Aggregated("aggregated", aggregation=fl.NormLambda(lambda a, b: 1.0 - a), terms=[
+                fl.Activated(triangle, 0.5, fl.Minimum())]): (-fl.inf, fl.inf),
+            fl.Aggregated("aggregated"): (fl.inf, -fl.inf),
+        }
+        for term, support in supports.items():
+            self.assertEqual(support, term.support(), str(term))
+            start, end = support
+            for x in [start - 1.0, start - 1e-9, end + 1e-9, end + 1.0]:
+                if not math.isinf(x) and not isinstance(term, fl.Aggregated):
+                    self.assertEqual(0.0, term.membership(x), f"for {term} at x={x}")
+
     def test_activated(self) -> None:
         TermAssert(self,
                    fl.Activated(
@@ -234,6 +297,86 @@ class TestTerm(unittest.TestCase):
 
         self.assertEqual(aggregated.range(), 2.0)
 
+    def test_aggregated_activation_degree(self) -> None:
+        from unittest.mock import patch
+
+        aggregated = fl.Aggregated("fuzzy_output", -1.0, 1.0, fl.AlgebraicSum())
+        low = fl.Triangle("LOW", -1.000, -0.500, 0.000)
+        medium = fl.Triangle("MEDIUM", -0.500, 0.000, 0.500)
+        high = fl.Triangle("HIGH", 0.000, 0.500, 1.000)
+        aggregated.clear()
+        for term, degree in [(low, 0.5), (medium, 0.25), (low, 0.5), (medium, 1.0)]:
+            aggregated.add_term(fl.Activated(term, degree, fl.Minimum()))
+        self.assertEqual(4, len(aggregated.terms))
+
+        # the activation degrees are indexed as the activated terms are added
+        with patch.object(fl.Aggregated, "_accumulate", side_effect=AssertionError):
+            self.assertEqual(0.75, aggregated.activation_degree(low))
+            self.assertEqual(1.0, aggregated.activation_degree(medium))
+            self.assertEqual(0.0, aggregated.activation_degree(high))
+
+        # and indexed again when the activated terms are added otherwise or replaced, or when
+        # the aggregation operator changes
+        aggregated.terms.append(fl.Activated(high, 0.5))
+        self.assertEqual(0.5, aggregated.activation_degree(high))
+        aggregated.aggregation = fl.Maximum()
+        self.assertEqual(0.5, aggregated.activation_degree(low))
+        aggregated.terms = [fl.Activated(low, 0.25), fl.Activated(medium, 0.5),
+                            fl.Activated(high, 0.75), fl.Activated(low, 0.125),
+                            fl.Activated(high, 0.25)]
+        self.assertEqual([0.25, 0.5, 0.75], [aggregated.activation_degree(term)
+                                             for term in [low, medium, high]])
+        aggregated.aggregation = None
+        self.assertEqual(0.375, aggregated.activation_degree(low))
+
+        # the index is kept in the bound state
+        with fl.State().bind():
+            self.assertEqual(0.0, aggregated.activation_degree(low))
+            aggregated.add_term(fl.Activated(low, 0.5))
+            self.assertEqual(0.5, aggregated.activation_degree(low))
+        self.assertEqual(0.375, aggregated.activation_degree(low))
+
+        aggregated.clear()
+        self.assertEqual(0.0, aggregated.activation_degree(low))
+
+    def test_aggregated_compaction(self) -> None:
+        aggregated = fl.Aggregated("fuzzy_output", -1.0, 1.0, fl.Maximum())
+        low = fl.Triangle("LOW", -1.000, -0.500, 0.000)
+        medium = fl.Triangle("MEDIUM", -0.500, 0.000, 0.500)
+        constant = fl.Constant("CONSTANT", -0.5)
+        activated = [fl.Activated(low, 0.25, fl.Minimum()), fl.Activated(medium, 0.5, fl.Minimum()),
+                     fl.Activated(low, 0.75, fl.Minimum()), fl.Activated(low, 0.5, fl.Minimum()),
+                     fl.Activated(low, 0.5, fl.AlgebraicProduct()),
+                     fl.Activated(low, 1.0, fl.AlgebraicProduct()),
+                     fl.Activated(constant, 0.5, fl.AlgebraicProduct()),
+                     fl.Activated(constant, 1.0, fl.AlgebraicProduct()),
+                     fl.Activated(medium, fl.nan, fl.Minimum())]
+        xs = [-1.0 + i / 8 for i in range(17)]
+        expected = fl.Aggregated("expected", -1.0, 1.0, fl.Maximum(),
+                                 [fl.Activated(term.term, term.degree, term.implication)
+                                  for term in activated])
+
+        for term in activated:
+            aggregated.add_term(term, compact=True)
+        # compacted into the activated terms of the same term and implication operator, except
+        # for the negative term and the activation degree that is not a number
+        self.assertEqual(["Minimum(0.750,LOW)", "Minimum(0.500,MEDIUM)",
+                          "AlgebraicProduct(1.000,LOW)", "AlgebraicProduct(0.500,CONSTANT)",
+                          "AlgebraicProduct(1.000,CONSTANT)", "Minimum(nan,MEDIUM)"],
+                         [term.parameters() for term in aggregated.terms])
+        self.assertEqual([expected.membership(x) for x in xs],
+                         [aggregated.membership(x) for x in xs])
+        self.assertEqual([expected.activation_degree(term) for term in [low, medium, constant]],
+                         [aggregated.activation_degree(term) for term in [low, medium, constant]])
+
+        # not compacted unless requested and the aggregation operator is Maximum
+        for aggregation, compact in [(fl.Maximum(), False), (fl.AlgebraicSum(), True)]:
+            aggregated.aggregation = aggregation
+            aggregated.clear()
+            for degree in [0.25, 0.5]:
+                aggregated.add_term(fl.Activated(low, degree, fl.Minimum()), compact)
+            self.assertEqual(2, len(aggregated.terms))
+
     def test_bell(self) -> None:
         TermAssert(self, fl.Bell("bell")) \
             .exports_fll("term: bell Bell nan nan nan") \
@@ -482,6 +625,63 @@ class TestTerm(unittest.TestCase):
             term.xy = []
             term.membership(0.0)
 
+    def test_discrete_arrays(self) -> None:
+        discrete = fl.Discrete("discrete")
+        discrete.set_points([0.0, 1.0, 2.0], [0.0, 1.0, 0.0])
+        self.assertEqual("0.000 0.000 1.000 1.000 2.000 0.000", discrete.parameters())
+        with self.assertRaisesRegex(ValueError, re.escape(
+                "expected the same number of values of x and y, "
+                "but found 3 values of x and 2 values of y")):
+            discrete.set_points([0.0, 1.0, 2.0], [0.0, 1.0])
+
+        # the pairs are a view of the arrays of the term
+        discrete.xy.append(fl.Discrete.Pair(3.0, 1.0))
+        discrete.xy[0] = fl.Discrete.Pair(-1.0, 0.5)
+        self.assertEqual([(-1.0, 0.5), (1.0, 1.0), (2.0, 0.0), (3.0, 1.0)], discrete.xy)
+        self.assertEqual((-1.0, 0.5), discrete.xy[0])
+        self.assertEqual([(2.0, 0.0), (3.0, 1.0)], discrete.xy[-2:])
+        del discrete.xy[-1]
+        discrete.xy.insert(0, fl.Discrete.Pair(-2.0, 0.0))
+        self.assertEqual([-2.0, -1.0, 1.0, 2.0], list(discrete.x()))
+        self.assertEqual([0.0, 0.5, 1.0, 0.0], list(discrete.y()))
+        self.assertEqual(0.25, discrete.membership(-1.5))
+
+        # the pairs write their values in the arrays of the term
+        discrete.xy[1].y = 0.75
+        pair = discrete.xy[-1]
+        pair.values = (2.5, 0.25)
+        for pair in discrete.xy[:1]:
+            pair.x -= 1.0
+        self.assertEqual([-3.0, -1.0, 1.0, 2.5], list(discrete.x()))
+        self.assertEqual([0.0, 0.75, 1.0, 0.25], list(discrete.y()))
+        self.assertEqual("-3.000 0.000 -1.000 0.750 1.000 1.000 2.500 0.250",
+                         discrete.parameters())
+        with self.assertRaises(IndexError):
+            discrete.xy[4].y = 0.0
+
+        discrete.xy.extend([fl.Discrete.Pair(3.0, 0.0), fl.Discrete.Pair(4.0, 1.0)])
+        self.assertEqual([(3.0, 0.0), (4.0, 1.0)], discrete.xy[-2:])
+        discrete.xy.clear()
+        self.assertEqual(0, len(discrete.xy))
+
+        # large curves are bisected on the arrays
+        resolution = 100_000
+        triangle = fl.Triangle("triangle", 0.0, 0.5, 1.0)
+        discrete = triangle.discretize(0.0, 1.0, resolution)
+        self.assertEqual(resolution + 1, len(discrete.xy))
+        for x in [0.0, 0.123456789, 0.25, 0.5, 0.987654321, 1.0]:
+            # values of x within the absolute tolerance of a point take the value of the point
+            self.assertAlmostEqual(triangle.membership(x), discrete.membership(x),
+                                   delta=2 * fl.lib.abs_tolerance)
+
+        try:
+            import numpy as np  # type: ignore
+        except ImportError:
+            return
+        xs = np.linspace(-0.1, 1.1, 1_001)
+        np.testing.assert_array_equal([discrete.membership(x) for x in xs],
+                                      discrete.membership_array(xs))
+
     def test_discrete_pairs(self) -> None:
         pairs = [fl.Discrete.Pair(*pair) for pair in [(1, 0), (3, 0), (5, 0), (2, 0), (4, 0)]]
         self.assertListEqual([(1, 0), (2, 0), (3, 0), (4, 0), (5, 0)],
@@ -1215,6 +1415,78 @@ class TestTerm(unittest.TestCase):
                               math.inf: 0.0,
                               -math.inf: 1.0}, height=0.5)
 
+    def test_lookup(self) -> None:
+        terms = [fl.Bell("bell", 0.5, 0.2, 3.0), fl.Concave("concave", 0.5, 0.8),
+                 fl.Cosine("cosine", 0.5, 0.6), fl.Gaussian("gaussian", 0.4, 0.1),
+                 fl.GaussianProduct("gaussianProduct", 0.3, 0.1, 0.6, 0.2),
+                 fl.Sigmoid("sigmoid", 0.5, 20.0), fl.SigmoidDifference("sigmoidDiff", 0.3, 20.0,
+                                                                        30.0, 0.7),
+                 fl.SigmoidProduct("sigmoidProd", 0.3, 20.0, -30.0, 0.7),
+                 fl.Spike("spike", 0.5, 0.4)]
+        self.assertEqual(fl.Lookup.TERMS, tuple(type(term) for term in terms))
+        for error in [1e-2, 1e-4]:
+            lookup = fl.Lookup(terms, -1.0, 1.0, error)
+            self.assertEqual(0, lookup.resolution & (lookup.resolution - 1))
+            self.assertTrue(all(term in lookup for term in terms))
+            memberships = lookup.memberships(0.123)
+            for term in terms:
+                self.assertEqual(lookup.membership(term, 0.123), memberships[term])
+                for i in range(10_001):
+                    x = -1.0 + i * 0.0002
+                    self.assertAlmostEqual(term.membership(x), lookup.membership(term, x),
+                                           delta=error, msg=f"{term.name} at x={x}")
+                # the membership functions are computed outside of the range
+                for x in [-1.5, 1.5, fl.inf, fl.nan]:
+                    self.assertEqual(str(term.membership(x)), str(lookup.membership(term, x)))
+        self.assertFalse(fl.Triangle("triangle") in lookup)
+
+        # the error is within the maximum also where the membership functions are not smooth
+        # between the values of the table
+        kinked = [fl.Spike("spike", 0.5123, 0.4), fl.Concave("concave", 0.5, 0.8123),
+                  fl.Cosine("cosine", 0.5123, 0.6), fl.Ramp("ramp", 0.1234, 0.5678),
+                  fl.Discrete("discrete", fl.Discrete.pairs_from([0.1234, 0.2, 0.5678, 0.9]))]
+        self.assertEqual([0.5123], fl.Lookup.breakpoints(kinked[0]))
+        for term in kinked:
+            approximation = fl.Lookup([term], 0.0, 1.0, 1e-2)
+            worst = max(math.fabs(term.membership(i / 20_000)
+                                  - approximation.membership(term, i / 20_000))
+                        for i in range(20_001))
+            self.assertLessEqual(worst, 1e-2, term.name)
+
+        with self.assertRaisesRegex(ValueError, re.escape(
+                "expected a finite range to approximate the terms, but found [0.0, inf]")):
+            fl.Lookup(terms, 0.0, fl.inf, 1e-3)
+        with self.assertRaisesRegex(ValueError, re.escape(
+                "expected a maximum error greater than zero, but found 0.0")):
+            fl.Lookup(terms, 0.0, 1.0, 0.0)
+        with self.assertRaisesRegex(ValueError, re.escape(
+                "expected finite membership function values to approximate term 'nan', "
+                "but found non-finite values")):
+            fl.Lookup([fl.Gaussian("nan")], 0.0, 1.0, 1e-3)
+        with self.assertRaisesRegex(ValueError, re.escape(
+                "expected to approximate the terms within an error of 1e-12 using at most "
+                "65536 intervals, but the error is ")):
+            fl.Lookup([fl.Spike("spike", 0.5, 0.4)], 0.0, 1.0, 1e-12)
+
+        try:
+            import numpy as np  # type: ignore
+        except ImportError:
+            return
+        xs = np.linspace(-1.5, 1.5, 1_001)
+        for term in terms:
+            expected = [lookup.membership(term, x) for x in xs]
+            obtained = lookup.membership_array(term, xs)
+            # the values are interpolated the same, and the membership functions outside of the
+            # range may differ in the last digit (see Term::membership_array)
+            inside = (-1.0 <= xs) & (xs <= 1.0)
+            np.testing.assert_array_equal(np.array(expected)[inside], obtained[inside])
+            np.testing.assert_allclose(expected, obtained, rtol=1e-15, atol=0.0)
+            # the error is within the maximum on a dense grid
+            dense = np.linspace(-1.0, 1.0, 1_000_001)
+            self.assertLessEqual(np.max(np.fabs(term.membership_array(dense)
+                                                - lookup.membership_array(term, dense))),
+                                 lookup.error, term.name)
+
     # @unittest.skip("division by zero not handled well by Python")
     def test_division_by_zero_fails_with_float(self) -> None:
         self.assertEqual(fl.lib.floating_point_type, float)
@@ -1366,6 +1638,146 @@ class TestFunction(unittest.TestCase):
             function_a.update_reference(engine_b)
             function_a.membership(0.0)
 
+    def test_function_evaluate_array(self) -> None:
+        import numpy as np  # type: ignore
+        values = [-2.0, -1.0, -0.5, 0.0, 0.3, 0.5, 1.0, 2.5, math.inf, -math.inf, math.nan]
+        a, b = (np.array(array) for array in zip(*[(x, y) for x in values for y in values]))
+        factory = fl.lib.factory_manager.function
+        formulas = [f"a {name} b" if element.arity == 2 else f"{name} a"
+                    for name, element in factory.operators().items()]
+        formulas += [f"{name}(a, b)" if element.arity == 2 else f"{name}(a)" if element.arity
+                     else f"{name}() + a" for name, element in factory.functions().items()]
+        formulas += ["2*a**3 + 2*b - 3", "max(a, b) - min(a, 1) + (a and b) * eq(a, 1.0)"]
+        # the functions of the comparisons and logical operators compute in double precision
+        formulas += ["exp(gt(a, 1))", "atan(gt(a, b))", "sin(lt(a, b)) + cos(!a)",
+                     "exp(a or b) + tanh(neq(a, b))", "sqrt(eq(a, b)) * log1p(ge(a, b))"]
+        # the integral functions result in zeros instead of negative zeros
+        formulas += ["atan2(ceil(a), ~1) + atan2(round(a), ~1) + atan2(floor(a * 0), ~1)"]
+        for formula in formulas:
+            function = fl.Function.create("f", formula)
+            obtained = function.evaluate_array({"a": a, "b": b})
+            self.assertEqual(float, obtained.dtype, formula)
+            expected = []
+            for x, y in zip(a, b):
+                try:
+                    expected.append(float(function.evaluate({"a": x, "b": y})))
+                except (ArithmeticError, ValueError, TypeError):
+                    # the errors result in infinity or nan
+                    expected.append(obtained[len(expected)])
+            # the functions in numpy may differ from those in math in the last digit
+            np.testing.assert_allclose(expected, obtained.astype(float), rtol=1e-15, atol=0.0,
+                                       err_msg=formula)
+
+        function = fl.Function.create("f", "x + y")
+        np.testing.assert_equal([[1.5, 2.5]], function.evaluate_array({"x": [[0.5, 1.5]],
+                                                                       "y": 1.0}))
+        self.assertEqual(2.0, fl.Function.create("f", "1 + 1").evaluate_array())
+        self.assertEqual(math.e, fl.Function.create("f", "exp(gt(1, 0))").evaluate_array())
+        np.testing.assert_equal([2.0, 2.0], fl.Function.create("f", "1 + 1").membership_array(
+            np.array([0.0, 1.0])))
+        with self.assertRaisesRegex(ValueError, re.escape(
+                "expected a map of variables containing the value for 'y', "
+                "but the map contains: {'x': array(1.)}")):
+            function.evaluate_array({"x": 1.0})
+        with self.assertRaisesRegex(RuntimeError, re.escape("function 'x + y' is not loaded")):
+            fl.Function("f", "x + y").evaluate_array({"x": 1.0, "y": 1.0})
+
+    def test_function_bindings(self) -> None:
+        inputs = [fl.InputVariable(f"i{index}") for index in range(30)]
+        engine = fl.Engine("engine", "", inputs, [fl.OutputVariable("o")])
+        function = fl.Function.create("f", "2*i3 + i7 - x + k", engine)
+        function.variables = {"k": 1.0}
+        inputs[3].value = 2.0
+        inputs[7].value = 3.0
+        self.assertEqual(7.5, function.membership(0.5))
+
+        # only the engine variables referenced by the formula are bound, and their values and the
+        # values of the function variables are read on every evaluation
+        self.assertEqual((("i7", inputs[7]), ("i3", inputs[3])), function._bindings[3])
+        inputs[3].value = 4.0
+        function.variables["k"] = 2.0
+        self.assertEqual(12.5, function.membership(0.5))
+
+        # the engine variables are bound again when the function is loaded again
+        inputs[7].name = "j7"
+        self.assertEqual(12.5, function.membership(0.5))
+        function.load()
+        with self.assertRaisesRegex(ValueError, re.escape(
+                "expected a map of variables containing the value for 'i7', but the map contains: "
+                "{'i0': nan, 'i1': nan, 'i2': nan, 'i3': 4.0")):
+            function.membership(0.5)
+        inputs[7].name = "i7"
+
+        # the conflicts are checked when the map of variables is replaced
+        function.variables = {"i7": 1.0}
+        with self.assertRaisesRegex(ValueError, re.escape(
+                "function variables cannot override engine variables, please resolve the name "
+                "ambiguity of the following variables: {'i7'}")):
+            function.membership(0.5)
+        function.variables = {"k": 1.0}
+
+        # the engine variables are bound to the variables of the cloned engine
+        inputs[0].terms.append(function)
+        clone = engine.clone()
+        cloned_function = clone.input_variables[0].terms[0]
+        self.assertIsNot(function, cloned_function)
+        clone.input_variables[3].value = 0.0
+        self.assertEqual(11.5, function.membership(0.5))
+        self.assertEqual(3.5, cloned_function.membership(0.5))
+
+    def test_function_compile_folds_and_eliminates(self) -> None:
+        calls = []
+
+        def count(value: float) -> float:
+            calls.append(value)
+            return 2.0 * value
+
+        counter = fl.Function.Element("count", "Count", fl.Function.Element.Type.Function,
+                                      count, arity=1)
+        addition = fl.lib.factory_manager.function.objects["+"]
+        # count(3) + (count(a) + count(a))
+        function = fl.Function("f", "count(3) + (count(a) + count(a))")
+        function.root = fl.Function.Node(addition, left=fl.Function.Node(
+            counter, right=fl.Function.Node(constant=3.0)), right=fl.Function.Node(
+            addition, left=fl.Function.Node(counter, right=fl.Function.Node(variable="a")),
+            right=fl.Function.Node(counter, right=fl.Function.Node(variable="a"))))
+        postfix = function.root.postfix()
+
+        # the constant subtree is computed when compiling
+        function.compile()
+        self.assertTrue(function.is_compiled())
+        self.assertEqual([3.0], calls)
+
+        # the repeated subtree is computed once per evaluation
+        calls.clear()
+        self.assertEqual(14.0, function.evaluate({"a": 2.0}))
+        self.assertEqual([2.0], calls)
+
+        # the tree walks every node
+        calls.clear()
+        self.assertEqual(14.0, function.root.evaluate({"a": 2.0}))
+        self.assertEqual([3.0, 2.0, 2.0], calls)
+
+        # the tree is not modified
+        self.assertEqual(postfix, function.root.postfix())
+        self.assertEqual("3.000 count a count a count + +", postfix)
+
+        # the constant subtrees are computed with their types, including the elements of arity 0
+        self.assertEqual(3, fl.Function.create("f", "round(2.5) + round(0.6)").evaluate())
+        self.assertIsInstance(fl.Function.create("f", "round(2.5)").evaluate(), int)
+        self.assertEqual(math.pi / 180.0, fl.Function.create("f", "pi() / 180").evaluate())
+
+        # the constant subtrees that fail are evaluated as usual
+        with self.assertRaises(ZeroDivisionError):
+            fl.Function.create("f", "a + 1 / 0").evaluate({"a": 1.0})
+
+        # the comparisons depend on the absolute tolerance at the time of evaluation
+        from unittest.mock import patch
+        comparison = fl.Function.create("f", "eq(1, 1.05) + (1 and 1.05)")
+        self.assertEqual(0.0, comparison.evaluate())
+        with patch.object(fl.lib, "abs_tolerance", 0.1):
+            self.assertEqual(2.0, comparison.evaluate())
+
     def test_element(self) -> None:
         element = fl.Function.Element("function", "math function()",  # type: ignore
                                       fl.Function.Element.Type.Function, None, 0, 0,
@@ -1567,6 +1979,79 @@ class TestFunction(unittest.TestCase):
         for infix, postfix in infix_postfix.items():
             self.assertEqual(postfix, fl.Function.parse(infix).postfix())
 
+        # the elements are shared with the factory
+        root = fl.Function.parse("sin(a) + b")
+        factory = fl.lib.factory_manager.function
+        self.assertIs(factory.objects["+"], root.element)
+        self.assertIs(factory.objects["sin"], root.left.element)  # type: ignore
+
+    def test_function_compile(self) -> None:
+        formulas = ["a+b", "a+b*2^3/(4 - 2)*sin(pi/4)", "~a*~b", "a % b - b ** 2", "!a + ~b",
+                    "max(a, b) - min(a, 1)", "gt(a, b) + le(a, b) * eq(a, a) + neq(a, b)",
+                    "a and b or a", "(a and b) + (0 or b)", "pi() * e + abs(a) - exp(b)",
+                    "a / b", "fmod(a, b) + pow(a, 2)", ".-a + .+b", "3.5",
+                    "log(a) + sqrt(a * b) * sqrt(a * b) - 1 / b",
+                    "sqrt(b) - log(a) / (sqrt(b) + 1 % 0) + 2 * pi() / 360"]
+        values = [-1.5, -0.5, 0.0, 0.5, 2.0, math.inf, -math.inf, math.nan]
+        for formula in formulas:
+            compiled = fl.Function.create("f", formula)
+            walked = fl.Function("f", formula)
+            walked.load(compiled=False)
+            self.assertTrue(compiled.is_compiled(), formula)
+            self.assertFalse(walked.is_compiled(), formula)
+            for a in values:
+                for b in values:
+                    variables = {"a": a, "b": b}
+                    try:
+                        expected = repr(walked.evaluate(variables))
+                    except Exception as error:
+                        expected = repr(error)
+                    try:
+                        obtained = repr(compiled.evaluate(variables))
+                    except Exception as error:
+                        obtained = repr(error)
+                    self.assertEqual(expected, obtained, f"{formula} with {variables}")
+
+        function = fl.Function.create("f", "a + b")
+        for variables in [None, {}, {"a": 1.0}]:
+            with self.assertRaisesRegex(ValueError, re.escape(
+                    "expected a map of variables containing the value for ")):
+                function.evaluate(variables)
+
+        # formulas nested deeper than the parentheses allowed in Python are compiled
+        deep = fl.Function.create("f", "a" + " + 1" * 250)
+        self.assertTrue(deep.is_compiled())
+        self.assertEqual(251.0, deep.evaluate({"a": 1.0}))
+
+        # trees that cannot be compiled are walked
+        invalid = fl.Function("f", "max(a, b, c)")
+        invalid.root = fl.Function.Node(fl.Function.Element(
+            "max", "Maximum", fl.Function.Element.Type.Function, max, arity=3))
+        invalid.compile()
+        self.assertFalse(invalid.is_compiled())
+        self.assertTrue(math.isnan(invalid.evaluate()))
+
+        # the compiled function is replaced when the formula is loaded again
+        function.formula = "a - b"
+        self.assertEqual(3.0, function.evaluate({"a": 1.0, "b": 2.0}))
+        function.load()
+        self.assertTrue(function.is_compiled())
+        self.assertEqual(-1.0, function.evaluate({"a": 1.0, "b": 2.0}))
+        function.unload()
+        self.assertFalse(function.is_compiled())
+        with self.assertRaisesRegex(RuntimeError, re.escape("function 'a - b' is not loaded")):
+            function.compile()
+
+        # copies and pickles are compiled
+        function.load()
+        copied = copy.copy(function)
+        self.assertIs(function.root, copied.root)
+        self.assertTrue(copied.is_compiled())
+        pickled = pickle.loads(pickle.dumps(function))
+        self.assertTrue(pickled.is_compiled())
+        self.assertEqual(function.formula, pickled.formula)
+        self.assertEqual(-1.0, pickled.evaluate({"a": 1.0, "b": 2.0}))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,75 @@
+"""
+ pyfuzzylite (TM), a fuzzy logic control library in Python.
+ Copyright (C) 2010-2017 FuzzyLite Limited. All rights reserved.
+ Author: Juan Rada-Vilela, Ph.D. <jcrada@fuzzylite.com>
+
+ This file is part of pyfuzzylite.
+
+ pyfuzzylite is free software: you can redistribute it and/or modify it under
+ the terms of the FuzzyLite License included with the software.
+
+ You should have received a copy of the FuzzyLite License along with
+ pyfuzzylite. If not, see <http://www.fuzzylite.com/license/>.
+
+ pyfuzzylite is a trademark of FuzzyLite Limited
+ fuzzylite is a registered trademark of FuzzyLite Limited.
+"""
+
+import unittest
+
+import fuzzylite as fl
+
+
+class TestTracer(unittest.TestCase):
+
+    def tearDown(self) -> None:
+        fl.lib.tracer = None
+
+    def test_disabled_by_default(self) -> None:
+        self.assertEqual(fl.lib.tracer, None)
+        self.assertEqual(fl.lib.tracing, False)
+
+    def test_trace_memberships(self) -> None:
+        low = fl.Activated(fl.Triangle("low", 0.0, 0.25, 0.5), 0.5, fl.Minimum())
+        high = fl.Activated(fl.Triangle("high", 0.5, 0.75, 1.0), 1.0, fl.Minimum())
+        aggregated = fl.Aggregated("output", 0.0, 1.0, fl.Maximum(), [low, high])
+
+        tracer = fl.Tracer(sampling=5)
+        fl.lib.tracer = tracer
+        self.assertEqual(fl.lib.tracer, tracer)
+        self.assertEqual(fl.lib.tracing, True)
+
+        fl.Centroid(10).defuzzify(aggregated, 0.0, 1.0)
+        self.assertEqual({aggregated: 10, low: 10, high: 10}, tracer.counts)
+        self.assertEqual([(low, 0.45, 0.19999999999999996),
+                          (high, 0.45, 0.0),
+                          (aggregated, 0.45, 0.19999999999999996),
+                          (low, 0.9500000000000001, 0.0),
+                          (high, 0.9500000000000001, 0.19999999999999973),
+                          (aggregated, 0.9500000000000001, 0.19999999999999973)], tracer.samples)
+        self.assertEqual(str(tracer), "\n".join([
+            "10: term: _ Activated Minimum(0.500,low)",
+            "10: term: _ Activated Minimum(1.000,high)",
+            "10: term: output Aggregated Maximum[Minimum(0.500,low),Minimum(1.000,high)]"]))
+
+        tracer.clear()
+        self.assertEqual({}, tracer.counts)
+        self.assertEqual([], tracer.samples)
+
+        fl.lib.tracer = None
+        fl.Centroid(10).defuzzify(aggregated, 0.0, 1.0)
+        self.assertEqual({}, tracer.counts)
+
+    def test_max_samples(self) -> None:
+        activated = fl.Activated(fl.Triangle("low", 0.0, 0.25, 0.5), 0.5, fl.Minimum())
+        tracer = fl.Tracer(sampling=1, max_samples=3)
+        fl.lib.tracer = tracer
+        for x in range(10):
+            activated.membership(x / 10)
+        self.assertEqual({activated: 10}, tracer.counts)
+        self.assertEqual([(activated, 0.0, 0.0), (activated, 0.1, 0.4), (activated, 0.2, 0.5)],
+                         tracer.samples)
+
+
+if __name__ == '__main__':
+    unittest.main()
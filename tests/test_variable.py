@@ -17,7 +17,8 @@
 
 import math
 import unittest
-from typing import Dict, Optional, Sequence, Tuple
+import unittest.mock
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import fuzzylite as fl
 from tests.assert_component import BaseAssert
@@ -201,6 +202,72 @@ class TestInputVariable(unittest.TestCase):
                            -math.inf: "0.000/Low + 0.000/Medium + 0.000/High",
                            })
 
+    def test_membership(self) -> None:
+        low = fl.Triangle('Low', -1.0, -1.0, 0.0)
+        high = fl.Triangle('High', 0.0, 1.0, 1.0)
+        variable = fl.InputVariable(name="name", minimum=-1.0, maximum=1.0, terms=[low, high])
+        variable.value = -0.25
+        self.assertEqual(variable.fuzzification, None)
+        self.assertEqual(variable.membership(low), 0.25)
+        self.assertEqual(variable.membership(high), 0.0)
+
+        # the fuzzification table stores the membership function values
+        variable.fuzzification = {}
+        self.assertEqual(variable.membership(low), 0.25)
+        self.assertEqual(variable.fuzzification, {low: 0.25})
+        variable.value = 0.5
+        self.assertEqual(variable.membership(low), 0.25)
+        self.assertEqual(variable.membership(high), 0.5)
+        self.assertEqual(variable.fuzzification, {low: 0.25, high: 0.5})
+
+        variable.fuzzification = None
+        self.assertEqual(variable.membership(low), 0.0)
+
+    def test_approximate(self) -> None:
+        low = fl.Triangle('Low', -1.0, -1.0, 0.0)
+        medium = fl.Gaussian('Medium', 0.0, 0.25)
+        high = fl.Sigmoid('High', 0.5, 10.0)
+        variable = fl.InputVariable(name="name", minimum=-1.0, maximum=1.0,
+                                    terms=[low, medium, high])
+        variable.approximate(1e-4)
+        lookup = variable.lookup
+        assert lookup
+        self.assertEqual([medium, high], lookup.terms)
+        self.assertEqual((-1.0, 1.0, 1e-4), (lookup.minimum, lookup.maximum, lookup.error))
+
+        variable.value = 0.3
+        self.assertEqual(lookup.membership(medium, 0.3), variable.membership(medium))
+        self.assertNotEqual(medium.membership(0.3), variable.membership(medium))
+        self.assertAlmostEqual(medium.membership(0.3), variable.membership(medium), delta=1e-4)
+        self.assertEqual(low.membership(0.3), variable.membership(low))
+
+        # the approximated terms are interpolated at once into the fuzzification table
+        variable.fuzzification = {}
+        self.assertEqual(lookup.membership(high, 0.3), variable.membership(high))
+        self.assertEqual(lookup.memberships(0.3), variable.fuzzification)
+        variable.fuzzification = None
+
+        variable.approximate(1e-2, terms=[high])
+        assert variable.lookup
+        self.assertEqual([high], variable.lookup.terms)
+        self.assertEqual(medium.membership(0.3), variable.membership(medium))
+        variable.approximate(None)
+        self.assertIsNone(variable.lookup)
+        self.assertEqual(high.membership(0.3), variable.membership(high))
+
+        engine = fl.Engine(input_variables=[variable])
+        engine.approximate(1e-3)
+        self.assertIs(variable.lookup, engine.clone().input_variables[0].lookup)
+        try:
+            import numpy as np  # type: ignore
+        except ImportError:
+            return
+        lookup = variable.lookup
+        assert lookup
+        variable.value = np.array([-1.0, -0.5, 0.3, 0.9, 1.0])
+        np.testing.assert_array_equal([lookup.membership(medium, x) for x in variable.value],
+                                      variable.membership_array(medium))
+
 
 class OutputVariableAssert(BaseAssert[fl.OutputVariable]):
 
@@ -375,6 +442,149 @@ class TestOutputVariable(unittest.TestCase):
         self.assertEqual(variable.previous_value, 0.5)
         self.assertEqual(variable.value, 0.6)
 
+    def test_defuzzify_tabulated(self) -> None:
+        class Counted(fl.Triangle):
+            """Triangle that is not tabulated as its class is not among the tabulated ones"""
+            evaluations = 0
+
+            def membership(self, x: float) -> float:
+                Counted.evaluations += 1
+                return super().membership(x)
+
+        gaussian = fl.Gaussian('A', 0.2, 0.1)
+        discrete = fl.Discrete('C', fl.Discrete.pairs_from([0.4, 0.0, 0.6, 1.0, 0.8, 0.0]))
+        variable = fl.OutputVariable(name="name", minimum=0.0, maximum=1.0,
+                                     aggregation=fl.AlgebraicSum(), defuzzifier=fl.Centroid(),
+                                     terms=[gaussian, fl.Bell('B', 0.5, 0.2, 3.0), discrete,
+                                            Counted('D', 0.7, 0.9, 1.1)])
+        activated = [(0.6, fl.Minimum()), (0.3, fl.AlgebraicProduct()), (0.8, fl.Minimum()),
+                     (0.5, fl.HamacherProduct()), (0.4, fl.Minimum())]
+
+        def defuzzify(tabulate: bool) -> float:
+            variable.tabulate = tabulate
+            variable.fuzzy.terms = [fl.Activated(term, degree, implication) for
+                                    term, (degree, implication) in zip(variable.terms, activated)]
+            variable.defuzzify()
+            del variable.tabulate
+            return variable.value
+
+        for defuzzifier in [fl.Bisector(), fl.Centroid(), fl.LargestOfMaximum(),
+                            fl.MeanOfMaximum(), fl.SmallestOfMaximum()]:
+            variable.defuzzifier = defuzzifier
+            self.assertEqual(defuzzify(False), defuzzify(True), defuzzifier.class_name)
+        self.assertIsInstance(variable.tabulated(), fl.OutputVariable.Samples)
+        self.assertEqual(3, len(variable.table()[1]))
+
+        # the tabulated terms are not evaluated again, unlike the other terms
+        variable.defuzzifier = fl.Centroid()
+        table = variable.table()
+        Counted.evaluations = 0
+        with unittest.mock.patch.object(fl.Gaussian, 'membership', side_effect=AssertionError):
+            defuzzify(True)
+        self.assertIs(table, variable.table())
+        self.assertEqual(100, Counted.evaluations)
+
+        # the table is computed again when the terms, range or defuzzifier change
+        expected = defuzzify(False)
+        for change in [lambda: setattr(gaussian, 'mean', 0.25),
+                       lambda: discrete.xy.__setitem__(1, fl.Discrete.Pair(0.55, 1.0)),
+                       lambda: setattr(variable, 'maximum', 0.9),
+                       lambda: setattr(variable.defuzzifier, 'resolution', 150),
+                       lambda: setattr(variable, 'defuzzifier', fl.Bisector(150)),
+                       lambda: variable.terms.append(fl.Ramp('E', 0.5, 1.0))]:
+            change()
+            self.assertIsNot(table, variable.table())
+            self.assertNotEqual(expected, defuzzify(True))
+            self.assertEqual(defuzzify(False), defuzzify(True))
+            table, expected = variable.table(), defuzzify(True)
+
+        # the table is not computed again for terms with nan parameters, nor when processing
+        variable.terms.append(fl.Ramp('F', fl.nan, 1.0))
+        table = variable.table()
+        self.assertIs(table, variable.table())
+        samples = variable.tabulated()
+        defuzzify(True)
+        self.assertIs(table, variable.table())
+        self.assertIs(samples, variable.tabulated())
+        variable.terms.pop()
+
+        # the fuzzy output is defuzzified as is when it cannot be tabulated
+        variable.defuzzifier.exact = True  # type: ignore
+        self.assertIs(variable.fuzzy, variable.tabulated())
+        del variable.defuzzifier.exact  # type: ignore
+        variable.fuzzy.terms.append(fl.Activated(gaussian))
+        self.assertIs(variable.fuzzy, variable.tabulated())
+        variable.fuzzy.terms.pop()
+        fl.lib.tracer = fl.Tracer()
+        try:
+            self.assertIs(variable.fuzzy, variable.tabulated())
+        finally:
+            fl.lib.tracer = None
+
+    def test_compacts(self) -> None:
+        engine = fl.FllImporter().from_string("""\
+Engine: grid
+InputVariable: A
+  range: 0.000 1.000
+  term: low Triangle -0.500 0.000 0.500
+  term: medium Triangle 0.000 0.500 1.000
+  term: high Triangle 0.500 1.000 1.500
+InputVariable: B
+  range: 0.000 1.000
+  term: low Triangle -0.500 0.000 0.500
+  term: medium Triangle 0.000 0.500 1.000
+  term: high Triangle 0.500 1.000 1.500
+OutputVariable: Z
+  range: 0.000 1.000
+  aggregation: Maximum
+  defuzzifier: Centroid 100
+  default: nan
+  term: low Gaussian 0.000 0.200
+  term: medium Bell 0.500 0.200 2.000
+  term: high Gaussian 1.000 0.200
+RuleBlock: rules
+  conjunction: Minimum
+  disjunction: Maximum
+  implication: AlgebraicProduct
+  activation: General
+  rule: if A is low or B is low then Z is low
+  rule: if A is low or B is medium then Z is low
+  rule: if A is low or B is high then Z is medium
+  rule: if A is medium or B is low then Z is low
+  rule: if A is medium or B is medium then Z is medium
+  rule: if A is medium or B is high then Z is high
+  rule: if A is high or B is low then Z is medium
+  rule: if A is high or B is medium then Z is high
+  rule: if A is high or B is high then Z is high
+""")
+        variable = engine.output_variable("Z")
+        inputs = [(a / 4, b / 4) for a in range(5) for b in range(5)]
+
+        def process(compact: bool) -> List[Tuple[float, str, int]]:
+            variable.compact = compact
+            result = []
+            for a, b in inputs:
+                engine.input_variable("A").value = a
+                engine.input_variable("B").value = b
+                engine.process()
+                result.append((variable.value, variable.fuzzy_value(), len(variable.fuzzy.terms)))
+            del variable.compact
+            return result
+
+        # the activated terms of the same term are compacted with integral defuzzifiers only
+        for defuzzifier in [fl.Bisector(), fl.Centroid(), fl.MeanOfMaximum(),
+                            fl.WeightedAverage("Automatic")]:
+            variable.defuzzifier = defuzzifier
+            compacts = not isinstance(defuzzifier, fl.WeightedDefuzzifier)
+            self.assertEqual(compacts, variable.compacts())
+            expected, obtained = process(False), process(True)
+            self.assertEqual([(value, fuzzy_value) for value, fuzzy_value, _ in expected],
+                             [(value, fuzzy_value) for value, fuzzy_value, _ in obtained])
+            self.assertEqual(compacts, any(compacted < terms for (_, _, terms), (_, _, compacted)
+                                           in zip(expected, obtained)))
+            if compacts:
+                self.assertTrue(all(terms <= 3 for _, _, terms in obtained))
+
 
 if __name__ == '__main__':
     unittest.main()